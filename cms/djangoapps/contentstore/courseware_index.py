@@ -2,11 +2,14 @@
 from __future__ import absolute_import
 from abc import ABCMeta, abstractmethod
 from datetime import timedelta
+import hashlib
+import json
 import logging
 import re
 from six import add_metaclass
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import ugettext_lazy, ugettext as _
 from django.core.urlresolvers import resolve
 
@@ -26,6 +29,18 @@ from xmodule.library_tools import normalize_key_for_search
 # how far back from the trigger point to look back in order to index
 REINDEX_AGE = timedelta(0, 60)  # 60 seconds
 
+# The number of documents sent to the search engine in each request
+INDEX_BATCH_SIZE = 100
+
+# How long the digests of the documents last indexed for a course or library
+# are remembered for, in seconds. When they have been forgotten, the next
+# index update sends all of the documents it prepares.
+INDEX_MANIFEST_TIMEOUT = 7 * 24 * 60 * 60
+
+# How long past its delay a scheduled index update is waited for, in seconds,
+# before further triggers schedule another (in case the update was lost)
+INDEX_UPDATE_SCHEDULED_TIMEOUT = 5 * 60
+
 log = logging.getLogger('edx.modulestore')
 
 
@@ -99,6 +114,72 @@ class SearchIndexerBase(object):
         """ Modifies usage_id to submit to index """
         return usage_id
 
+    @classmethod
+    def _index_manifest_cache_key(cls, structure_key):
+        """ The cache key of the digests of the documents last indexed for the structure """
+        return u"{}.manifest.{}".format(cls.INDEX_NAME, structure_key)
+
+    @classmethod
+    def _get_index_manifest(cls, searcher, structure_key):
+        """
+        Returns a dict of the digests of the documents last indexed for the
+        structure, keyed by the documents' ids, or None if they aren't known.
+
+        If the search index doesn't hold as many of the structure's documents
+        as were last indexed, (for instance, because the index has been
+        rebuilt), the digests are ignored.
+        """
+        manifest = cache.get(cls._index_manifest_cache_key(structure_key))
+        if manifest is not None:
+            response = searcher.search(
+                doc_type=cls.DOCUMENT_TYPE,
+                field_dictionary=cls._get_location_info(structure_key),
+                size=0,
+            )
+            if response["total"] != len(manifest):
+                manifest = None
+        return manifest
+
+    @classmethod
+    def _set_index_manifest(cls, structure_key, manifest):
+        """ Remembers the digests of the documents indexed for the structure """
+        cache.set(cls._index_manifest_cache_key(structure_key), manifest, INDEX_MANIFEST_TIMEOUT)
+
+    @staticmethod
+    def _document_digest(item_index):
+        """ Returns a digest of the contents of an index document """
+        return hashlib.md5(json.dumps(item_index, sort_keys=True, default=unicode)).hexdigest()
+
+    @classmethod
+    def _index_update_scheduled_cache_key(cls, structure_key):
+        """ The cache key which marks that an update of the structure's index has been scheduled """
+        return u"{}.update_scheduled.{}".format(cls.INDEX_NAME, structure_key)
+
+    @classmethod
+    def schedule_index_update(cls, structure_key, triggered_at):
+        """
+        Marks that an update of the structure's index, triggered at
+        triggered_at, has been scheduled, so that bursts of triggers can be
+        coalesced into a single update.
+
+        Returns:
+        True if an update hasn't already been scheduled (and so the caller
+        should schedule one), or False if it has
+        """
+        return cache.add(
+            cls._index_update_scheduled_cache_key(structure_key),
+            triggered_at,
+            settings.SEARCH_INDEX_UPDATE_DELAY + INDEX_UPDATE_SCHEDULED_TIMEOUT,
+        )
+
+    @classmethod
+    def clear_scheduled_index_update(cls, structure_key):
+        """
+        Marks that the scheduled update of the structure's index has started,
+        so that any later triggers schedule another update.
+        """
+        cache.delete(cls._index_update_scheduled_cache_key(structure_key))
+
     @classmethod
     def remove_deleted_items(cls, searcher, structure_key, exclude_items):
         """
@@ -128,7 +209,10 @@ class SearchIndexerBase(object):
             (within REINDEX_AGE above ^^) will have their index updated, others skip
             updating their index but are still walked through in order to identify
             which items may need to be removed from the index
-            If None, then a full reindex takes place
+            If None, then a full reindex takes place.
+            Otherwise, only the documents which have changed since they were
+            last indexed are sent to the search engine (if the digests of the
+            documents last indexed are known)
 
         Returns:
         Number of items that have been added to the index
@@ -157,6 +241,16 @@ class SearchIndexerBase(object):
         # instead of per item index API call.
         items_index = []
 
+        # For an index update, the digests of the documents last indexed, so
+        # that only the documents which have changed since are sent to the
+        # search engine, and the documents of deleted items can be removed
+        # without searching for them
+        previous_manifest = None
+
+        # manifest holds the digest of each document which is to remain in the
+        # index (or None, if it's unknown)
+        manifest = {}
+
         def get_item_location(item):
             """
             Gets the version agnostic item location
@@ -225,7 +319,11 @@ class SearchIndexerBase(object):
                 if None in children_groups_usage:
                     item_content_groups = None
 
-            if skip_index or not item_index_dictionary:
+            if not item_index_dictionary:
+                return
+
+            if skip_index:
+                manifest[item_id] = previous_manifest.get(item_id) if previous_manifest else None
                 return
 
             item_index = {}
@@ -238,15 +336,25 @@ class SearchIndexerBase(object):
                     item_index['start_date'] = item.start
                 item_index['content_groups'] = item_content_groups if item_content_groups else None
                 item_index.update(cls.supplemental_fields(item))
-                items_index.append(item_index)
+                manifest[item_id] = cls._document_digest(item_index)
+                if previous_manifest is None or previous_manifest.get(item_id) != manifest[item_id]:
+                    items_index.append(item_index)
                 indexed_count["count"] += 1
                 return item_content_groups
             except Exception as err:  # pylint: disable=broad-except
                 # broad exception so that index operation does not fail on one item of many
                 log.warning('Could not index item: %s - %r', item.location, err)
                 error_list.append(_('Could not index item: {}').format(item.location))
+                # the item still exists, so keep its previous document rather than treating it as deleted
+                if previous_manifest and item_id in previous_manifest:
+                    manifest[item_id] = previous_manifest[item_id]
+                else:
+                    manifest.pop(item_id, None)
 
         try:
+            if triggered_at is not None:
+                previous_manifest = cls._get_index_manifest(searcher, structure_key)
+
             with modulestore.branch_setting(ModuleStoreEnum.RevisionOption.published_only):
                 structure = cls._fetch_top_level(modulestore, structure_key)
                 groups_usage_info = cls.fetch_group_usage(modulestore, structure)
@@ -257,8 +365,16 @@ class SearchIndexerBase(object):
                 # Now index the content
                 for item in structure.get_children():
                     prepare_item_index(item, groups_usage_info=groups_usage_info)
-                searcher.index(cls.DOCUMENT_TYPE, items_index)
-                cls.remove_deleted_items(searcher, structure_key, indexed_items)
+                for index in xrange(0, len(items_index), INDEX_BATCH_SIZE):
+                    searcher.index(cls.DOCUMENT_TYPE, items_index[index:index + INDEX_BATCH_SIZE])
+                if previous_manifest is None:
+                    cls.remove_deleted_items(searcher, structure_key, indexed_items)
+                else:
+                    deleted_items = set(previous_manifest) - set(manifest)
+                    if deleted_items:
+                        searcher.remove(cls.DOCUMENT_TYPE, list(deleted_items))
+                if not error_list:
+                    cls._set_index_manifest(structure_key, manifest)
         except Exception as err:  # pylint: disable=broad-except
             # broad exception so that index operation does not prevent the rest of the application from working
             log.exception(
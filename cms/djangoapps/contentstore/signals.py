@@ -3,6 +3,7 @@
 from datetime import datetime
 from pytz import UTC
 
+from django.conf import settings
 from django.dispatch import receiver
 
 from xmodule.modulestore.django import SignalHandler
@@ -11,6 +12,17 @@ from contentstore.proctoring import register_special_exams
 from openedx.core.djangoapps.credit.signals import on_course_publish
 
 
+def _schedule_index_update(indexer, task, structure_key):
+    """
+    Schedules the task to update the search index of the course or library,
+    unless an update has already been scheduled, which will include this
+    change too
+    """
+    triggered_time = datetime.now(UTC).isoformat()
+    if indexer.schedule_index_update(structure_key, triggered_time):
+        task.apply_async((unicode(structure_key), triggered_time), countdown=settings.SEARCH_INDEX_UPDATE_DELAY)
+
+
 @receiver(SignalHandler.course_published)
 def listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=unused-argument
     """
@@ -34,7 +46,7 @@ def listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=
         # import here, because signal is registered at startup, but items in tasks are not yet able to be loaded
         from .tasks import update_search_index
 
-        update_search_index.delay(unicode(course_key), datetime.now(UTC).isoformat())
+        _schedule_index_update(CoursewareSearchIndexer, update_search_index, course_key)
 
 
 @receiver(SignalHandler.library_updated)
@@ -47,4 +59,4 @@ def listen_for_library_update(sender, library_key, **kwargs):  # pylint: disable
         # import here, because signal is registered at startup, but items in tasks are not yet able to be loaded
         from .tasks import update_library_index
 
-        update_library_index.delay(unicode(library_key), datetime.now(UTC).isoformat())
+        _schedule_index_update(LibrarySearchIndexer, update_library_index, library_key)
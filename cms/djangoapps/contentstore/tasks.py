@@ -96,6 +96,8 @@ def update_search_index(course_id, triggered_time_isoformat):
     """ Updates course search index. """
     try:
         course_key = CourseKey.from_string(course_id)
+        # Any publishes from now on need another update
+        CoursewareSearchIndexer.clear_scheduled_index_update(course_key)
         CoursewareSearchIndexer.index(modulestore(), course_key, triggered_at=(_parse_time(triggered_time_isoformat)))
 
     except SearchIndexingError as exc:
@@ -109,6 +111,8 @@ def update_library_index(library_id, triggered_time_isoformat):
     """ Updates course search index. """
     try:
         library_key = CourseKey.from_string(library_id)
+        # Any updates from now on need another index update
+        LibrarySearchIndexer.clear_scheduled_index_update(library_key)
         LibrarySearchIndexer.index(modulestore(), library_key, triggered_at=(_parse_time(triggered_time_isoformat)))
 
     except SearchIndexingError as exc:
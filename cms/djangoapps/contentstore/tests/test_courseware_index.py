@@ -471,6 +471,56 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
         indexed_count = self.reindex_course(store)
         self.assertEqual(indexed_count, 7)
 
+    def _test_index_recent_changes_sends_changed_documents(self, store):  # pylint: disable=invalid-name
+        """ Make sure that a time based request to index only sends the documents which have changed """
+        self.publish_item(store, self.vertical.location)
+        self.reindex_course(store)
+        since_time = datetime(2015, 1, 1, tzinfo=UTC)
+
+        with patch(settings.SEARCH_ENGINE + '.index') as mock_index:
+            self.assertEqual(self.index_recent_changes(store, since_time), 4)
+            self.assertFalse(mock_index.called)
+
+        html_unit = store.get_item(self.html_unit.location)
+        html_unit.display_name = "Changed Html Content"
+        self.update_item(store, html_unit)
+        self.publish_item(store, self.vertical.location)
+        with patch(settings.SEARCH_ENGINE + '.index') as mock_index:
+            self.assertEqual(self.index_recent_changes(store, since_time), 4)
+            args, __ = mock_index.call_args
+            self.assertEqual([item["content"]["display_name"] for item in args[1]], ["Changed Html Content"])
+
+        # deleted items are removed from the index
+        self.delete_item(store, self.html_unit.location)
+        self.publish_item(store, self.vertical.location)
+        self.assertEqual(self.index_recent_changes(store, since_time), 3)
+        self.assertEqual(self.search()["total"], 3)
+
+    def _test_index_recent_changes_keeps_failed_items(self, store):  # pylint: disable=invalid-name
+        """ Make sure that an item which can't be indexed during a time based request isn't removed from the index """
+        self.publish_item(store, self.vertical.location)
+        self.reindex_course(store)
+        since_time = datetime(2015, 1, 1, tzinfo=UTC)
+        self.assertEqual(self.search()["total"], 4)
+
+        html_location = self.html_unit.location
+        supplemental_fields = CoursewareSearchIndexer.supplemental_fields
+
+        def failing_supplemental_fields(item):
+            """ Fail to build the document of the html unit """
+            if item.location.block_id == html_location.block_id:
+                raise ValueError("Can't index this")
+            return supplemental_fields(item)
+
+        html_unit = store.get_item(html_location)
+        html_unit.display_name = "Changed Html Content"
+        self.update_item(store, html_unit)
+        self.publish_item(store, self.vertical.location)
+        with patch.object(CoursewareSearchIndexer, 'supplemental_fields', side_effect=failing_supplemental_fields):
+            with self.assertRaises(SearchIndexingError):
+                self.index_recent_changes(store, since_time)
+        self.assertEqual(self.search()["total"], 4)
+
     def _test_course_about_property_index(self, store):
         """ Test that informational properties in the course object end up in the course_info index """
         display_name = "Help, I need somebody!"
@@ -599,6 +649,14 @@ class TestCoursewareSearchIndexer(MixedWithOptionsTestCase):
     def test_time_based_index(self, store_type):
         self._perform_test_using_store(store_type, self._test_time_based_index)
 
+    @ddt.data(*WORKS_WITH_STORES)
+    def test_index_recent_changes_sends_changed_documents(self, store_type):
+        self._perform_test_using_store(store_type, self._test_index_recent_changes_sends_changed_documents)
+
+    @ddt.data(*WORKS_WITH_STORES)
+    def test_index_recent_changes_keeps_failed_items(self, store_type):
+        self._perform_test_using_store(store_type, self._test_index_recent_changes_keeps_failed_items)
+
     @ddt.data(*WORKS_WITH_STORES)
     def test_exception(self, store_type):
         self._perform_test_using_store(store_type, self._test_exception)
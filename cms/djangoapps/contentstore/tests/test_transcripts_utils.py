@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """ Tests for transcripts_utils. """
+import json
 import unittest
 from uuid import uuid4
 import copy
@@ -8,11 +9,13 @@ from mock import patch, Mock
 
 from django.test.utils import override_settings
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import translation
 
 from nose.plugins.skip import SkipTest
 
 from xmodule.modulestore.tests.factories import CourseFactory
+from xmodule.contentstore import asset_index
 from xmodule.contentstore.content import StaticContent
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 from xmodule.exceptions import NotFoundError
@@ -607,6 +610,82 @@ class TestTranscript(unittest.TestCase):
             transcripts_utils.Transcript.convert(self.srt_transcript, 'srt', 'sjson')
 
 
+class TestTranscriptAssetIndex(ModuleStoreTestCase):
+    """
+    Tests for the lookups of transcript assets in the course's asset index.
+    """
+    def setUp(self):
+        super(TestTranscriptAssetIndex, self).setUp()
+        self.course = CourseFactory.create()
+        self.subs = {'start': [100], 'end': [200], 'text': ['subs #1']}
+        self.subs_id = str(uuid4())
+        self.filename = transcripts_utils.subs_filename(self.subs_id)
+
+    def test_asset_exists(self):
+        self.assertFalse(transcripts_utils.Transcript.asset_exists(self.course.location, self.filename))
+        transcripts_utils.save_subs_to_store(self.subs, self.subs_id, self.course)
+        self.assertTrue(transcripts_utils.Transcript.asset_exists(self.course.location, self.filename))
+        transcripts_utils.remove_subs_from_store(self.subs_id, self.course)
+        self.assertFalse(transcripts_utils.Transcript.asset_exists(self.course.location, self.filename))
+
+    def test_converted_transcripts_cached(self):
+        transcripts_utils.save_subs_to_store(self.subs, self.subs_id, self.course)
+        expected = transcripts_utils.generate_srt_from_sjson(self.subs, 1.0)
+        self.assertEqual(
+            transcripts_utils.Transcript.get_converted(self.course.location, self.filename, 'sjson', 'srt'),
+            expected,
+        )
+        with patch.object(transcripts_utils.Transcript, 'get_asset') as mock_get_asset:
+            self.assertEqual(
+                transcripts_utils.Transcript.get_converted(self.course.location, self.filename, 'sjson', 'srt'),
+                expected,
+            )
+        self.assertFalse(mock_get_asset.called)
+
+        with self.assertRaises(NotFoundError):
+            transcripts_utils.Transcript.get_converted(self.course.location, 'missing.srt', 'srt', 'txt')
+
+    def test_stale_index(self):
+        self.assertFalse(transcripts_utils.Transcript.asset_exists(self.course.location, self.filename))
+
+        # saved without invalidating the index
+        content_location = StaticContent.compute_location(self.course.id, self.filename)
+        contentstore().save(StaticContent(content_location, self.filename, 'application/json', json.dumps(self.subs)))
+        self.assertFalse(transcripts_utils.Transcript.asset_exists(self.course.location, self.filename))
+
+        # reading the transcript finds it anyway, and refreshes the index
+        self.assertEqual(
+            transcripts_utils.Transcript.get_converted(self.course.location, self.filename, 'sjson', 'txt'),
+            'subs #1',
+        )
+        self.assertTrue(transcripts_utils.Transcript.asset_exists(self.course.location, self.filename))
+
+    def test_large_course(self):
+        names = [u'{}_subs_{}.srt.sjson'.format(number, uuid4()) for number in range(5000)]
+        assets = [
+            {'asset_key': self.course.id.make_asset_key('asset', name), 'md5': uuid4().hex}
+            for name in names
+        ]
+        mock_contentstore = Mock()
+        mock_contentstore.return_value.get_all_content_for_course.return_value = (assets, len(assets))
+        with patch('xmodule.contentstore.asset_index.contentstore', mock_contentstore):
+            for name in names[:20]:
+                self.assertTrue(transcripts_utils.Transcript.asset_exists(self.course.location, name))
+            self.assertFalse(transcripts_utils.Transcript.asset_exists(self.course.location, 'missing.srt.sjson'))
+        # the index is listed once, and cached in shards of no more than ASSET_INDEX_SHARD_SIZE assets
+        self.assertEqual(mock_contentstore.return_value.get_all_content_for_course.call_count, 1)
+        # pylint: disable=protected-access
+        generation = asset_index._get_generation(self.course.id)
+        shard_count = cache.get(asset_index._index_cache_key(self.course.id, generation, 'shards'))
+        self.assertEqual(shard_count, 5)
+        shards = cache.get_many([
+            asset_index._index_cache_key(self.course.id, generation, number) for number in range(shard_count)
+        ])
+        self.assertEqual(sum(len(shard) for shard in shards.values()), len(names))
+        for shard in shards.values():
+            self.assertLessEqual(len(shard), asset_index.ASSET_INDEX_SHARD_SIZE * 1.2)
+
+
 class TestSubsFilename(unittest.TestCase):
     """
     Tests for subs_filename funtion.
@@ -13,6 +13,7 @@ from edxmako.shortcuts import render_to_response
 from cache_toolbox.core import del_cached_content
 
 from contentstore.utils import reverse_course_url
+from xmodule.contentstore.asset_index import invalidate_course_asset_index
 from xmodule.contentstore.django import contentstore
 from xmodule.modulestore.django import modulestore
 from xmodule.contentstore.content import StaticContent
@@ -280,6 +281,7 @@ def _upload_asset(request, course_key):
     # then commit the content
     contentstore().save(content)
     del_cached_content(content.location)
+    invalidate_course_asset_index(course_key)
 
     # readback the saved content - we need the database timestamp
     readback = contentstore().find(content.location)
@@ -363,6 +365,7 @@ def delete_asset(course_key, asset_key):
     contentstore().delete(content.get_id())
     # remove from cache
     del_cached_content(content.location)
+    invalidate_course_asset_index(course_key)
 
 
 def _get_asset_json(display_name, content_type, date, location, thumbnail_location, locked):
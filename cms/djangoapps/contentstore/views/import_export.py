@@ -16,7 +16,7 @@ from django.contrib.auth.decorators import login_required
 from django.core.exceptions import SuspiciousOperation, PermissionDenied
 from django.core.files.temp import NamedTemporaryFile
 from django.core.servers.basehttp import FileWrapper
-from django.http import HttpResponse, HttpResponseNotFound
+from django.http import HttpResponse, HttpResponseNotFound, StreamingHttpResponse
 from django.utils.translation import ugettext as _
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_http_methods, require_GET
@@ -29,7 +29,10 @@ from xmodule.modulestore.django import modulestore
 from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locator import LibraryLocator
 from xmodule.modulestore.xml_importer import import_course_from_xml, import_library_from_xml
-from xmodule.modulestore.xml_exporter import export_course_to_xml, export_library_to_xml
+from xmodule.modulestore.xml_exporter import (
+    export_course_to_xml, export_library_to_xml, CourseExportManager, LibraryExportManager
+)
+from xmodule.modulestore.tar_export import iter_export_tarball
 from xmodule.modulestore import COURSE_ROOT, LIBRARY_ROOT
 
 from student.auth import has_course_author_access
@@ -456,6 +459,24 @@ def send_tarball(tarball):
     return response
 
 
+def stream_export_tarball(course_module, course_key):
+    """
+    Returns a response which streams the export tarball as it is generated, without staging
+    the export on local disk.
+
+    Since the response has started by the time most errors can happen, a failed export
+    results in a truncated download rather than the error page.
+    """
+    name = course_module.url_name
+    if isinstance(course_key, LibraryLocator):
+        manager = LibraryExportManager(modulestore(), contentstore(), course_key, None, name)
+    else:
+        manager = CourseExportManager(modulestore(), contentstore(), course_module.id, None, name)
+    response = StreamingHttpResponse(iter_export_tarball(manager), content_type='application/x-tgz')
+    response['Content-Disposition'] = 'attachment; filename=%s.tar.gz' % name.encode('utf-8')
+    return response
+
+
 @ensure_csrf_cookie
 @login_required
 @require_http_methods(("GET",))
@@ -501,6 +522,8 @@ def export_handler(request, course_key_string):
     requested_format = request.REQUEST.get('_accept', request.META.get('HTTP_ACCEPT', 'text/html'))
 
     if 'application/x-tgz' in requested_format:
+        if settings.FEATURES.get('ENABLE_STREAMING_EXPORT', False):
+            return stream_export_tarball(courselike_module, course_key)
         try:
             tarball = create_export_tarball(courselike_module, course_key, context)
         except SerializationError:
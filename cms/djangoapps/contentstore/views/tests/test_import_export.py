@@ -9,7 +9,9 @@ import os
 import shutil
 import tarfile
 import tempfile
+from mock import patch
 from path import Path as path
+from StringIO import StringIO
 from uuid import uuid4
 
 from django.test.utils import override_settings
@@ -483,6 +485,20 @@ class ExportTestCase(CourseTestCase):
         self.assertEquals(resp.status_code, 200)
         self.assertTrue(resp.get('Content-Disposition').startswith('attachment'))
 
+    @patch.dict('django.conf.settings.FEATURES', {'ENABLE_STREAMING_EXPORT': True})
+    def test_export_targz_streaming(self):
+        """
+        Get tar.gz file streamed as it is generated.
+        """
+        resp = self.client.get(self.url, HTTP_ACCEPT='application/x-tgz')
+        self._verify_export_succeeded(resp)
+        self.assertTrue(resp.streaming)
+        with tarfile.open(fileobj=StringIO(''.join(resp.streaming_content)), mode='r:gz') as tar_file:
+            names = tar_file.getnames()
+        course_name = self.course.url_name
+        self.assertIn(course_name + '/course.xml', names)
+        self.assertIn(course_name + '/policies/assets.json', names)
+
     def test_export_failure_top_level(self):
         """
         Export failure.
@@ -180,6 +180,10 @@ FEATURES = {
 
     # Special Exams, aka Timed and Proctored Exams
     'ENABLE_SPECIAL_EXAMS': False,
+
+    # Stream course exports to the browser as they're generated, instead of
+    # staging the export and its tarball on local disk first
+    'ENABLE_STREAMING_EXPORT': False,
 }
 
 ENABLE_JASMINE = False
@@ -1077,6 +1081,9 @@ FILES_AND_UPLOAD_TYPE_FILTERS = {
 
 # Default to no Search Engine
 SEARCH_ENGINE = None
+# How long after a course or library is published its search index is updated,
+# in seconds. Any further publishes in the meantime are included in the same update.
+SEARCH_INDEX_UPDATE_DELAY = 10
 ELASTIC_FIELD_MAPPINGS = {
     "start_date": {
         "type": "date"
@@ -4,6 +4,7 @@ import re
 from django.contrib.staticfiles.storage import staticfiles_storage
 from django.contrib.staticfiles import finders
 from django.conf import settings
+from django.utils.lru_cache import lru_cache
 
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore import ModuleStoreEnum
@@ -13,6 +14,12 @@ from opaque_keys.edx.locator import AssetLocator
 
 log = logging.getLogger(__name__)
 
+# The number of staticfiles_storage lookups remembered by each of _storage_exists and _storage_url.
+STORAGE_LOOKUP_CACHE_SIZE = 10000
+
+# The number of compiled UrlRewriters kept by get_url_rewriter.
+URL_REWRITER_CACHE_SIZE = 1000
+
 
 def _url_replace_regex(prefix):
     """
@@ -30,13 +37,61 @@ def _url_replace_regex(prefix):
         """.format(prefix=prefix)
 
 
+@lru_cache(maxsize=100)
+def _compiled_url_replace_regex(prefix):
+    """
+    The compiled _url_replace_regex for `prefix`.
+    """
+    return re.compile(_url_replace_regex(prefix))
+
+
+@lru_cache(maxsize=STORAGE_LOOKUP_CACHE_SIZE)
+def _cached_storage_exists(storage, path):
+    """
+    Memoized `storage.exists(path)`.
+    """
+    return storage.exists(path)
+
+
+@lru_cache(maxsize=STORAGE_LOOKUP_CACHE_SIZE)
+def _cached_storage_url(storage, path):
+    """
+    Memoized `storage.url(path)`.
+    """
+    return storage.url(path)
+
+
+def _storage_exists(path):
+    """
+    Whether `path` exists in staticfiles_storage.
+
+    Static files only change when the platform is deployed (course uploads go
+    to the contentstore), and looking them up can mean a network request (e.g.
+    when they're stored in S3), so the answer is remembered per process, except
+    in DEBUG mode. This includes paths which don't exist: course asset urls
+    usually aren't in staticfiles_storage at all.
+    """
+    if settings.DEBUG:
+        return staticfiles_storage.exists(path)
+    return _cached_storage_exists(staticfiles_storage, path)
+
+
+def _storage_url(path):
+    """
+    The url of `path` in staticfiles_storage, cached per process except in DEBUG mode.
+    """
+    if settings.DEBUG:
+        return staticfiles_storage.url(path)
+    return _cached_storage_url(staticfiles_storage, path)
+
+
 def try_staticfiles_lookup(path):
     """
     Try to lookup a path in staticfiles_storage.  If it fails, return
     a dead link instead of raising an exception.
     """
     try:
-        url = staticfiles_storage.url(path)
+        url = _storage_url(path)
     except Exception as err:
         log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
             path, str(err)))
@@ -66,12 +121,9 @@ def replace_jump_to_id_urls(text, course_id, jump_to_id_base_url):
     output: <text> after the link rewriting rules are applied
     """
 
-    def replace_jump_to_id_url(match):
-        quote = match.group('quote')
-        rest = match.group('rest')
-        return "".join([quote, jump_to_id_base_url + rest, quote])
-
-    return re.sub(_url_replace_regex('/jump_to_id/'), replace_jump_to_id_url, text)
+    return get_url_rewriter(
+        course_id=course_id, static_urls=False, jump_to_id_base_url=jump_to_id_base_url
+    ).rewrite(text)
 
 
 def replace_course_urls(text, course_key):
@@ -84,14 +136,7 @@ def replace_course_urls(text, course_key):
     returns: text with the links replaced
     """
 
-    course_id = course_key.to_deprecated_string()
-
-    def replace_course_url(match):
-        quote = match.group('quote')
-        rest = match.group('rest')
-        return "".join([quote, '/courses/' + course_id + '/', rest, quote])
-
-    return re.sub(_url_replace_regex('/course/'), replace_course_url, text)
+    return get_url_rewriter(course_id=course_key, static_urls=False, course_urls=True).rewrite(text)
 
 
 def process_static_urls(text, replacement_function, data_dir=None):
@@ -110,13 +155,16 @@ def process_static_urls(text, replacement_function, data_dir=None):
         rest = match.group('rest')
         return replacement_function(original, prefix, quote, rest)
 
-    return re.sub(
-        _url_replace_regex(u'(?:{static_url}|/static/)(?!{data_dir})'.format(
-            static_url=settings.STATIC_URL,
-            data_dir=data_dir
-        )),
-        wrap_part_extraction,
-        text
+    return _compiled_url_replace_regex(_static_url_prefix(data_dir)).sub(wrap_part_extraction, text)
+
+
+def _static_url_prefix(data_dir):
+    """
+    The regex matching the prefix of static urls, excluding those already in `data_dir`.
+    """
+    return u'(?:{static_url}|/static/)(?!{data_dir})'.format(
+        static_url=settings.STATIC_URL,
+        data_dir=data_dir
     )
 
 
@@ -150,9 +198,90 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
     static_asset_path: Path for static assets, which overrides data_directory and course_namespace, if nonempty
     """
 
-    def replace_static_url(original, prefix, quote, rest):
+    return get_url_rewriter(
+        data_directory=data_directory, course_id=course_id, static_asset_path=static_asset_path
+    ).rewrite(text)
+
+
+def get_url_rewriter(**kwargs):
+    """
+    Return a `UrlRewriter` for the given arguments, reusing the one compiled earlier if possible.
+    """
+    return _get_url_rewriter(settings.STATIC_URL, **kwargs)
+
+
+@lru_cache(maxsize=URL_REWRITER_CACHE_SIZE)
+def _get_url_rewriter(static_url, **kwargs):  # pylint: disable=unused-argument
+    """
+    Cached `UrlRewriter` constructor; `static_url` is only part of the cache key.
+    """
+    return UrlRewriter(**kwargs)
+
+
+class UrlRewriter(object):
+    """
+    Applies replace_static_urls, replace_course_urls and replace_jump_to_id_urls
+    to a course's content, in a single pass of a regex compiled only once.
+
+    Use `get_url_rewriter` to get one.
+    """
+    def __init__(
+            self, data_directory=None, course_id=None, static_asset_path='',
+            static_urls=True, course_urls=False, jump_to_id_base_url=None
+    ):
+        """
+        data_directory, course_id, static_asset_path: as for replace_static_urls
+        static_urls: whether to replace /static/ urls
+        course_urls: whether to replace /course/ urls, as replace_course_urls does
+        jump_to_id_base_url: if not None, replace /jump_to_id/ urls, as replace_jump_to_id_urls does
+        """
+        self.data_directory = data_directory
+        self.course_id = course_id
+        self.static_asset_path = static_asset_path
+        self.jump_to_id_base_url = jump_to_id_base_url
+        if course_urls:
+            self.course_url_base = '/courses/' + course_id.to_deprecated_string() + '/'
+
+        prefixes = []
+        if static_urls:
+            prefixes.append(u'(?P<static>{})'.format(_static_url_prefix(static_asset_path or data_directory)))
+        if course_urls:
+            prefixes.append(u'(?P<course>/course/)')
+        if jump_to_id_base_url is not None:
+            prefixes.append(u'(?P<jump_to_id>/jump_to_id/)')
+        self.regex = re.compile(_url_replace_regex(u'|'.join(prefixes))) if prefixes else None
+
+    def rewrite(self, text):
+        """
+        Return `text` with its urls rewritten.
+        """
+        if self.regex is None:
+            return text
+
+        # The course's modulestore type, looked up by the first static url which needs it.
+        modulestore_type = []
+
+        def replace_url(match):
+            """
+            Replace a single matched url.
+            """
+            quote = match.group('quote')
+            rest = match.group('rest')
+            groups = match.groupdict()
+            if groups.get('course') is not None:
+                return "".join([quote, self.course_url_base, rest, quote])
+            elif groups.get('jump_to_id') is not None:
+                return "".join([quote, self.jump_to_id_base_url + rest, quote])
+
+            return self._replace_static_url(match.group(0), match.group('prefix'), quote, rest, modulestore_type)
+
+        return self.regex.sub(replace_url, text)
+
+    def _replace_static_url(self, original, prefix, quote, rest, modulestore_type):
         """
-        Replace a single matched url.
+        Replace a single matched static url.
+
+        modulestore_type: a list memoizing the course's modulestore type for the current rewrite
         """
         # Don't mess with things that end in '?raw'
         if rest.endswith('?raw'):
@@ -162,38 +291,38 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
         if settings.DEBUG and finders.find(rest, True):
             return original
         # if we're running with a MongoBacked store course_namespace is not None, then use studio style urls
-        elif (not static_asset_path) \
-                and course_id \
-                and modulestore().get_modulestore_type(course_id) != ModuleStoreEnum.Type.xml:
+        elif (not self.static_asset_path) \
+                and self.course_id \
+                and self._modulestore_type(modulestore_type) != ModuleStoreEnum.Type.xml:
             # first look in the static file pipeline and see if we are trying to reference
             # a piece of static content which is in the edx-platform repo (e.g. JS associated with an xmodule)
 
             exists_in_staticfiles_storage = False
             try:
-                exists_in_staticfiles_storage = staticfiles_storage.exists(rest)
+                exists_in_staticfiles_storage = _storage_exists(rest)
             except Exception as err:
                 log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
                     rest, str(err)))
 
             if exists_in_staticfiles_storage:
-                url = staticfiles_storage.url(rest)
+                url = _storage_url(rest)
             else:
                 # if not, then assume it's courseware specific content and then look in the
                 # Mongo-backed database
-                url = StaticContent.convert_legacy_static_url_with_course_id(rest, course_id)
+                url = StaticContent.convert_legacy_static_url_with_course_id(rest, self.course_id)
 
                 if AssetLocator.CANONICAL_NAMESPACE in url:
                     url = url.replace('block@', 'block/', 1)
 
         # Otherwise, look the file up in staticfiles_storage, and append the data directory if needed
         else:
-            course_path = "/".join((static_asset_path or data_directory, rest))
+            course_path = "/".join((self.static_asset_path or self.data_directory, rest))
 
             try:
-                if staticfiles_storage.exists(rest):
-                    url = staticfiles_storage.url(rest)
+                if _storage_exists(rest):
+                    url = _storage_url(rest)
                 else:
-                    url = staticfiles_storage.url(course_path)
+                    url = _storage_url(course_path)
             # And if that fails, assume that it's course content, and add manually data directory
             except Exception as err:
                 log.warning("staticfiles_storage couldn't find path {0}: {1}".format(
@@ -202,4 +331,10 @@ def replace_static_urls(text, data_directory=None, course_id=None, static_asset_
 
         return "".join([quote, url, quote])
 
-    return process_static_urls(text, replace_static_url, data_dir=static_asset_path or data_directory)
+    def _modulestore_type(self, memo):
+        """
+        The type of the modulestore the course is in, looked up at most once per `memo`.
+        """
+        if not memo:
+            memo.append(modulestore().get_modulestore_type(self.course_id))
+        return memo[0]
@@ -6,7 +6,10 @@ from static_replace import (
     replace_course_urls,
     _url_replace_regex,
     process_static_urls,
-    make_static_urls_absolute
+    make_static_urls_absolute,
+    get_url_rewriter,
+    _cached_storage_exists,
+    _cached_storage_url,
 )
 from mock import patch, Mock
 
@@ -83,6 +86,58 @@ def test_storage_url_not_exists(mock_storage):
     mock_storage.url.assert_called_once_with('data_dir/file.png')
 
 
+@patch('static_replace.staticfiles_storage', autospec=True)
+def test_storage_lookups_cached(mock_storage):
+    _cached_storage_exists.cache_clear()
+    _cached_storage_url.cache_clear()
+    mock_storage.exists.return_value = True
+    mock_storage.url.return_value = '/static/file.png'
+
+    for __ in range(3):
+        assert_equals('"/static/file.png"', replace_static_urls(STATIC_SOURCE, DATA_DIRECTORY))
+    mock_storage.exists.assert_called_once_with('file.png')
+    mock_storage.url.assert_called_once_with('file.png')
+
+
+@patch('static_replace.staticfiles_storage', autospec=True)
+def test_missing_storage_lookups_cached(mock_storage):
+    _cached_storage_exists.cache_clear()
+    _cached_storage_url.cache_clear()
+    mock_storage.exists.return_value = False
+    mock_storage.url.side_effect = lambda path: '/static/' + path
+
+    for __ in range(3):
+        assert_equals('"/static/data_dir/file.png"', replace_static_urls(STATIC_SOURCE, DATA_DIRECTORY))
+    mock_storage.exists.assert_called_once_with('file.png')
+
+
+@patch('static_replace.staticfiles_storage', autospec=True)
+@patch('static_replace.modulestore', autospec=True)
+def test_url_rewriter(mock_modulestore, mock_storage):
+    mock_modulestore.return_value = Mock(XMLModuleStore)
+    mock_modulestore.return_value.get_modulestore_type.return_value = 'xml'
+    mock_storage.exists.return_value = False
+    mock_storage.url.side_effect = lambda path: '/static/' + path
+    kwargs = dict(
+        data_directory=DATA_DIRECTORY,
+        course_id=COURSE_KEY,
+        course_urls=True,
+        jump_to_id_base_url='/courses/org/course/run/jump_to_id/',
+    )
+
+    rewriter = get_url_rewriter(**kwargs)
+    assert_true(rewriter is get_url_rewriter(**kwargs))
+
+    text = '<img src="/static/a.png"/><a href="/course/info"/><a href=\'/jump_to_id/b\'/><img src="/static/b.png"/>'
+    assert_equals(
+        '<img src="/static/data_dir/a.png"/><a href="/courses/org/course/run/info"/>'
+        '<a href=\'/courses/org/course/run/jump_to_id/b\'/><img src="/static/data_dir/b.png"/>',
+        rewriter.rewrite(text)
+    )
+    # The course's modulestore is only looked up once per rewrite
+    mock_modulestore.return_value.get_modulestore_type.assert_called_once_with(COURSE_KEY)
+
+
 @patch('static_replace.StaticContent', autospec=True)
 @patch('static_replace.modulestore', autospec=True)
 def test_mongo_filestore(mock_modulestore, mock_static_content):
@@ -0,0 +1,187 @@
+"""
+Event tracker backend that queues events for another backend, which a background thread
+sends on to it in batches, so that requests don't wait for events to be stored.
+
+"""
+
+from __future__ import absolute_import
+
+import atexit
+import logging
+import os
+import threading
+import Queue
+
+from dogapi import dog_stats_api
+from django.db import close_old_connections
+
+from track.backends import BaseBackend
+
+
+log = logging.getLogger(__name__)
+
+# What to do with an event when the queue is full
+OVERFLOW_DROP_NEWEST = 'drop_newest'  # drop the event
+OVERFLOW_DROP_OLDEST = 'drop_oldest'  # drop the oldest queued event to make room for it
+OVERFLOW_BLOCK = 'block'  # wait for room in the queue
+OVERFLOW_POLICIES = (OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST, OVERFLOW_BLOCK)
+
+
+class _FlushMarker(object):
+    """
+    Queued by `BufferedBackend.flush` to find out when the events queued before it have been sent.
+    """
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class BufferedBackend(BaseBackend):
+    """
+    Event tracker backend that queues events in memory, to be sent on to `backend` in
+    batches (using its `send_batch`) by a background thread.
+
+    The queue is flushed when the process exits; events still queued when it's killed
+    are lost.
+
+    """
+    def __init__(self, backend, name='buffered', max_size=10000, batch_size=100,
+                 overflow=OVERFLOW_DROP_NEWEST, flush_timeout=5, **kwargs):
+        """
+        :Parameters:
+
+          - `backend`: the backend to send events on to
+          - `name`: the name of the backend, for tagging metrics
+          - `max_size`: the most events to queue
+          - `batch_size`: the most events to send to `backend` at once
+          - `overflow`: what to do with events when the queue is full; one of
+            OVERFLOW_POLICIES
+          - `flush_timeout`: the most seconds to wait for the queue to be flushed
+            when the process exits
+
+        """
+        super(BufferedBackend, self).__init__(**kwargs)
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError('Invalid event track buffer overflow policy %s' % overflow)
+
+        self.backend = backend
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.overflow = overflow
+        self.flush_timeout = flush_timeout
+        self.metric_tags = [u'backend:{}'.format(name)]
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._worker = None
+
+        atexit.register(self.flush)
+
+    def _get_queue(self):
+        """
+        Return the queue, starting the thread which sends its events on if it isn't running
+        in this process (e.g. if the process forked since it was started).
+        """
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = Queue.Queue(self.max_size)
+                    self._worker = threading.Thread(target=self._run, args=(self._queue,), name='track-buffer')
+                    self._worker.daemon = True
+                    self._worker.start()
+                    self._pid = os.getpid()
+        return self._queue
+
+    def send(self, event):
+        """Queue the event to be sent on."""
+        queue = self._get_queue()
+        if self.overflow == OVERFLOW_BLOCK:
+            queue.put(event)
+            return
+
+        try:
+            queue.put_nowait(event)
+            return
+        except Queue.Full:
+            pass
+
+        if self.overflow == OVERFLOW_DROP_OLDEST:
+            try:
+                dropped = queue.get_nowait()
+                if isinstance(dropped, _FlushMarker):
+                    # Keep the flush waiting, and drop the event instead.
+                    queue.put_nowait(dropped)
+                else:
+                    queue.put_nowait(event)
+            except (Queue.Empty, Queue.Full):
+                pass
+        dog_stats_api.increment('track.buffered.dropped', tags=self.metric_tags)
+
+    def flush(self, timeout=None):
+        """
+        Wait until all of the queued events have been sent on, for at most `timeout`
+        seconds (or `flush_timeout`). If the background thread isn't keeping up, the
+        remaining events are sent in this thread.
+        """
+        if self._pid != os.getpid():
+            return
+        timeout = self.flush_timeout if timeout is None else timeout
+        marker = _FlushMarker()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except Queue.Full:
+            pass
+        else:
+            if marker.done.wait(timeout):
+                return
+        self._send_batches(self._queue, block=False)
+
+    def _run(self, queue):
+        """
+        Send the events put on `queue` on to the backend until the process exits.
+        """
+        while True:
+            self._send_batches(queue, block=True)
+            # Like the request cycle does, don't hold on to broken or expired database connections.
+            close_old_connections()
+
+    def _send_batches(self, queue, block):
+        """
+        Send the events on `queue` on to the backend in batches, until it's empty. If
+        `block` is set, first wait for an event to be queued.
+        """
+        while True:
+            batch = []
+            markers = []
+            try:
+                item = queue.get(block)
+                while True:
+                    if isinstance(item, _FlushMarker):
+                        markers.append(item)
+                    else:
+                        batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    item = queue.get_nowait()
+            except Queue.Empty:
+                pass
+
+            if batch:
+                dog_stats_api.histogram('track.buffered.queue_depth', queue.qsize(), tags=self.metric_tags)
+                self._send_batch(batch)
+            for marker in markers:
+                marker.done.set()
+            if not batch and not markers:
+                return
+            block = False
+
+    def _send_batch(self, batch):
+        """
+        Send `batch` on to the backend, logging any errors.
+        """
+        try:
+            with dog_stats_api.timer('track.buffered.send_batch', tags=self.metric_tags):
+                self.backend.send_batch(batch)
+        except Exception:  # pylint: disable=broad-except
+            log.exception('Error sending %d buffered tracking events', len(batch))
+            dog_stats_api.increment('track.buffered.dropped', len(batch), tags=self.metric_tags)
@@ -0,0 +1,84 @@
+from __future__ import absolute_import
+
+import threading
+
+from django.test import TestCase
+from mock import Mock, patch
+
+from track.backends.buffered import (
+    BufferedBackend, OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST
+)
+
+
+class TestBufferedBackend(TestCase):
+    def setUp(self):
+        super(TestBufferedBackend, self).setUp()
+        self.batches = []
+        self.inner = Mock()
+        self.inner.send_batch.side_effect = lambda batch: self.batches.append(list(batch))
+
+    def _block_sending(self, backend):
+        """
+        Send an event which the backend won't finish sending until the returned event is set,
+        so that events sent meanwhile stay queued.
+        """
+        sending = threading.Event()
+        unblock = threading.Event()
+
+        def send_batch(batch):  # pylint: disable=missing-docstring
+            sending.set()
+            unblock.wait(5)
+            self.batches.append(list(batch))
+        self.inner.send_batch.side_effect = send_batch
+        backend.send({'blocking': True})
+        sending.wait(5)
+        return unblock
+
+    def test_batched(self):
+        backend = BufferedBackend(self.inner, batch_size=3)
+        unblock = self._block_sending(backend)
+        events = [{'test': i} for i in xrange(5)]
+        for event in events:
+            backend.send(event)
+        unblock.set()
+        backend.flush()
+
+        self.assertEqual(self.batches, [[{'blocking': True}], events[:3], events[3:]])
+
+    @patch('track.backends.buffered.dog_stats_api')
+    def test_drop_newest(self, mock_stats):
+        backend = BufferedBackend(self.inner, max_size=2, overflow=OVERFLOW_DROP_NEWEST)
+        unblock = self._block_sending(backend)
+        for i in xrange(3):
+            backend.send({'test': i})
+        unblock.set()
+        backend.flush()
+
+        self.assertEqual(self.batches[1], [{'test': 0}, {'test': 1}])
+        mock_stats.increment.assert_called_once_with('track.buffered.dropped', tags=['backend:buffered'])
+
+    def test_drop_oldest(self):
+        backend = BufferedBackend(self.inner, max_size=2, overflow=OVERFLOW_DROP_OLDEST)
+        unblock = self._block_sending(backend)
+        for i in xrange(3):
+            backend.send({'test': i})
+        unblock.set()
+        backend.flush()
+
+        self.assertEqual(self.batches[1], [{'test': 1}, {'test': 2}])
+
+    def test_errors_logged(self):
+        self.inner.send_batch.side_effect = ValueError
+        backend = BufferedBackend(self.inner)
+        with patch('track.backends.buffered.log') as mock_log:
+            backend.send({'test': 1})
+            backend.flush()
+        self.assertTrue(mock_log.exception.called)
+
+    def test_flush_without_events(self):
+        BufferedBackend(self.inner).flush()
+        self.assertFalse(self.inner.send_batch.called)
+
+    def test_invalid_overflow(self):
+        with self.assertRaises(ValueError):
+            BufferedBackend(self.inner, overflow='explode')
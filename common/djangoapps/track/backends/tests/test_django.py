@@ -24,3 +24,16 @@ class TestDjangoBackend(TestCase):
 
         # Check if time is stored in UTC
         self.assertEqual(str(results[0].time), '2013-01-01 17:01:00+00:00')
+
+    def test_django_backend_batch(self):
+        events = [
+            {'username': username, 'time': '2013-01-01T12:01:00-05:00'}
+            for username in ('first', 'second')
+        ]
+        with self.assertNumQueries(1):
+            self.backend.send_batch(events)
+
+        self.assertEqual(
+            sorted(TrackingLog.objects.values_list('username', flat=True)),
+            ['first', 'second']
+        )
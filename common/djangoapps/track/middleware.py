@@ -12,8 +12,10 @@ import json
 import logging
 import re
 import sys
+from collections import Mapping
 
 from django.conf import settings
+from django.utils import lru_cache
 from ipware.ip import get_ip
 
 from track import views
@@ -34,6 +36,41 @@ META_KEY_TO_CONTEXT_KEY = {
     'HTTP_ACCEPT_LANGUAGE': 'accept_language',
 }
 
+# The most encrypted session keys to remember, so that they aren't encrypted on every request
+ENCRYPTED_SESSION_KEY_CACHE_SIZE = 10000
+
+
+class LazyContext(Mapping):
+    """
+    A read-only tracking context whose values are each computed the first time they're
+    looked up, so that requests which don't emit any events don't pay for them.
+    """
+    def __init__(self, loaders):
+        """
+        Arguments:
+            loaders (dict): The function to call (with no arguments) to compute the
+                value of each key
+        """
+        self._loaders = loaders
+        self._values = {}
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            self._values[key] = self._loaders[key]()
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def copy(self):
+        """Returns a copy of the context, which computes the values not computed yet separately"""
+        context = LazyContext(self._loaders)
+        context._values.update(self._values)  # pylint: disable=protected-access
+        return context
+
 
 class TrackMiddleware(object):
     """
@@ -132,29 +169,35 @@ class TrackMiddleware(object):
         * agent - The client browser identification string.
         * path - The path part of the requested URL.
         * client_id - The unique key used by Google Analytics to identify a user
+        * course_id - The course the requested URL is in, if any.
+        * org_id - The organization of that course, if any.
+
+        The fields are only computed when the context is first resolved.
         """
-        context = {
-            'session': self.get_session_key(request),
-            'user_id': self.get_user_primary_key(request),
-            'username': self.get_username(request),
-            'ip': self.get_request_ip_address(request),
+        loaders = {
+            'session': lambda: self.get_session_key(request),
+            'user_id': lambda: self.get_user_primary_key(request),
+            'username': lambda: self.get_username(request),
+            'ip': lambda: self.get_request_ip_address(request),
+            'client_id': lambda: self.get_client_id(request),
         }
         for header_name, context_key in META_KEY_TO_CONTEXT_KEY.iteritems():
-            context[context_key] = request.META.get(header_name, '')
+            loaders[context_key] = lambda header_name=header_name: request.META.get(header_name, '')
 
-        # Google Analytics uses the clientId to keep track of unique visitors. A GA cookie looks like
-        # this: _ga=GA1.2.1033501218.1368477899. The clientId is this part: 1033501218.1368477899.
-        google_analytics_cookie = request.COOKIES.get('_ga')
-        if google_analytics_cookie is None:
-            context['client_id'] = request.META.get('HTTP_X_EDX_GA_CLIENT_ID')
-        else:
-            context['client_id'] = '.'.join(google_analytics_cookie.split('.')[2:])
+        course_context = {}
+
+        def get_course_context_value(context_key):
+            """Gets a field of the course context of the requested URL, computing them all at once"""
+            if not course_context:
+                course_context.update(contexts.course_context_from_url(request.build_absolute_uri()))
+            return course_context[context_key]
 
-        context.update(contexts.course_context_from_url(request.build_absolute_uri()))
+        for context_key in ('course_id', 'org_id'):
+            loaders[context_key] = lambda context_key=context_key: get_course_context_value(context_key)
 
         tracker.get_tracker().enter_context(
             CONTEXT_NAME,
-            context
+            LazyContext(loaders)
         )
 
     def get_session_key(self, request):
@@ -179,9 +222,7 @@ class TrackMiddleware(object):
         # Using a known-insecure hash to shorten is silly.
         # Also, why do we need same length?
         key_salt = "common.djangoapps.track" + self.__class__.__name__
-        key = hashlib.md5(key_salt + settings.SECRET_KEY).digest()
-        encrypted_session_key = hmac.new(key, msg=session_key, digestmod=hashlib.md5).hexdigest()
-        return encrypted_session_key
+        return _encrypt_session_key(key_salt, settings.SECRET_KEY, session_key)
 
     def get_user_primary_key(self, request):
         """Gets the primary key of the logged in Django user"""
@@ -197,6 +238,16 @@ class TrackMiddleware(object):
         except AttributeError:
             return ''
 
+    def get_client_id(self, request):
+        """Gets the Google Analytics client id of the user, or None if it isn't known"""
+        # Google Analytics uses the clientId to keep track of unique visitors. A GA cookie looks like
+        # this: _ga=GA1.2.1033501218.1368477899. The clientId is this part: 1033501218.1368477899.
+        google_analytics_cookie = request.COOKIES.get('_ga')
+        if google_analytics_cookie is None:
+            return request.META.get('HTTP_X_EDX_GA_CLIENT_ID')
+        else:
+            return '.'.join(google_analytics_cookie.split('.')[2:])
+
     def get_request_ip_address(self, request):
         """Gets the IP address of the request"""
         ip_address = get_ip(request)
@@ -213,3 +264,13 @@ class TrackMiddleware(object):
             pass
 
         return response
+
+
+@lru_cache.lru_cache(maxsize=ENCRYPTED_SESSION_KEY_CACHE_SIZE)
+def _encrypt_session_key(key_salt, secret_key, session_key):
+    """
+    Encrypts `session_key` with a key derived from `key_salt` and `secret_key`. Sessions
+    span many requests, so the results are cached.
+    """
+    key = hashlib.md5(key_salt + secret_key).digest()
+    return hmac.new(key, msg=session_key, digestmod=hashlib.md5).hexdigest()
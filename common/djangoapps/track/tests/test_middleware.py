@@ -1,3 +1,6 @@
+import hmac
+from uuid import uuid4
+
 from mock import patch
 from mock import sentinel
 
@@ -164,6 +167,26 @@ class TrackMiddlewareTestCase(TestCase):
         encrypted_session_key = self.track_middleware.encrypt_session_key(session_key)
         self.assertEquals(encrypted_session_key, expected_session_key)
 
+    def test_session_key_encryption_cached(self):
+        session_key = uuid4().hex
+        with patch('track.middleware.hmac.new', wraps=hmac.new) as mock_hmac:
+            encrypted_session_key = self.track_middleware.encrypt_session_key(session_key)
+            self.assertEquals(self.track_middleware.encrypt_session_key(session_key), encrypted_session_key)
+        self.assertEquals(mock_hmac.call_count, 1)
+
+    @override_settings(TRACKING_IGNORE_URL_PATTERNS=[r'^/courses/'])
+    def test_context_computed_lazily(self):
+        request = self.request_factory.get('/courses/test_org/test_course/test_run/foo')
+        with patch('track.middleware.get_ip', return_value='10.0.0.1') as mock_get_ip:
+            self.track_middleware.process_request(request)
+            try:
+                self.assertFalse(mock_get_ip.called)
+                context = tracker.get_tracker().resolve_context()
+            finally:
+                self.track_middleware.process_response(request, None)
+        self.assertEquals(mock_get_ip.call_count, 1)
+        self.assert_dict_subset(context, {'ip': '10.0.0.1', 'org_id': 'test_org'})
+
     def test_request_headers(self):
         ip_address = '10.0.0.0'
         user_agent = 'UnitTest/1.0'
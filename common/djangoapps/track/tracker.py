@@ -12,10 +12,19 @@ below::
               'host': ... ,
               'port': ... ,
               ...
+          },
+          'BUFFER': {
+              'max_size': ... ,
+              'batch_size': ... ,
+              'overflow': ... ,
           }
       }
   }
 
+A backend with a BUFFER is sent events in batches by a background thread, rather
+than as they're tracked (see track.backends.buffered.BufferedBackend for the
+options).
+
 """
 
 import inspect
@@ -26,6 +35,7 @@ from dogapi import dog_stats_api
 from django.conf import settings
 
 from track.backends import BaseBackend
+from track.backends.buffered import BufferedBackend
 
 
 __all__ = ['send']
@@ -49,7 +59,10 @@ def _initialize_backends_from_django_settings():
         if values:
             engine = values['ENGINE']
             options = values.get('OPTIONS', {})
-            backends[name] = _instantiate_backend_from_name(engine, options)
+            backend = _instantiate_backend_from_name(engine, options)
+            if 'BUFFER' in values:
+                backend = BufferedBackend(backend, name=name, **values['BUFFER'])
+            backends[name] = backend
 
 
 def _instantiate_backend_from_name(name, options):
@@ -1,9 +1,61 @@
 """ Utility functions related to database queries """
 from django.conf import settings
 
+# The default number of rows read at a time by `iter_by_pk`
+DEFAULT_BATCH_SIZE = 1000
+
 
 def use_read_replica_if_available(queryset):
     """
     If there is a database called 'read_replica', use that database for the queryset.
     """
     return queryset.using("read_replica") if "read_replica" in settings.DATABASES else queryset
+
+
+def iter_by_pk(queryset, fields=None, batch_size=DEFAULT_BATCH_SIZE, read_replica=True, progress_callback=None):
+    """
+    Yields the rows of the queryset in order of primary key, reading `batch_size` rows at a
+    time, so that however many rows there are, only a batch of them is held in memory.
+
+    Each batch is selected by the primary key of the last row of the batch before it, rather
+    than by an offset, so that reading the last batch is as quick as reading the first.
+
+    Arguments:
+        queryset (QuerySet): The rows to read. Any ordering it has is replaced.
+        fields (list): If given, the names of the fields whose values are yielded for each
+            row, as a tuple (which is much cheaper than a model instance). Otherwise, model
+            instances are yielded.
+        batch_size (int): The number of rows to read at a time.
+        read_replica (bool): Whether to read the rows from the read replica, if there is one.
+            Don't set this if the rows read are to be written back.
+        progress_callback (callable): If given, called with the number of rows read so far
+            after the rows of each batch have been yielded.
+    """
+    if read_replica:
+        queryset = use_read_replica_if_available(queryset)
+    queryset = queryset.order_by('pk')
+    if fields is not None:
+        queryset = queryset.values_list('pk', *fields)
+
+    last_pk = None
+    num_read = 0
+    while True:
+        batch_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        batch = list(batch_queryset[:batch_size])
+        if not batch:
+            return
+
+        if fields is not None:
+            last_pk = batch[-1][0]
+            for row in batch:
+                yield row[1:]
+        else:
+            last_pk = batch[-1].pk
+            for row in batch:
+                yield row
+
+        num_read += len(batch)
+        if progress_callback is not None:
+            progress_callback(num_read)
+        if len(batch) < batch_size:
+            return
@@ -0,0 +1,36 @@
+"""Tests for util.query module."""
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from util.query import iter_by_pk
+
+
+class IterByPkTestCase(TestCase):
+    """
+    Tests iter_by_pk.
+    """
+    def setUp(self):
+        super(IterByPkTestCase, self).setUp()
+        self.users = [User.objects.create(username='user{}'.format(index)) for index in range(5)]
+
+    def test_values(self):
+        progress = []
+        with self.assertNumQueries(3):
+            rows = list(iter_by_pk(
+                User.objects.order_by('-username'),
+                fields=('username',),
+                batch_size=2,
+                progress_callback=progress.append,
+            ))
+        self.assertEqual(rows, [(user.username,) for user in self.users])
+        self.assertEqual(progress, [2, 4, 5])
+
+    def test_instances(self):
+        with self.assertNumQueries(2):
+            users = list(iter_by_pk(User.objects.filter(username__gt='user0'), batch_size=4))
+        self.assertEqual(users, self.users[1:])
+
+    def test_empty(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(list(iter_by_pk(User.objects.filter(username='nobody'), fields=('username',))), [])
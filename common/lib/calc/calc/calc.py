@@ -228,34 +228,236 @@ def evaluator(variables, functions, math_expr, case_sensitive=False):
     if math_expr.strip() == "":
         return float('nan')
 
-    # Parse the tree.
-    math_interpreter = ParseAugmenter(math_expr, case_sensitive)
-    math_interpreter.parse_algebra()
+    # Parse the tree (or reuse an earlier parse of the same expression).
+    compiled = compile_expression(math_expr, case_sensitive)
 
     # Get our variables together.
     all_variables, all_functions = add_defaults(variables, functions, case_sensitive)
 
     # ...and check them
-    math_interpreter.check_variables(all_variables, all_functions)
+    compiled.check_variables(all_variables, all_functions)
 
-    # Create a recursion to evaluate the tree.
-    if case_sensitive:
-        casify = lambda x: x
-    else:
-        casify = lambda x: x.lower()  # Lowercase for case insens.
-
-    evaluate_actions = {
-        'number': eval_number,
-        'variable': lambda x: all_variables[casify(x[0])],
-        'function': lambda x: all_functions[casify(x[0])](x[1]),
-        'atom': eval_atom,
-        'power': eval_power,
-        'parallel': eval_parallel,
-        'product': eval_product,
-        'sum': eval_sum
+    return compiled.evaluate(all_variables, all_functions)
+
+
+def vectorized_evaluator(variables, functions, math_expr, case_sensitive=False):
+    """
+    Evaluate an expression for many samples of its variables at once.
+
+    Like `evaluator`, except that variables may be given arrays of values (all
+    of the same length), one per sample. Returns a numpy array of the results,
+    one per sample, the same as calling `evaluator` on each sample in turn
+    (including the errors raised), but without repeating the parse.
+    """
+    variables = {
+        name: numpy.asarray(value) if numpy.ndim(value) > 0 else value
+        for name, value in variables.iteritems()
     }
+    size = max([len(value) for value in variables.itervalues() if numpy.ndim(value) > 0] or [1])
+
+    # No need to go further.
+    if math_expr.strip() == "":
+        return numpy.array([float('nan')] * size)
+
+    compiled = compile_expression(math_expr, case_sensitive)
+    all_variables, all_functions = add_defaults(variables, functions, case_sensitive)
+    compiled.check_variables(all_variables, all_functions)
+
+    return compiled.evaluate_many(all_variables, all_functions, size)
+
+
+# The number of parsed and compiled expressions kept by `compile_expression`.
+COMPILED_CACHE_SIZE = 1024
+
+_COMPILED_CACHE = {}
+
+
+def compile_expression(math_expr, case_sensitive=False):
+    """
+    Return a `CompiledExpression` for `math_expr`.
+
+    Expressions are cached, since the same ones (e.g. a problem's answer) are
+    evaluated over and over again. The cache is simply emptied when it fills up.
+    """
+    key = (math_expr, case_sensitive)
+    compiled = _COMPILED_CACHE.get(key)
+    if compiled is None:
+        compiled = CompiledExpression(math_expr, case_sensitive)
+        if len(_COMPILED_CACHE) >= COMPILED_CACHE_SIZE:
+            _COMPILED_CACHE.clear()
+        _COMPILED_CACHE[key] = compiled
+    return compiled
+
+
+def _lower_tree(tree, casify):
+    """
+    Lower a parse tree to a closure which computes its value.
+
+    The closure takes the dictionaries of all variables and of all functions
+    (keyed by their casified names), and does the same arithmetic as the eval_*
+    actions above. Since it only uses arithmetic operators and the functions it
+    is given, it works on numpy arrays of variable values too.
+    """
+    def lower_node(node):
+        """
+        Return the closure computing the value of `node`.
+        """
+        node_name = node.getName()
+        kids = [lower_node(k) for k in node if isinstance(k, ParseResults)]
+
+        if node_name == 'number':
+            value = eval_number(node)
+            return lambda variables, functions: value
+
+        elif node_name == 'variable':
+            name = casify(node[0])
+            return lambda variables, functions: variables[name]
+
+        elif node_name == 'function':
+            name = casify(node[0])
+            argument = kids[0]
+            return lambda variables, functions: functions[name](argument(variables, functions))
+
+        elif node_name == 'atom':
+            return kids[0]
+
+        elif node_name == 'power':
+            if len(kids) == 1:
+                return kids[0]
+
+            def power(variables, functions):
+                """ Exponentiate right to left. """
+                values = [kid(variables, functions) for kid in kids]
+                return reduce(lambda a, b: b ** a, reversed(values))
+            return power
+
+        elif node_name == 'parallel':
+            if len(kids) == 1:
+                return kids[0]
+
+            def parallel(variables, functions):
+                """ Combine with the parallel resistors operator. """
+                values = [kid(variables, functions) for kid in kids]
+                if any(isinstance(value, numpy.ndarray) for value in values):
+                    # Zeros divide by zero, which is an error when evaluating many samples.
+                    return 1. / sum(1. / value for value in values)
+                return eval_parallel(values)
+            return parallel
+
+        elif node_name in ('product', 'sum'):
+            operators = {
+                '*': operator.mul, '/': operator.truediv, '+': operator.add, '-': operator.sub
+            }
+            total = 1.0 if node_name == 'product' else 0.0
+            current_op = operator.mul if node_name == 'product' else operator.add
+            terms = []
+            kid_iter = iter(kids)
+            for token in node:
+                if isinstance(token, ParseResults):
+                    terms.append((current_op, next(kid_iter)))
+                else:
+                    current_op = operators[token]
+
+            def combine(variables, functions):
+                """ Add or multiply the terms. """
+                result = total
+                for term_op, term in terms:
+                    result = term_op(result, term(variables, functions))
+                return result
+            return combine
+
+        else:  # pragma: no cover
+            raise Exception(u"Unknown branch name '{}'".format(node_name))
+
+    return lower_node(tree)
+
+
+def _vectorize(func):
+    """
+    Return a version of `func` which can be called with an array of values.
+
+    Numpy's ufuncs already can; other functions (like math.factorial) are
+    called on each value in turn.
+    """
+    if isinstance(func, numpy.ufunc):
+        return func
+
+    def elementwise(arg):
+        """ Call `func` on each element of `arg`. """
+        if isinstance(arg, numpy.ndarray):
+            return numpy.array([func(value) for value in arg.tolist()])
+        return func(arg)
+    return elementwise
+
+
+_GRAMMAR = None
+
+
+def _get_grammar():
+    """
+    Return the pyparsing grammar for algebraic expressions.
+
+    It is the same for every expression, so it's only built once.
+    """
+    global _GRAMMAR  # pylint: disable=global-statement
+    if _GRAMMAR is None:
+        _GRAMMAR = _build_grammar()
+    return _GRAMMAR
+
+
+def _build_grammar():
+    """
+    Build the pyparsing grammar for algebraic expressions.
+    """
+    # 0.33 or 7 or .34 or 16.
+    number_part = Word(nums)
+    inner_number = (number_part + Optional("." + Optional(number_part))) | ("." + number_part)
+    # pyparsing allows spaces between tokens--`Combine` prevents that.
+    inner_number = Combine(inner_number)
+
+    # SI suffixes and percent.
+    number_suffix = MatchFirst(Literal(k) for k in SUFFIXES.keys())
+
+    # 0.33k or 17
+    plus_minus = Literal('+') | Literal('-')
+    number = Group(
+        Optional(plus_minus) +
+        inner_number +
+        Optional(CaselessLiteral("E") + Optional(plus_minus) + number_part) +
+        Optional(number_suffix)
+    )
+    number = number("number")
+
+    # Predefine recursive variables.
+    expr = Forward()
+
+    # Handle variables passed in. They must start with letters/underscores
+    # and may contain numbers afterward.
+    inner_varname = Word(alphas + "_", alphanums + "_")
+    varname = Group(inner_varname)("variable")
+
+    # Same thing for functions.
+    function = Group(inner_varname + Suppress("(") + expr + Suppress(")"))("function")
+
+    atom = number | function | varname | "(" + expr + ")"
+    atom = Group(atom)("atom")
+
+    # Do the following in the correct order to preserve order of operation.
+    pow_term = atom + ZeroOrMore("^" + atom)
+    pow_term = Group(pow_term)("power")
 
-    return math_interpreter.reduce_tree(evaluate_actions)
+    par_term = pow_term + ZeroOrMore('||' + pow_term)  # 5k || 4k
+    par_term = Group(par_term)("parallel")
+
+    prod_term = par_term + ZeroOrMore((Literal('*') | Literal('/')) + par_term)  # 7 * 5 / 4
+    prod_term = Group(prod_term)("product")
+
+    sum_term = Optional(plus_minus) + prod_term + ZeroOrMore(plus_minus + prod_term)  # -5 + 4 - 3
+    sum_term = Group(sum_term)("sum")
+
+    # Finish the recursion.
+    expr << sum_term  # pylint: disable=pointless-statement
+    return expr + stringEnd
 
 
 class ParseAugmenter(object):
@@ -278,23 +480,6 @@ class ParseAugmenter(object):
         self.variables_used = set()
         self.functions_used = set()
 
-        def vpa(tokens):
-            """
-            When a variable is recognized, store it in `variables_used`.
-            """
-            varname = tokens[0][0]
-            self.variables_used.add(varname)
-
-        def fpa(tokens):
-            """
-            When a function is recognized, store it in `functions_used`.
-            """
-            varname = tokens[0][0]
-            self.functions_used.add(varname)
-
-        self.variable_parse_action = vpa
-        self.function_parse_action = fpa
-
     def parse_algebra(self):
         """
         Parse an algebraic expression into a tree.
@@ -302,62 +487,28 @@ class ParseAugmenter(object):
         Store a `pyparsing.ParseResult` in `self.tree` with proper groupings to
         reflect parenthesis and order of operations. Leave all operators in the
         tree and do not parse any strings of numbers into their float versions.
+        Also store the names of the variables and functions used.
 
         Adding the groups and result names makes the `repr()` of the result
         really gross. For debugging, use something like
           print OBJ.tree.asXML()
         """
-        # 0.33 or 7 or .34 or 16.
-        number_part = Word(nums)
-        inner_number = (number_part + Optional("." + Optional(number_part))) | ("." + number_part)
-        # pyparsing allows spaces between tokens--`Combine` prevents that.
-        inner_number = Combine(inner_number)
-
-        # SI suffixes and percent.
-        number_suffix = MatchFirst(Literal(k) for k in SUFFIXES.keys())
-
-        # 0.33k or 17
-        plus_minus = Literal('+') | Literal('-')
-        number = Group(
-            Optional(plus_minus) +
-            inner_number +
-            Optional(CaselessLiteral("E") + Optional(plus_minus) + number_part) +
-            Optional(number_suffix)
-        )
-        number = number("number")
-
-        # Predefine recursive variables.
-        expr = Forward()
-
-        # Handle variables passed in. They must start with letters/underscores
-        # and may contain numbers afterward.
-        inner_varname = Word(alphas + "_", alphanums + "_")
-        varname = Group(inner_varname)("variable")
-        varname.setParseAction(self.variable_parse_action)
-
-        # Same thing for functions.
-        function = Group(inner_varname + Suppress("(") + expr + Suppress(")"))("function")
-        function.setParseAction(self.function_parse_action)
-
-        atom = number | function | varname | "(" + expr + ")"
-        atom = Group(atom)("atom")
-
-        # Do the following in the correct order to preserve order of operation.
-        pow_term = atom + ZeroOrMore("^" + atom)
-        pow_term = Group(pow_term)("power")
-
-        par_term = pow_term + ZeroOrMore('||' + pow_term)  # 5k || 4k
-        par_term = Group(par_term)("parallel")
-
-        prod_term = par_term + ZeroOrMore((Literal('*') | Literal('/')) + par_term)  # 7 * 5 / 4
-        prod_term = Group(prod_term)("product")
-
-        sum_term = Optional(plus_minus) + prod_term + ZeroOrMore(plus_minus + prod_term)  # -5 + 4 - 3
-        sum_term = Group(sum_term)("sum")
-
-        # Finish the recursion.
-        expr << sum_term  # pylint: disable=pointless-statement
-        self.tree = (expr + stringEnd).parseString(self.math_expr)[0]
+        self.tree = _get_grammar().parseString(self.math_expr)[0]
+
+        def collect_names(node):
+            """
+            Add the names of the variables and functions in `node` to `variables_used` and `functions_used`.
+            """
+            node_name = node.getName()
+            if node_name == 'variable':
+                self.variables_used.add(node[0])
+            elif node_name == 'function':
+                self.functions_used.add(node[0])
+            for child in node:
+                if isinstance(child, ParseResults):
+                    collect_names(child)
+
+        collect_names(self.tree)
 
     def reduce_tree(self, handle_actions, terminal_converter=None):
         """
@@ -416,3 +567,64 @@ class ParseAugmenter(object):
 
         if bad_vars:
             raise UndefinedVariable(' '.join(sorted(bad_vars)))
+
+
+class CompiledExpression(ParseAugmenter):
+    """
+    A parsed expression, lowered to a closure so it can be evaluated many times
+    without walking the parse tree.
+
+    Use `compile_expression` to get one, rather than creating it directly.
+    """
+    def __init__(self, math_expr, case_sensitive=False):
+        super(CompiledExpression, self).__init__(math_expr, case_sensitive)
+        self.parse_algebra()
+        if case_sensitive:
+            casify = lambda x: x
+        else:
+            casify = lambda x: x.lower()  # Lowercase for case insens.
+        self._evaluate = _lower_tree(self.tree, casify)
+
+    def evaluate(self, all_variables, all_functions):
+        """
+        Return the value of the expression.
+
+        `all_variables` and `all_functions` include the defaults, as returned
+        by `add_defaults`.
+        """
+        return self._evaluate(all_variables, all_functions)
+
+    def evaluate_many(self, all_variables, all_functions, size):
+        """
+        Return a numpy array of the expression's values for `size` samples.
+
+        Variables are given either a single value, or an array of `size` values.
+        Any floating point error (e.g. division by zero) while evaluating the
+        whole arrays means the samples are evaluated one at a time instead, so
+        that the results and errors are the same as evaluating each sample.
+        """
+        functions = {name: _vectorize(func) for name, func in all_functions.iteritems()}
+        try:
+            with numpy.errstate(divide='raise', over='raise', invalid='raise'):
+                result = self._evaluate(all_variables, functions)
+        except Exception:  # pylint: disable=broad-except
+            result = None
+
+        if result is None or numpy.shape(result) not in ((), (size,)):
+            # Evaluate on python numbers, like `evaluator` does.
+            samples = {
+                name: value.tolist()
+                for name, value in all_variables.iteritems()
+                if isinstance(value, numpy.ndarray)
+            }
+            sample_variables = dict(all_variables)
+            results = []
+            for index in xrange(size):
+                for name, values in samples.iteritems():
+                    sample_variables[name] = values[index]
+                results.append(self._evaluate(sample_variables, all_functions))
+            return numpy.array(results)
+
+        if numpy.ndim(result) == 0:
+            return numpy.array([result] * size)
+        return result
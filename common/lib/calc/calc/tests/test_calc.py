@@ -559,3 +559,61 @@ class EvaluatorTest(unittest.TestCase):
             calc.evaluator({'r1': 5}, {}, "r1+r2")
         with self.assertRaisesRegexp(calc.UndefinedVariable, 'r1 r3'):
             calc.evaluator(variables, {}, "r1*r3", case_sensitive=True)
+
+
+class VectorizedEvaluatorTest(unittest.TestCase):
+    """
+    Run tests for calc.vectorized_evaluator and the cache of compiled expressions.
+    """
+
+    def test_matches_evaluator(self):
+        """
+        Evaluating samples at once gives the same values as evaluating each one
+        """
+        x_values = [0.5, 1.0, 2.5, -3.0]
+        y_values = [1.0, 4.0, 9.0, 16.0]
+        for expr in ['x^2 + sqrt(y)', '-x/y * 3k', 'sec(x) || y', '2^x^2', 'x*i + y', '5']:
+            expected = [
+                calc.evaluator({'x': x, 'y': y}, {}, expr)
+                for x, y in zip(x_values, y_values)
+            ]
+            results = calc.vectorized_evaluator({'x': x_values, 'y': y_values}, {}, expr)
+            self.assertEqual(len(results), len(x_values))
+            for result, value in zip(results, expected):
+                self.assertAlmostEqual(result, value)
+
+    def test_scalar_semantics(self):
+        """
+        Errors and NaNs match those of evaluating each sample on its own
+        """
+        with self.assertRaises(ZeroDivisionError):
+            calc.vectorized_evaluator({'x': [1.0, 0.0]}, {}, '1/x')
+        with self.assertRaisesRegexp(ValueError, 'factorial'):
+            calc.vectorized_evaluator({'x': [1.0, 2.5]}, {}, 'fact(x)')
+        self.assertEqual(list(calc.vectorized_evaluator({'x': [1.0, 3.0]}, {}, 'fact(x)')), [1, 6])
+
+        results = calc.vectorized_evaluator({'x': [1.0, 0.0]}, {}, 'x || 2')
+        self.assertAlmostEqual(results[0], 2.0 / 3)
+        self.assertTrue(numpy.isnan(results[1]))
+
+        self.assertTrue(numpy.isnan(calc.vectorized_evaluator({'x': [1.0]}, {}, ' ')).all())
+        with self.assertRaisesRegexp(calc.UndefinedVariable, 'y'):
+            calc.vectorized_evaluator({'x': [1.0]}, {}, 'x+y')
+
+    def test_functions(self):
+        """
+        User functions are called with each sample's value
+        """
+        functions = {'f': lambda x: x if x > 1 else -x}
+        results = calc.vectorized_evaluator({'x': [0.5, 2.0]}, functions, 'f(x)')
+        self.assertEqual(list(results), [-0.5, 2.0])
+
+    def test_compiled_cache(self):
+        """
+        Expressions are only parsed once, separately for case sensitivity
+        """
+        compiled = calc.compile_expression('x + Y*f(z)')
+        self.assertIs(calc.compile_expression('x + Y*f(z)'), compiled)
+        self.assertIsNot(calc.compile_expression('x + Y*f(z)', case_sensitive=True), compiled)
+        self.assertEqual(compiled.variables_used, {'x', 'Y', 'z'})
+        self.assertEqual(compiled.functions_used, {'f'})
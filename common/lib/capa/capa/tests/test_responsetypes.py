@@ -591,6 +591,37 @@ class FormulaResponseTest(ResponseTest):
         self.assertTrue(problem.responders.values()[0].validate_answer('14*x'))
         self.assertFalse(problem.responders.values()[0].validate_answer('3*y+2*x'))
 
+    def test_samples_evaluated_together(self):
+        """
+        Each formula is evaluated once, for all the samples together.
+        """
+        sample_dict = {'x': (1, 2), 'y': (3, 4)}
+        problem = self.build_problem(sample_dict=sample_dict,
+                                     num_samples=20,
+                                     tolerance="1%",
+                                     answer="x*y")
+        responder = problem.responders.values()[0]
+        var_samples = responder.randomize_variables(responder.samples)
+        self.assertEqual(sorted(var_samples), ['x', 'y'])
+        self.assertEqual(len(var_samples['x']), 20)
+        self.assertTrue(all(1 <= value <= 2 for value in var_samples['x']))
+
+        with mock.patch('capa.responsetypes.vectorized_evaluator', wraps=calc.vectorized_evaluator) as evaluate:
+            self.assert_grade(problem, "y*x", "correct")
+        self.assertEqual(evaluate.call_count, 2)
+
+    def test_factorial_outside_domain(self):
+        """
+        Factorials of non-integer samples are reported as such.
+        """
+        sample_dict = {'x': (1, 2)}
+        problem = self.build_problem(sample_dict=sample_dict,
+                                     num_samples=10,
+                                     tolerance="1%",
+                                     answer="x")
+        with self.assertRaisesRegexp(StudentInputError, 'factorial function not permitted'):
+            problem.grade_answers({'1_2_1': 'fact(x)'})
+
 
 class StringResponseTest(ResponseTest):  # pylint: disable=missing-docstring
     xml_factory_class = StringResponseXMLFactory
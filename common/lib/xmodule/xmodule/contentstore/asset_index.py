@@ -0,0 +1,116 @@
+"""
+A cached index of each course's assets, so that whether an asset exists (and the digest of
+its content) can be looked up without querying the contentstore.
+
+Each course's index is cached under the course's current generation. Anything which saves
+or deletes a course's assets must call `invalidate_course_asset_index`, which moves the
+generation on.
+
+The index is split into shards, each cached as a separate value, so that a course with many
+assets doesn't exceed the cache's limit on the size of a value.
+"""
+import hashlib
+import math
+import time
+
+from django.core.cache import cache
+
+from .django import contentstore
+
+# How long each course's index is cached for, in seconds
+ASSET_INDEX_TIMEOUT = 24 * 60 * 60
+
+# How many assets go in each shard of a course's index
+ASSET_INDEX_SHARD_SIZE = 1000
+
+
+def _generation_cache_key(course_key):
+    """
+    The cache key of the generation of `course_key`'s asset index.
+    """
+    return u'contentstore.asset_index.generation.{}'.format(course_key)
+
+
+def _index_cache_key(course_key, generation, suffix):
+    """
+    The cache key of a part of generation `generation` of `course_key`'s asset index: either
+    its number of shards (`suffix` is 'shards') or one of its shards (`suffix` is the shard's number).
+    """
+    return u'contentstore.asset_index.{}.{}.{}'.format(course_key, generation, suffix)
+
+
+def _shard_of(asset_name, shard_count):
+    """
+    The number of the shard which `asset_name` belongs to in an index of `shard_count` shards.
+    """
+    return int(hashlib.md5(asset_name.encode('utf-8')).hexdigest()[:8], 16) % shard_count
+
+
+def _get_generation(course_key):
+    """
+    Return the current generation of `course_key`'s asset index.
+    """
+    key = _generation_cache_key(course_key)
+    generation = cache.get(key)
+    if generation is None:
+        # Start from the current time rather than 0, so that an index cached under an
+        # evicted generation is never mistaken for the current one.
+        cache.add(key, int(time.time() * 1000), None)
+        generation = cache.get(key)
+    return generation
+
+
+def invalidate_course_asset_index(course_key):
+    """
+    Invalidate the cached index of `course_key`'s assets.
+    """
+    key = _generation_cache_key(course_key)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), None)
+
+
+def _build_course_asset_index(course_key, generation):
+    """
+    List `course_key`'s assets, cache their index as generation `generation`, and return it
+    as a single dict.
+    """
+    assets, __ = contentstore().get_all_content_for_course(course_key)
+    index = {asset['asset_key'].name: asset.get('md5') for asset in assets}
+
+    shard_count = max(1, int(math.ceil(len(index) / float(ASSET_INDEX_SHARD_SIZE))))
+    shards = [{} for __ in range(shard_count)]
+    for asset_name, digest in index.iteritems():
+        shards[_shard_of(asset_name, shard_count)][asset_name] = digest
+
+    values = {_index_cache_key(course_key, generation, number): shard for number, shard in enumerate(shards)}
+    values[_index_cache_key(course_key, generation, 'shards')] = shard_count
+    cache.set_many(values, ASSET_INDEX_TIMEOUT)
+    return index
+
+
+def get_course_asset_digests(course_key, asset_names):
+    """
+    Return a dict of the md5 digests of the contents of those of `asset_names` which are the
+    names (as in their asset keys) of assets of `course_key`, keyed by those names.
+
+    Only the shards of the index which hold `asset_names` are read from the cache; if any of
+    them is missing, the whole index is rebuilt.
+    """
+    generation = _get_generation(course_key)
+    index = None
+    shard_count = cache.get(_index_cache_key(course_key, generation, 'shards'))
+    if shard_count is not None:
+        shard_keys = set(
+            _index_cache_key(course_key, generation, _shard_of(asset_name, shard_count))
+            for asset_name in asset_names
+        )
+        shards = cache.get_many(list(shard_keys))
+        if len(shards) == len(shard_keys):
+            index = {}
+            for shard in shards.itervalues():
+                index.update(shard)
+    if index is None:
+        index = _build_course_asset_index(course_key, generation)
+    return {asset_name: index[asset_name] for asset_name in asset_names if asset_name in index}
@@ -7,9 +7,19 @@ XASSET_THUMBNAIL_TAIL_NAME = '.jpg'
 
 STREAM_DATA_CHUNK_SIZE = 1024
 
+# Default number of assets loaded per round trip by ContentStore.iter_find_many
+FIND_MANY_BATCH_SIZE = 20
+
+# Asset data read by ContentStore.iter_read_many is spooled to a temporary file beyond this many bytes.
+READ_MANY_SPOOL_SIZE = 1024 * 1024
+
 import os
 import logging
 import StringIO
+from collections import deque
+from functools import partial
+from multiprocessing.pool import ThreadPool
+from tempfile import SpooledTemporaryFile
 from urlparse import urlparse, urlunparse, parse_qsl
 from urllib import urlencode
 
@@ -18,6 +28,8 @@ from opaque_keys.edx.keys import CourseKey, AssetKey
 from opaque_keys import InvalidKeyError
 from PIL import Image
 
+from xmodule.exceptions import NotFoundError
+
 
 class StaticContent(object):
     def __init__(self, loc, name, content_type, data, last_modified_at=None, thumbnail_location=None, import_path=None,
@@ -220,6 +232,51 @@ class ContentStore(object):
     def find(self, filename):
         raise NotImplementedError
 
+    def find_many(self, locations, throw_on_not_found=False, as_stream=False):
+        """
+        Returns a dict mapping each of the given asset locations to its StaticContent. Locations
+        which don't exist are left out, unless `throw_on_not_found` is set. With `as_stream`, the
+        contents are StaticContentStreams whose data is only read as it is streamed.
+
+        This implementation simply calls `find` for each location; subclasses should override it
+        to load all of the assets in as few round trips as possible.
+        """
+        found = {}
+        for location in locations:
+            content = self.find(location, throw_on_not_found=throw_on_not_found, as_stream=as_stream)
+            if content is not None:
+                found[location] = content
+        return found
+
+    def iter_find_many(self, locations, batch_size=FIND_MANY_BATCH_SIZE, max_workers=1):
+        """
+        Yields a (location, StaticContent) pair for each of the given locations, in order. The
+        content is None for locations which don't exist.
+
+        The assets are looked up `batch_size` at a time through `find_many`, as streams: read each
+        content's data with `stream_data`, as only the assets' attributes are loaded up front. With
+        `max_workers` > 1, that many batches are looked up concurrently ahead of the consumer.
+        """
+        batches = [locations[start:start + batch_size] for start in xrange(0, len(locations), batch_size)]
+        find_batch = partial(self.find_many, as_stream=True)
+        for batch, found in iter_concurrently(find_batch, batches, max_workers):
+            for location in batch:
+                yield location, found.get(location)
+
+    def iter_read_many(self, locations, max_workers=1):
+        """
+        Yields a (StaticContent, data) pair for each of the given locations, in order, where `data` is
+        an open temporary file holding the asset's data, which the caller should close. Raises
+        NotFoundError for locations which don't exist.
+
+        With `max_workers` > 1, the data of that many assets is read concurrently ahead of the consumer.
+        The data of each asset is spooled to disk beyond READ_MANY_SPOOL_SIZE bytes, so no more than
+        about `max_workers + 1` times that is held in memory at once.
+        """
+        found = self.iter_find_many(locations)
+        for (__, content), data in iter_concurrently(_spool_content, found, max_workers):
+            yield content, data
+
     def get_all_content_for_course(self, course_key, start=0, maxresults=-1, sort=None, filter_params=None):
         '''
         Returns a list of static assets for a course, followed by the total number of assets.
@@ -297,3 +354,44 @@ class ContentStore(object):
         an exception if unable to.
         """
         pass
+
+
+def _spool_content(found):
+    """
+    Returns a temporary file holding the data of the content in `found`, a (location, content) pair
+    from `ContentStore.iter_find_many`.
+    """
+    location, content = found
+    if content is None:
+        raise NotFoundError(location)
+    data = SpooledTemporaryFile(max_size=READ_MANY_SPOOL_SIZE)
+    for chunk in content.stream_data():
+        data.write(chunk)
+    data.seek(0)
+    return data
+
+
+def iter_concurrently(func, items, max_workers):
+    """
+    Yields (item, func(item)) for each of `items`, in order, while computing the results of the
+    next `max_workers` items in a pool of threads. The first exception raised by `func` is re-raised.
+    """
+    if max_workers <= 1:
+        for item in items:
+            yield item, func(item)
+        return
+
+    pool = ThreadPool(max_workers)
+    try:
+        pending = deque()
+        for item in items:
+            pending.append((item, pool.apply_async(func, (item,))))
+            if len(pending) > max_workers:
+                item, result = pending.popleft()
+                yield item, result.get()
+        while pending:
+            item, result = pending.popleft()
+            yield item, result.get()
+    finally:
+        pool.terminate()
+        pool.join()
@@ -1,12 +1,14 @@
 import pymongo
 import gridfs
-from gridfs.errors import NoFile
+from collections import defaultdict
+from gridfs.errors import NoFile, CorruptGridFile
 
 from xmodule.contentstore.content import XASSET_LOCATION_TAG
 
 import logging
+from functools import partial
 
-from .content import StaticContent, ContentStore, StaticContentStream
+from .content import StaticContent, ContentStore, StaticContentStream, iter_concurrently
 from xmodule.exceptions import NotFoundError
 from fs.osfs import OSFS
 import os
@@ -16,6 +18,12 @@ from opaque_keys.edx.keys import AssetKey
 from xmodule.modulestore.django import ASSET_IGNORE_REGEX
 from xmodule.util.misc import escape_invalid_characters
 
+# Number of assets whose data is read concurrently when exporting or copying all of a course's assets.
+BULK_READ_WORKERS = 4
+
+# Size of the reads made when writing out exported asset data.
+EXPORT_CHUNK_SIZE = 64 * 1024
+
 
 class MongoContentStore(ContentStore):
 
@@ -45,8 +53,10 @@ class MongoContentStore(ContentStore):
             _db.authenticate(user, password)
 
         self.fs = gridfs.GridFS(_db, bucket)
+        self.fs_root = _db[bucket]  # the root collection of the GridFS bucket
 
         self.fs_files = _db[bucket + ".files"]  # the underlying collection GridFS uses
+        self.fs_chunks = _db[bucket + ".chunks"]  # the underlying collection GridFS stores file data in
 
     def close_connections(self):
         """
@@ -129,9 +139,103 @@ class MongoContentStore(ContentStore):
             else:
                 return None
 
+    def find_many(self, locations, throw_on_not_found=False, as_stream=False):
+        """
+        See :meth:`.ContentStore.find_many`
+
+        Loads the metadata of all of the assets with a single query, and, unless `as_stream` is set, their
+        data with a single query on the GridFS chunks.
+        """
+        locations = list(locations)
+        content_ids = [self.asset_db_key(location)[0] for location in locations]
+        file_docs = self._find_file_documents(content_ids)
+        found = {}
+        missing = []
+        for location, content_id in zip(locations, content_ids):
+            file_doc = file_docs.get(_hashable_id(content_id))
+            if file_doc is None:
+                missing.append(content_id)
+            else:
+                found[location] = file_doc
+        if missing and throw_on_not_found:
+            raise NotFoundError(missing[0])
+
+        if as_stream:
+            return {
+                location: self._content_from_file_document(location, file_doc, stream=self._open_file(file_doc))
+                for location, file_doc in found.iteritems()
+            }
+        file_data = self._read_file_data(found.values())
+        return {
+            location: self._content_from_file_document(
+                location, file_doc, data=file_data[_hashable_id(file_doc['_id'])]
+            )
+            for location, file_doc in found.iteritems()
+        }
+
+    def _find_file_documents(self, content_ids):
+        """
+        Returns the GridFS file documents with the given ids, keyed by `_hashable_id` of their id.
+        """
+        if not content_ids:
+            return {}
+        file_docs = {}
+        for file_doc in self.fs_files.find({'_id': {'$in': content_ids}}):
+            self.make_id_son(file_doc)
+            file_docs[_hashable_id(file_doc['_id'])] = file_doc
+        return file_docs
+
+    def _read_file_data(self, file_docs):
+        """
+        Reads the data of all of the given GridFS files with a single query, rather than the query per
+        chunk `GridOut.read` makes. Returns a dict of the data, keyed by `_hashable_id` of the file ids.
+
+        The ids of `file_docs` must already have been put in order by `make_id_son`.
+        """
+        if not file_docs:
+            return {}
+        chunks = defaultdict(list)
+        for chunk in self.fs_chunks.find({'files_id': {'$in': [file_doc['_id'] for file_doc in file_docs]}}):
+            chunks[_hashable_id(chunk['files_id'])].append((chunk['n'], chunk['data']))
+
+        file_data = {}
+        for file_doc in file_docs:
+            key = _hashable_id(file_doc['_id'])
+            data = b''.join(chunk_data for __, chunk_data in sorted(chunks[key]))
+            if len(data) != file_doc['length']:
+                raise CorruptGridFile("missing chunks for file {}".format(file_doc['_id']))
+            file_data[key] = data
+        return file_data
+
+    def _open_file(self, file_doc):
+        """
+        Returns a GridOut which reads the data of the GridFS file `file_doc` a chunk at a time.
+        """
+        return gridfs.GridOut(self.fs_root, file_document=file_doc)
+
+    def _content_from_file_document(self, location, file_doc, data=None, stream=None):
+        """
+        Builds the StaticContent for the asset at `location` from its GridFS file document and data, or
+        a StaticContentStream if a `stream` to read the data from is given instead.
+        """
+        thumbnail_location = file_doc.get('thumbnail_location')
+        if thumbnail_location:
+            thumbnail_location = location.course_key.make_asset_key('thumbnail', thumbnail_location[4])
+        content_class, data = (StaticContentStream, stream) if stream is not None else (StaticContent, data)
+        return content_class(
+            location, file_doc.get('displayname'), file_doc.get('contentType'), data,
+            last_modified_at=file_doc.get('uploadDate'), thumbnail_location=thumbnail_location,
+            import_path=file_doc.get('import_path'), length=file_doc['length'], locked=file_doc.get('locked', False)
+        )
+
     def export(self, location, output_directory):
-        content = self.find(location)
+        content = self.find(location, as_stream=True)
+        self._export_content(content, content.stream_data(), output_directory)
 
+    def _export_content(self, content, chunks, output_directory):
+        """
+        Write `chunks`, the data of `content`, to a file under `output_directory`.
+        """
         filename = content.name
         if content.import_path is not None:
             output_directory = output_directory + '/' + os.path.dirname(content.import_path)
@@ -145,7 +249,8 @@ class MongoContentStore(ContentStore):
         disk_fs = OSFS(output_directory)
 
         with disk_fs.open(export_name, 'wb') as asset_file:
-            asset_file.write(content.data)
+            for chunk in chunks:
+                asset_file.write(chunk)
 
     def export_all_for_course(self, course_key, output_directory, assets_policy_file):
         """
@@ -161,16 +266,14 @@ class MongoContentStore(ContentStore):
         policy = {}
         assets, __ = self.get_all_content_for_course(course_key)
 
+        asset_keys = [asset['asset_key'] for asset in assets]
+        for content, data in self.iter_read_many(asset_keys, max_workers=BULK_READ_WORKERS):
+            try:
+                self._export_content(content, iter(partial(data.read, EXPORT_CHUNK_SIZE), b''), output_directory)
+            finally:
+                data.close()
+
         for asset in assets:
-            # TODO: On 6/19/14, I had to put a try/except around this
-            # to export a course. The course failed on JSON files in
-            # the /static/ directory placed in it with an import.
-            #
-            # If this hasn't been looked at in a while, remove this comment.
-            #
-            # When debugging course exports, this might be a good place
-            # to look. -- pmitros
-            self.export(asset['asset_key'], output_directory)
             for attr, value in asset.iteritems():
                 if attr not in ['_id', 'md5', 'uploadDate', 'length', 'chunkSize', 'asset_key']:
                     policy.setdefault(asset['asset_key'].name, {})[attr] = value
@@ -308,41 +411,53 @@ class MongoContentStore(ContentStore):
         """
         See :meth:`.ContentStore.copy_all_course_assets`
 
-        This implementation fairly expensively copies all of the data
+        This implementation fairly expensively copies all of the data. BULK_READ_WORKERS assets are copied
+        concurrently, each streamed from its source file into the copy a chunk at a time, so no asset is ever
+        held in memory whole.
         """
         source_query = query_for_course(source_course_key)
         # it'd be great to figure out how to do all of this on the db server and not pull the bits over
-        for asset in self.fs_files.find(source_query):
-            asset_key = self.make_id_son(asset)
-            # don't convert from string until fs access
-            source_content = self.fs.get(asset_key)
-            if isinstance(asset_key, basestring):
-                asset_key = AssetKey.from_string(asset_key)
-                __, asset_key = self.asset_db_key(asset_key)
-            asset_key['org'] = dest_course_key.org
-            asset_key['course'] = dest_course_key.course
-            if getattr(dest_course_key, 'deprecated', False):  # remove the run if exists
-                if 'run' in asset_key:
-                    del asset_key['run']
-                asset_id = asset_key
-            else:  # add the run, since it's the last field, we're golden
-                asset_key['run'] = dest_course_key.run
-                asset_id = unicode(
-                    dest_course_key.make_asset_key(asset_key['category'], asset_key['name']).for_branch(None)
-                )
+        copy_asset = partial(self._copy_asset, dest_course_key=dest_course_key)
+        for __ in iter_concurrently(copy_asset, self.fs_files.find(source_query), BULK_READ_WORKERS):
+            pass
 
-            self.fs.put(
-                source_content.read(),
-                _id=asset_id, filename=asset['filename'], content_type=asset['contentType'],
-                displayname=asset['displayname'], content_son=asset_key,
-                # thumbnail is not technically correct but will be functionally correct as the code
-                # only looks at the name which is not course relative.
-                thumbnail_location=asset['thumbnail_location'],
-                import_path=asset['import_path'],
-                # getattr b/c caching may mean some pickled instances don't have attr
-                locked=asset.get('locked', False)
+    def _copy_asset(self, asset, dest_course_key):
+        """
+        Save a copy of the asset whose GridFS file document is `asset` into `dest_course_key`.
+        """
+        self.make_id_son(asset)
+        data = self._open_file(asset)
+        asset_key = asset['_id']
+        # don't convert from string until fs access
+        if isinstance(asset_key, basestring):
+            asset_key = AssetKey.from_string(asset_key)
+            __, asset_key = self.asset_db_key(asset_key)
+        else:
+            asset_key = SON(asset_key)
+        asset_key['org'] = dest_course_key.org
+        asset_key['course'] = dest_course_key.course
+        if getattr(dest_course_key, 'deprecated', False):  # remove the run if exists
+            if 'run' in asset_key:
+                del asset_key['run']
+            asset_id = asset_key
+        else:  # add the run, since it's the last field, we're golden
+            asset_key['run'] = dest_course_key.run
+            asset_id = unicode(
+                dest_course_key.make_asset_key(asset_key['category'], asset_key['name']).for_branch(None)
             )
 
+        self.fs.put(
+            data,
+            _id=asset_id, filename=asset['filename'], content_type=asset['contentType'],
+            displayname=asset['displayname'], content_son=asset_key,
+            # thumbnail is not technically correct but will be functionally correct as the code
+            # only looks at the name which is not course relative.
+            thumbnail_location=asset['thumbnail_location'],
+            import_path=asset['import_path'],
+            # getattr b/c caching may mean some pickled instances don't have attr
+            locked=asset.get('locked', False)
+        )
+
     def delete_all_course_assets(self, course_key):
         """
         Delete all assets identified via this course_key. Dangerous operation which may remove assets
@@ -491,3 +606,14 @@ def query_for_course(course_key, category=None):
     else:
         dbkey['{}.run'.format(prefix)] = course_key.run
     return dbkey
+
+
+def _hashable_id(content_id):
+    """
+    Returns a hashable equivalent of a GridFS file id, which is either a string or a (SON) dict.
+
+    Ids read back from mongo are plain dicts, so the key doesn't depend on the order of their fields.
+    """
+    if isinstance(content_id, dict):
+        return tuple(sorted(content_id.items()))
+    return content_id
@@ -1,3 +1,4 @@
+from xmodule.contentstore.asset_index import invalidate_course_asset_index
 from xmodule.contentstore.content import StaticContent
 from .django import contentstore
 
@@ -42,3 +43,5 @@ def restore_asset_from_trashcan(location):
             store.save(thumbnail_content)
         except Exception:
             pass  # OK if this is left dangling
+
+    invalidate_course_asset_index(loc.course_key)
@@ -0,0 +1,95 @@
+"""
+Stores modulestore benchmark timings in the sqlite database read by generate_report.py.
+
+Timings go to the same `block_times` table that CodeBlockTimer writes to, with the run id set to
+the git commit being benchmarked, so the timings of different commits can be compared.
+"""
+import os
+import sqlite3
+import subprocess
+import time
+from contextlib import contextmanager
+
+from xmodule.modulestore.perf_tests.generate_report import DB_NAME
+
+# Set this environment variable to override the run id, which is otherwise the current git commit.
+RUN_ID_ENV_VAR = 'BENCHMARK_RUN_ID'
+
+BLOCK_TIMES_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS block_times (
+        id INTEGER PRIMARY KEY,
+        run_id VARCHAR(40) NOT NULL,
+        block_desc VARCHAR(120) NOT NULL,
+        elapsed FLOAT NOT NULL,
+        timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+def current_run_id():
+    """
+    Returns the run id to record timings under: the BENCHMARK_RUN_ID environment variable if set,
+    otherwise the current git commit.
+    """
+    run_id = os.environ.get(RUN_ID_ENV_VAR)
+    if run_id:
+        return run_id
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+class BenchmarkRecorder(object):
+    """
+    Records elapsed times, in milliseconds, of named blocks of code for a single benchmark run.
+    """
+    def __init__(self, db_name=DB_NAME, run_id=None):
+        self.db_name = db_name
+        self.run_id = run_id or current_run_id()
+        with self._connect() as conn:
+            conn.execute(BLOCK_TIMES_SCHEMA)
+
+    def _connect(self):
+        """
+        Open a connection to the timing database.
+        """
+        return sqlite3.connect(self.db_name)
+
+    def record(self, block_desc, elapsed):
+        """
+        Record that `block_desc` took `elapsed` milliseconds.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO block_times (run_id, block_desc, elapsed) VALUES (?, ?, ?)',
+                (self.run_id, block_desc, elapsed)
+            )
+
+    def time(self, block_desc, func, repeat=1):
+        """
+        Call `func` `repeat` times and record the fastest call as `block_desc`.
+
+        Returns the result of the last call.
+        """
+        best = None
+        result = None
+        for __ in xrange(repeat):
+            start = time.time()
+            result = func()
+            elapsed = (time.time() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        self.record(block_desc, best)
+        return result
+
+    @contextmanager
+    def timer(self, block_desc):
+        """
+        A context manager which records the time taken by its body as `block_desc`.
+        """
+        start = time.time()
+        yield
+        self.record(block_desc, (time.time() - start) * 1000)
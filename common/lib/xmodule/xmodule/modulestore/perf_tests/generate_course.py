@@ -0,0 +1,99 @@
+"""
+Generates synthetic courses of a configurable size and shape for modulestore benchmarks.
+"""
+import itertools
+
+# Formats used by the default grading policy - graded subsections cycle through these.
+GRADED_FORMATS = ('Homework', 'Lab', 'Midterm Exam', 'Final Exam')
+
+# A course shape is a list of (categories, count) pairs, one per level below the course.
+# Each parent at a level gets `count` children, whose category cycles through `categories`.
+COURSE_SHAPES = {
+    # 2 chapters, 4 subsections, 8 units and 24 components.
+    'small': (
+        (('chapter',), 2),
+        (('sequential',), 2),
+        (('vertical',), 2),
+        (('html', 'problem', 'video'), 3),
+    ),
+    # 10 chapters, 50 subsections, 200 units and 1,000 components.
+    'medium': (
+        (('chapter',), 10),
+        (('sequential',), 5),
+        (('vertical',), 4),
+        (('html', 'problem', 'video', 'problem', 'discussion'), 5),
+    ),
+    # 20 chapters, 200 subsections, 1,200 units and 9,600 components.
+    'large': (
+        (('chapter',), 20),
+        (('sequential',), 10),
+        (('vertical',), 6),
+        (('html', 'problem', 'video', 'problem'), 8),
+    ),
+    # A flat course with very wide units: 1 chapter, 2 subsections, 4 units and 400 components.
+    'wide': (
+        (('chapter',), 1),
+        (('sequential',), 2),
+        (('vertical',), 2),
+        (('problem', 'html'), 100),
+    ),
+}
+
+
+def course_size(shape):
+    """
+    Returns the number of blocks, not counting the course itself, in a course of the given shape.
+    """
+    size = 0
+    level_count = 1
+    for __, count in shape:
+        level_count *= count
+        size += level_count
+    return size
+
+
+def generate_course(store, user_id, org, course, run, shape, publish=True):
+    """
+    Create a course with the given `shape` (see COURSE_SHAPES) in `store`.
+
+    Subsections are graded, cycling through the formats of the default grading policy.
+
+    Returns the course's key and a dict mapping each category to the usage keys created in it.
+    """
+    created = {}
+    course_block = store.create_course(org, course, run, user_id)
+    course_key = course_block.id
+    with store.bulk_operations(course_key):
+        parents = [course_block.location]
+        for categories, count in shape:
+            category_cycle = itertools.cycle(categories)
+            children = []
+            for parent in parents:
+                for __ in xrange(count):
+                    category = next(category_cycle)
+                    fields = _fields_for(category, len(created.get(category, [])))
+                    child = store.create_child(user_id, parent, category, fields=fields)
+                    created.setdefault(category, []).append(child.location)
+                    children.append(child.location)
+            parents = children
+        if publish:
+            store.publish(course_block.location, user_id)
+    return course_key, created
+
+
+def _fields_for(category, index):
+    """
+    Field values for the `index`th block of the given category.
+    """
+    fields = {'display_name': u'{} {}'.format(category.capitalize(), index)}
+    if category == 'sequential':
+        fields['graded'] = True
+        fields['format'] = GRADED_FORMATS[index % len(GRADED_FORMATS)]
+    elif category == 'html':
+        fields['data'] = u'<p>Synthetic html block {}</p>'.format(index) * 20
+    elif category == 'problem':
+        fields['data'] = (
+            u'<problem><p>What is {0} + 1?</p>'
+            u'<numericalresponse answer="{1}"><formulaequationinput/></numericalresponse></problem>'
+        ).format(index, index + 1)
+    return fields
@@ -265,22 +265,120 @@ class FindReportGen(ReportGenerator):
         return html
 
 
+class BenchmarkReportGen(ReportGenerator):
+    """
+    Class which generates a per-commit comparison report for the modulestore benchmark data.
+    """
+    # Slowdowns of more than this fraction between runs are reported as regressions.
+    DEFAULT_THRESHOLD = 0.1
+
+    def __init__(self, db_name, threshold=DEFAULT_THRESHOLD):
+        super(BenchmarkReportGen, self).__init__(db_name)
+        self.threshold = threshold
+        self._read_timing_data()
+
+    def _read_timing_data(self):
+        """
+        Read in the timing data from the sqlite DB and save into a dict.
+        """
+        # { (modulestore, shape, operation): { run_id: duration, ...}, ...}.
+        self.run_data = {}
+        # Runs in the order they were first recorded.
+        self.run_ids = []
+
+        for row in sorted(self.all_rows, key=lambda row: row[0]):
+            desc_parts = row[2].split(':')
+            if desc_parts[0] != 'ModulestoreBenchmark' or len(desc_parts) != 4:
+                continue
+            run_id = row[1]
+            if run_id not in self.run_ids:
+                self.run_ids.append(run_id)
+            # Keep the fastest time if an operation was benchmarked more than once for the same run.
+            per_run = self.run_data.setdefault(tuple(desc_parts[1:]), {})
+            per_run[run_id] = min(row[3], per_run.get(run_id, row[3]))
+
+    def regressions(self, base_run=None, new_run=None):
+        """
+        Returns a list of (modulestore, shape, operation, base duration, new duration) for the operations
+        which got slower by more than the threshold between `base_run` and `new_run`, which default to the
+        last two runs.
+        """
+        if len(self.run_ids) < 2 and (base_run is None or new_run is None):
+            return []
+        base_run = base_run or self.run_ids[-2]
+        new_run = new_run or self.run_ids[-1]
+        slower = []
+        for key in sorted(self.run_data):
+            per_run = self.run_data[key]
+            if base_run not in per_run or new_run not in per_run or not per_run[base_run]:
+                continue
+            if per_run[new_run] > per_run[base_run] * (1 + self.threshold):
+                slower.append(key + (per_run[base_run], per_run[new_run]))
+        return slower
+
+    def generate_html(self):
+        """
+        Generate HTML.
+        """
+        html = HTMLDocument("Results")
+
+        html.add_header(1, "Duration (ms) per run")
+        columns = ["Modulestore", "Course Shape", "Operation"] + self.run_ids
+        if len(self.run_ids) >= 2:
+            columns.append("Change ({} -> {})".format(self.run_ids[-2], self.run_ids[-1]))
+        timing_table = HTMLTable(columns)
+        for key in sorted(self.run_data):
+            per_run = self.run_data[key]
+            row = list(key)
+            row.extend("{:.1f}".format(per_run[run_id]) if run_id in per_run else "" for run_id in self.run_ids)
+            if len(self.run_ids) >= 2:
+                base, new = per_run.get(self.run_ids[-2]), per_run.get(self.run_ids[-1])
+                row.append("{:+.1%}".format((new - base) / base) if base and new is not None else "")
+            timing_table.add_row(row)
+        html.add_to_body(timing_table.table)
+
+        html.add_header(1, "Regressions of more than {:.0%}".format(self.threshold))
+        regression_table = HTMLTable(["Modulestore", "Course Shape", "Operation", "Before (ms)", "After (ms)"])
+        for regression in self.regressions():
+            regression_table.add_row(list(regression[:3]) + ["{:.1f}".format(value) for value in regression[3:]])
+        html.add_to_body(regression_table.table)
+
+        return html
+
+
 if click is not None:
     @click.command()
     @click.argument('outfile', type=click.File('w'), default='-', required=False)
     @click.option('--db_name', help='Name of sqlite database from which to read data.', default=DB_NAME)
-    @click.option('--data_type', help='Data type to process. One of: "imp_exp" or "find"', default="find")
-    def cli(outfile, db_name, data_type):
+    @click.option(
+        '--data_type', help='Data type to process. One of: "imp_exp", "find" or "benchmark"', default="find"
+    )
+    @click.option(
+        '--threshold', type=click.FLOAT, default=BenchmarkReportGen.DEFAULT_THRESHOLD,
+        help='Slowdown between the last two runs reported as a regression, for "benchmark" data.'
+    )
+    @click.option(
+        '--fail_on_regression', is_flag=True, default=False,
+        help='Exit with an error if the "benchmark" data has regressions.'
+    )
+    def cli(outfile, db_name, data_type, threshold, fail_on_regression):
         """
         Generate an HTML report from the sqlite timing data.
         """
+        regressions = []
         if data_type == 'imp_exp':
             ie_gen = ImportExportReportGen(db_name)
             html = ie_gen.generate_html()
         elif data_type == 'find':
             f_gen = FindReportGen(db_name)
             html = f_gen.generate_html()
+        elif data_type == 'benchmark':
+            b_gen = BenchmarkReportGen(db_name, threshold)
+            html = b_gen.generate_html()
+            regressions = b_gen.regressions()
         click.echo(html.tostring(), file=outfile)
+        if fail_on_regression and regressions:
+            raise click.ClickException("{} benchmark regressions found.".format(len(regressions)))
 
 if __name__ == '__main__':
     if click is not None:
@@ -0,0 +1,58 @@
+"""
+Tests for recording modulestore benchmark timings and comparing them between runs.
+"""
+import os
+import unittest
+from shutil import rmtree
+from tempfile import mkdtemp
+
+from xmodule.modulestore.perf_tests.benchmark_storage import BenchmarkRecorder
+from xmodule.modulestore.perf_tests.generate_course import COURSE_SHAPES, course_size
+from xmodule.modulestore.perf_tests.generate_report import BenchmarkReportGen
+
+
+class TestBenchmarkReport(unittest.TestCase):
+    """
+    Tests for BenchmarkRecorder and BenchmarkReportGen.
+    """
+    def setUp(self):
+        super(TestBenchmarkReport, self).setUp()
+        temp_dir = mkdtemp()
+        self.addCleanup(rmtree, temp_dir)
+        self.db_name = os.path.join(temp_dir, 'block_times.db')
+
+    def _record(self, run_id, timings):
+        """
+        Record the {operation: elapsed} timings for the split store & small course under `run_id`.
+        """
+        recorder = BenchmarkRecorder(self.db_name, run_id=run_id)
+        for operation, elapsed in timings.iteritems():
+            recorder.record('ModulestoreBenchmark:split:small:{}'.format(operation), elapsed)
+
+    def test_regressions(self):
+        self._record('abc123', {'get_course': 100.0, 'get_items': 50.0, 'publish': 10.0})
+        self._record('def456', {'get_course': 105.0, 'get_items': 80.0, 'publish': 5.0})
+
+        report = BenchmarkReportGen(self.db_name, threshold=0.1)
+        self.assertEqual(report.run_ids, ['abc123', 'def456'])
+        self.assertEqual(report.regressions(), [('split', 'small', 'get_items', 50.0, 80.0)])
+        self.assertEqual(report.regressions(base_run='def456', new_run='abc123'), [
+            ('split', 'small', 'publish', 5.0, 10.0),
+        ])
+        self.assertIn('get_items', report.generate_html().tostring())
+
+    def test_single_run(self):
+        recorder = BenchmarkRecorder(self.db_name, run_id='abc123')
+        self.assertEqual(recorder.time('ModulestoreBenchmark:split:small:noop', lambda: 42, repeat=2), 42)
+        with recorder.timer('ModulestoreBenchmark:split:small:block'):
+            pass
+        # Not benchmark data, so ignored by the report.
+        recorder.record('XMLRoundTrip:mongo->split:10', 1.0)
+
+        report = BenchmarkReportGen(self.db_name)
+        self.assertEqual(sorted(report.run_data), [('split', 'small', 'block'), ('split', 'small', 'noop')])
+        self.assertEqual(report.regressions(), [])
+
+    def test_course_size(self):
+        self.assertEqual(course_size(COURSE_SHAPES['small']), 2 + 4 + 8 + 24)
+        self.assertEqual(course_size(COURSE_SHAPES['medium']), 10 + 50 + 200 + 1000)
@@ -0,0 +1,140 @@
+"""
+Benchmarks of common modulestore operations against synthetic courses, for both the old mongo
+and the split modulestores.
+
+Timings are stored in the sqlite database read by generate_report.py, under the current git commit,
+so that running the suite on two commits and generating a "benchmark" report shows regressions:
+
+    BENCHMARK_MODULESTORE=1 nosetests common/lib/xmodule/xmodule/modulestore/perf_tests/test_modulestore_benchmarks.py
+    python generate_report.py --data_type benchmark report.html
+
+The benchmarks need a local mongod.
+"""
+import itertools
+import os
+import unittest
+
+import ddt
+
+from xmodule.graders import Score, aggregate_scores
+from xmodule.modulestore import ModuleStoreEnum
+from xmodule.modulestore.perf_tests.benchmark_storage import BenchmarkRecorder
+from xmodule.modulestore.perf_tests.generate_course import COURSE_SHAPES, course_size, generate_course
+from xmodule.modulestore.tests.utils import (
+    MIXED_MODULESTORE_SETUPS,
+    MIXED_MS_SETUPS_SHORT,
+    MemoryCache,
+)
+from openedx.core.lib.block_cache.block_cache import get_blocks
+
+# Which of COURSE_SHAPES to benchmark, comma-separated.
+SHAPES = os.environ.get('BENCHMARK_COURSE_SHAPES', 'small,medium').split(',')
+
+# Each operation is run this many times, and the fastest run is recorded.
+REPEAT = int(os.environ.get('BENCHMARK_REPEAT', 3))
+
+# Number of blocks created inside a single bulk operation by the bulk_operations benchmark.
+BULK_OPERATION_BLOCKS = 50
+
+USER_ID = ModuleStoreEnum.UserID.test
+
+STORE_NAMES = dict(zip(MIXED_MODULESTORE_SETUPS, MIXED_MS_SETUPS_SHORT))
+
+
+@ddt.ddt
+@unittest.skipUnless(os.environ.get('BENCHMARK_MODULESTORE'), "Set BENCHMARK_MODULESTORE to run benchmarks.")
+class ModulestoreBenchmark(unittest.TestCase):
+    """
+    Times modulestore reads and writes for each combination of modulestore and course shape.
+    """
+
+    # Use this attribute to skip this test on regular unittest CI runs.
+    perf_test = True
+
+    def setUp(self):
+        super(ModulestoreBenchmark, self).setUp()
+        self.recorder = BenchmarkRecorder()
+
+    def _desc(self, store_builder, shape_name, operation):
+        """
+        The description timings are recorded under, of the form ModulestoreBenchmark:<store>:<shape>:<operation>.
+        """
+        return 'ModulestoreBenchmark:{}:{}:{}'.format(STORE_NAMES[store_builder], shape_name, operation)
+
+    @ddt.data(*itertools.product(MIXED_MODULESTORE_SETUPS, SHAPES))
+    @ddt.unpack
+    def test_benchmark(self, store_builder, shape_name):
+        """
+        Generate a course of the given shape and time operations on it.
+        """
+        shape = COURSE_SHAPES[shape_name]
+        with store_builder.build() as (__, store):
+            def timed(operation, func):
+                """ Time `func` as `operation`, returning its result. """
+                return self.recorder.time(self._desc(store_builder, shape_name, operation), func, repeat=REPEAT)
+
+            with self.recorder.timer(self._desc(store_builder, shape_name, 'generate_course')):
+                course_key, created = generate_course(store, USER_ID, 'bench', shape_name, 'run', shape)
+            self.assertEqual(sum(len(keys) for keys in created.itervalues()), course_size(shape))
+
+            with store.branch_setting(ModuleStoreEnum.Branch.published_only, course_key):
+                course = timed('get_course', lambda: store.get_course(course_key, depth=None))
+                timed('get_items', lambda: store.get_items(course_key))
+                timed('get_items_by_category', lambda: store.get_items(course_key, qualifiers={'category': 'problem'}))
+
+                leaf_keys = created[shape[-1][0][0]]
+                timed('get_parent_location', lambda: [store.get_parent_location(key) for key in leaf_keys])
+
+                timed('build_toc', lambda: self._build_toc(store.get_course(course_key, depth=2)))
+                timed('grade', lambda: self._grade(store.get_course(course_key, depth=None)))
+
+                cache = MemoryCache()
+                root = course.location
+                with self.recorder.timer(self._desc(store_builder, shape_name, 'get_blocks_uncached')):
+                    get_blocks(cache, store, None, root, [])
+                timed('get_blocks_cached', lambda: get_blocks(cache, store, None, root, []))
+
+            vertical_key = created['vertical'][0]
+            timed('publish', lambda: store.publish(vertical_key, USER_ID))
+            with self.recorder.timer(self._desc(store_builder, shape_name, 'bulk_operations')):
+                with store.bulk_operations(course_key):
+                    for __ in xrange(BULK_OPERATION_BLOCKS):
+                        store.create_child(USER_ID, vertical_key, 'html')
+
+    def _build_toc(self, course):
+        """
+        Read the fields the courseware table of contents shows, the way courseware's toc_for_course does.
+        """
+        toc = []
+        for chapter in course.get_children():
+            sections = [
+                {
+                    'display_name': section.display_name_with_default,
+                    'url_name': section.url_name,
+                    'format': section.format if section.format is not None else '',
+                    'due': section.due,
+                    'graded': section.graded,
+                }
+                for section in chapter.get_children()
+                if not section.hide_from_toc
+            ]
+            toc.append({'display_name': chapter.display_name_with_default, 'sections': sections})
+        return toc
+
+    def _grade(self, course):
+        """
+        Grade a student with full marks on every problem, doing the course traversal grades.grade does.
+        """
+        grade_sheet = {}
+        for section_format, sections in course.grading_context['graded_sections'].iteritems():
+            format_scores = []
+            for section in sections:
+                section_descriptor = section['section_descriptor']
+                scores = [
+                    Score(1, 1, True, section_descriptor.display_name_with_default, descriptor.location)
+                    for descriptor in section['xmoduledescriptors']
+                ]
+                __, graded_total = aggregate_scores(scores, section_descriptor.display_name_with_default)
+                format_scores.append(graded_total)
+            grade_sheet[section_format] = format_scores
+        return course.grader.grade(grade_sheet)
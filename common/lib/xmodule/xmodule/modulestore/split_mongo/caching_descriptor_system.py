@@ -17,7 +17,7 @@ from xmodule.modulestore.exceptions import ItemNotFoundError
 from xmodule.modulestore.inheritance import inheriting_field_data, InheritanceMixin
 from xmodule.modulestore.split_mongo import BlockKey, CourseEnvelope
 from xmodule.modulestore.split_mongo.id_manager import SplitMongoIdManager
-from xmodule.modulestore.split_mongo.definition_lazy_loader import DefinitionLazyLoader
+from xmodule.modulestore.split_mongo.definition_lazy_loader import DefinitionBatchLoader, DefinitionLazyLoader
 from xmodule.modulestore.split_mongo.split_mongo_kvs import SplitMongoKVS
 
 log = logging.getLogger(__name__)
@@ -79,6 +79,8 @@ class CachingDescriptorSystem(MakoDescriptorSystem, EditInfoRuntimeMixin):
         self.module_data = module_data
         self.default_class = default_class
         self.local_modules = {}
+        # lazily loaded definitions are fetched together on first access
+        self.definition_batch_loader = DefinitionBatchLoader(modulestore)
         self._services['library_tools'] = LibraryToolsService(modulestore)
 
     @lazy
@@ -188,6 +190,7 @@ class CachingDescriptorSystem(MakoDescriptorSystem, EditInfoRuntimeMixin):
                 block_key.type,
                 definition_id,
                 convert_fields,
+                batch_loader=self.definition_batch_loader,
             )
         else:
             definition_loader = None
@@ -1,6 +1,9 @@
 from opaque_keys.edx.locator import DefinitionLocator
 import copy
 
+# The most definitions a DefinitionBatchLoader loads in one query.
+DEFINITION_BATCH_SIZE = 500
+
 
 class DefinitionLazyLoader(object):
     """
@@ -9,16 +12,21 @@ class DefinitionLazyLoader(object):
     object doesn't force access during init but waits until client wants the
     definition. Only works if the modulestore is a split mongo store.
     """
-    def __init__(self, modulestore, course_key, block_type, definition_id, field_converter):
+    def __init__(self, modulestore, course_key, block_type, definition_id, field_converter, batch_loader=None):
         """
         Simple placeholder for yet-to-be-fetched data
         :param modulestore: the pymongo db connection with the definitions
         :param definition_locator: the id of the record in the above to fetch
+        :param batch_loader: an optional DefinitionBatchLoader to fetch the definition along with
+            the other definitions waiting to be loaded by the same runtime
         """
         self.modulestore = modulestore
         self.course_key = course_key
         self.definition_locator = DefinitionLocator(block_type, definition_id)
         self.field_converter = field_converter
+        self.batch_loader = batch_loader
+        if batch_loader is not None:
+            batch_loader.register(definition_id)
 
     def fetch(self):
         """
@@ -28,5 +36,53 @@ class DefinitionLazyLoader(object):
         # get_definition may return a cached value perhaps from another course or code path
         # so, we copy the result here so that updates don't cross-pollinate nor change the cached
         # value in such a way that we can't tell that the definition's been updated.
-        definition = self.modulestore.get_definition(self.course_key, self.definition_locator.definition_id)
+        if self.batch_loader is not None:
+            definition = self.batch_loader.fetch(self.course_key, self.definition_locator.definition_id)
+        else:
+            definition = self.modulestore.get_definition(self.course_key, self.definition_locator.definition_id)
         return copy.deepcopy(definition)
+
+
+class DefinitionBatchLoader(object):
+    """
+    Collects the ids of the definitions which a runtime's DefinitionLazyLoaders have yet to load,
+    so that the first one to be fetched loads them (up to DEFINITION_BATCH_SIZE) in a single query.
+    Siblings are usually accessed together (e.g. when rendering a vertical), so this saves a query
+    per block.
+
+    A runtime lives for a request at most, so the loaded definitions are held for as long as it is,
+    for any other blocks which share them.
+    """
+    def __init__(self, modulestore):
+        self.modulestore = modulestore
+        self._pending = set()
+        self._loaded = {}
+
+    def register(self, definition_id):
+        """
+        Note that the definition `definition_id` will need loading.
+        """
+        if definition_id not in self._loaded:
+            self._pending.add(definition_id)
+
+    def fetch(self, course_key, definition_id):
+        """
+        Return the definition `definition_id`, loading it along with all the pending definitions if it
+        isn't loaded yet. Returns None if there is no such definition.
+
+        Arguments:
+            course_key (:class:`.CourseKey`): The course the definition is being loaded for (to respect
+                bulk operations).
+            definition_id: The id of the definition to load
+        """
+        if definition_id not in self._loaded:
+            self._pending.discard(definition_id)
+            to_load = [definition_id]
+            while self._pending and len(to_load) < DEFINITION_BATCH_SIZE:
+                to_load.append(self._pending.pop())
+            self._loaded.update(dict.fromkeys(to_load))
+            self._loaded.update(
+                (definition['_id'], definition)
+                for definition in self.modulestore.get_definitions(course_key, to_load)
+            )
+        return self._loaded[definition_id]
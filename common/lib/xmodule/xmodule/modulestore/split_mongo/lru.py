@@ -0,0 +1,80 @@
+"""
+A small thread-safe, size-bounded least-recently-used cache for per-process caching of immutable
+split modulestore documents.
+"""
+import threading
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """
+    A dict-like cache which evicts its least recently used entries once the total size of its
+    values exceeds `max_size`.
+
+    The size of each value is given by `size_of` (by default, each value has a size of 1, so
+    `max_size` bounds the number of entries). Values larger than `max_size` are never cached.
+    """
+    def __init__(self, max_size, size_of=None):
+        self.max_size = max_size
+        self.size_of = size_of or (lambda value: 1)
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for `key` (marking it as most recently used), or `default`.
+        """
+        with self._lock:
+            try:
+                value, size = self._entries.pop(key)
+            except KeyError:
+                return default
+            self._entries[key] = (value, size)
+            return value
+
+    def set(self, key, value, size=None):
+        """
+        Cache `value` under `key`, evicting least recently used entries to make room for it.
+
+        `size` is the size of `value`, if already known; otherwise, it's measured with `size_of`.
+        """
+        if size is None:
+            size = self.size_of(value)
+        with self._lock:
+            self._discard(key)
+            if size > self.max_size:
+                return
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_size:
+                self._discard(next(iter(self._entries)))
+
+    def delete(self, key):
+        """
+        Remove `key` from the cache, if it's there.
+        """
+        with self._lock:
+            self._discard(key)
+
+    def clear(self):
+        """
+        Remove everything from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _discard(self, key):
+        """
+        Remove `key` from the cache. Must be called with the lock held.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
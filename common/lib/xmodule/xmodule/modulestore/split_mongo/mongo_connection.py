@@ -16,6 +16,7 @@ from pymongo.errors import DuplicateKeyError  # pylint: disable=unused-import
 
 try:
     from django.core.cache import caches, InvalidCacheBackendError
+    from django.core.cache.backends.dummy import DummyCache
     DJANGO_AVAILABLE = True
 except ImportError:
     DJANGO_AVAILABLE = False
@@ -27,6 +28,7 @@ from mongodb_proxy import autoretry_read, MongoProxy
 from xmodule.exceptions import HeartbeatFailure
 from xmodule.modulestore import BlockData
 from xmodule.modulestore.split_mongo import BlockKey
+from xmodule.modulestore.split_mongo.lru import LRUCache
 
 
 new_contract('BlockData', BlockData)
@@ -41,6 +43,17 @@ def get_cache(alias):
     return caches[alias]
 
 
+def caches_anything(cache):
+    """
+    Return whether the django cache `cache` actually stores anything (it isn't a DummyCache, as
+    it is under the test settings).
+
+    The per-process caches in front of the django cache are only used when it does, so that whether
+    a document is read from mongo doesn't depend on what was read earlier in the process.
+    """
+    return cache is not None and not isinstance(cache, DummyCache)
+
+
 def round_power_2(value):
     """
     Return value rounded up to the nearest power of 2.
@@ -159,6 +172,15 @@ class QueryTimer(object):
 
 TIMER = QueryTimer(__name__, 0.01)
 
+# Upper bound, in pickled bytes, of the structures cached (already converted) in each process by CourseStructureCache.
+STRUCTURE_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# Upper bound, in pickled bytes, of the definitions cached in each process by DefinitionCache.
+DEFINITION_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Prefix of the keys DefinitionCache uses in the shared cache, to keep them apart from structures.
+DEFINITION_CACHE_KEY_PREFIX = 'split.definition.'
+
 
 def structure_from_mongo(structure, course_context=None):
     """
@@ -222,14 +244,60 @@ def structure_to_mongo(structure, course_context=None):
         return new_structure
 
 
+def copy_structure(structure):
+    """
+    Return a copy of a structure converted by `structure_from_mongo` which can be modified the way
+    reads modify structures, without affecting `structure`.
+
+    The structure dict, its 'blocks' map, and each block's BlockData, `fields` dict and EditInfo are
+    copied; everything else (e.g. field values such as lists of children) is shared, so must only be
+    replaced, not changed in place. Structures are deep copied before they are changed for a new
+    version (see SplitMongoModuleStore.version_structure), so writes never change shared values.
+    """
+    new_structure = dict(structure)
+    new_structure['blocks'] = {
+        block_key: _copy_block_data(block)
+        for block_key, block in structure['blocks'].iteritems()
+    }
+    return new_structure
+
+
+def _copy_block_data(block):
+    """
+    Return a copy of the BlockData `block`, with its own `fields` dict and EditInfo.
+    """
+    new_block = _shallow_copy(block)
+    new_block.fields = dict(block.fields)
+    new_block.edit_info = _shallow_copy(block.edit_info)
+    return new_block
+
+
+def _shallow_copy(obj):
+    """
+    Return a shallow copy of the plain object `obj`; several times faster than `copy.copy`.
+    """
+    new_obj = obj.__class__.__new__(obj.__class__)
+    new_obj.__dict__.update(obj.__dict__)
+    return new_obj
+
+
 class CourseStructureCache(object):
     """
     Wrapper around django cache object to cache course structure objects.
     The course structures are pickled and compressed when cached.
 
+    In front of the django cache, the most recently used structures are kept already
+    converted in a per-process LRU, bounded by their pickled size, so that repeated
+    reads skip decompressing and unpickling. Every read gets its own `copy_structure`
+    of the cached structure, so callers may modify the structures they get in the
+    ways `copy_structure` allows.
+
     If the 'course_structure_cache' doesn't exist, then don't do anything for
-    for set and get.
+    for set and get; if it's a dummy cache, then don't use the per-process LRU either.
     """
+    # Shared by every CourseStructureCache in the process.
+    local_cache = LRUCache(STRUCTURE_CACHE_MAX_BYTES)
+
     def __init__(self):
         self.cache = None
         if DJANGO_AVAILABLE:
@@ -237,13 +305,24 @@ class CourseStructureCache(object):
                 self.cache = get_cache('course_structure_cache')
             except InvalidCacheBackendError:
                 pass
+        self.use_local_cache = caches_anything(self.cache)
 
     def get(self, key, course_context=None):
-        """Pull the compressed, pickled struct data from cache and deserialize."""
+        """
+        Return the structure from the process cache, or pull the compressed, pickled
+        struct data from cache and deserialize.
+        """
         if self.cache is None:
             return None
 
         with TIMER.timer("CourseStructureCache.get", course_context) as tagger:
+            if self.use_local_cache:
+                structure = self.local_cache.get(key)
+                tagger.tag(from_local_cache=str(structure is not None).lower())
+                tagger.measure('local_cache_size', self.local_cache.size)
+                if structure is not None:
+                    return copy_structure(structure)
+
             compressed_pickled_data = self.cache.get(key)
             tagger.tag(from_cache=str(compressed_pickled_data is not None).lower())
 
@@ -257,7 +336,10 @@ class CourseStructureCache(object):
             pickled_data = zlib.decompress(compressed_pickled_data)
             tagger.measure('uncompressed_size', len(pickled_data))
 
-            return pickle.loads(pickled_data)
+            structure = pickle.loads(pickled_data)
+            if self.use_local_cache:
+                self.local_cache.set(key, copy_structure(structure), size=len(pickled_data))
+            return structure
 
     def set(self, key, structure, course_context=None):
         """Given a structure, will pickle, compress, and write to cache."""
@@ -267,6 +349,8 @@ class CourseStructureCache(object):
         with TIMER.timer("CourseStructureCache.set", course_context) as tagger:
             pickled_data = pickle.dumps(structure, pickle.HIGHEST_PROTOCOL)
             tagger.measure('uncompressed_size', len(pickled_data))
+            if self.use_local_cache:
+                self.local_cache.set(key, copy_structure(structure), size=len(pickled_data))
 
             # 1 = Fastest (slightly larger results)
             compressed_pickled_data = zlib.compress(pickled_data, 1)
@@ -276,6 +360,92 @@ class CourseStructureCache(object):
             self.cache.set(key, compressed_pickled_data, None)
 
 
+class DefinitionCache(object):
+    """
+    Read-through cache of definition documents, in front of the definitions collection.
+
+    Definitions are immutable (changing a definition's fields creates a new definition with a new id),
+    so they are cached without a timeout: first in a bounded per-process LRU of pickled documents,
+    then in the 'course_structure_cache' django cache, compressed like structures are. Every read
+    unpickles a fresh copy, so callers are free to modify the definitions they get.
+
+    If the 'course_structure_cache' doesn't exist, then don't do anything for get and set; if it's a
+    dummy cache, then don't use the per-process LRU either.
+    """
+    # Shared by every DefinitionCache in the process.
+    local_cache = LRUCache(DEFINITION_CACHE_MAX_BYTES, size_of=len)
+
+    def __init__(self):
+        self.cache = None
+        if DJANGO_AVAILABLE:
+            try:
+                self.cache = get_cache('course_structure_cache')
+            except InvalidCacheBackendError:
+                pass
+        self.use_local_cache = caches_anything(self.cache)
+
+    def get_many(self, keys, course_context=None):
+        """
+        Return a dict of the definitions cached for any of `keys`, keyed by definition id.
+        """
+        if self.cache is None or not keys:
+            return {}
+
+        with TIMER.timer("DefinitionCache.get_many", course_context) as tagger:
+            tagger.measure('requested', len(keys))
+            definitions = {}
+            missing = []
+            for key in keys:
+                pickled_data = self.local_cache.get(key) if self.use_local_cache else None
+                if pickled_data is None:
+                    missing.append(key)
+                else:
+                    definitions[key] = pickle.loads(pickled_data)
+            tagger.measure('local_hits', len(definitions))
+
+            if missing:
+                cached = self.cache.get_many([DEFINITION_CACHE_KEY_PREFIX + str(key) for key in missing])
+                for key in missing:
+                    compressed_pickled_data = cached.get(DEFINITION_CACHE_KEY_PREFIX + str(key))
+                    if compressed_pickled_data is not None:
+                        pickled_data = zlib.decompress(compressed_pickled_data)
+                        if self.use_local_cache:
+                            self.local_cache.set(key, pickled_data)
+                        definitions[key] = pickle.loads(pickled_data)
+
+            tagger.measure('misses', len(keys) - len(definitions))
+            return definitions
+
+    def set_many(self, definitions, course_context=None):
+        """
+        Cache each of the given definition documents under its id.
+        """
+        if self.cache is None or not definitions:
+            return
+
+        with TIMER.timer("DefinitionCache.set_many", course_context) as tagger:
+            tagger.measure('definitions', len(definitions))
+            to_cache = {}
+            for definition in definitions:
+                pickled_data = pickle.dumps(definition, pickle.HIGHEST_PROTOCOL)
+                if self.use_local_cache:
+                    self.local_cache.set(definition['_id'], pickled_data)
+                # 1 = Fastest (slightly larger results)
+                to_cache[DEFINITION_CACHE_KEY_PREFIX + str(definition['_id'])] = zlib.compress(pickled_data, 1)
+
+            # Definitions are immutable, so we set a timeout of "never"
+            self.cache.set_many(to_cache, None)
+
+
+def clear_process_caches():
+    """
+    Empty the per-process caches of split modulestore documents. Tests which drop the documents
+    between tests must call this too.
+    """
+    CourseStructureCache.local_cache.clear()
+    DefinitionCache.local_cache.clear()
+
+
 class MongoConnection(object):
     """
     Segregation of pymongo functions from the data modeling mechanisms for split modulestore.
@@ -509,9 +679,17 @@ class MongoConnection(object):
     def get_definition(self, key, course_context=None):
         """
         Get the definition from the persistence mechanism whose id is the given key
+
+        This method will use a cached version of the definition if it is available.
         """
         with TIMER.timer("get_definition", course_context) as tagger:
-            definition = self.definitions.find_one({'_id': key})
+            cache = DefinitionCache()
+            definition = cache.get_many([key], course_context).get(key)
+            tagger.tag(from_cache=str(definition is not None).lower())
+            if definition is None:
+                definition = self.definitions.find_one({'_id': key})
+                if definition is not None:
+                    cache.set_many([definition], course_context)
             tagger.measure("fields", len(definition['fields']))
             tagger.tag(block_type=definition['block_type'])
             return definition
@@ -519,11 +697,22 @@ class MongoConnection(object):
     def get_definitions(self, definitions, course_context=None):
         """
         Retrieve all definitions listed in `definitions`.
+
+        Definitions that are cached are not queried for; the rest are read in a single query.
         """
         with TIMER.timer("get_definitions", course_context) as tagger:
             tagger.measure('definitions', len(definitions))
-            definitions = self.definitions.find({'_id': {'$in': definitions}})
-            return definitions
+            cache = DefinitionCache()
+            cached = cache.get_many(definitions, course_context)
+            tagger.measure('from_cache', len(cached))
+
+            results = cached.values()
+            missing = [key for key in definitions if key not in cached]
+            if missing:
+                from_db = list(self.definitions.find({'_id': {'$in': missing}}))
+                cache.set_many(from_db, course_context)
+                results.extend(from_db)
+            return results
 
     def insert_definition(self, definition, course_context=None):
         """
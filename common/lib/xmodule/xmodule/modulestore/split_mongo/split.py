@@ -432,6 +432,8 @@ class SplitBulkWriteMixin(BulkOperationsMixin):
             defs_from_db = self.db_connection.get_definitions(list(ids), course_key)
             # Add the retrieved definitions to the cache.
             bulk_write_record.definitions.update({d.get('_id'): d for d in defs_from_db})
+            if bulk_write_record.active:
+                bulk_write_record.definitions_in_db.update(d.get('_id') for d in defs_from_db)
             definitions.extend(defs_from_db)
         return definitions
 
@@ -0,0 +1,361 @@
+"""
+Support for streaming a courselike export straight into a gzip-compressed tar archive.
+
+The XML exporter writes every block, policy and asset through a pyfilesystem-style object
+(`runtime.export_fs`). `TarStreamFS` implements the subset of that interface the exporter
+uses, but instead of creating files on disk it appends each file to a tar stream as soon as
+the file is closed. The archive can therefore be written to any file-like sink (an HTTP
+response, a chunked storage upload, ...) without staging the whole course on local disk.
+"""
+import json
+import logging
+import os
+import tarfile
+import threading
+import time
+import Queue
+from StringIO import StringIO
+from tempfile import SpooledTemporaryFile
+
+from fs.errors import UnsupportedError
+from fs.path import normpath, pathjoin, dirname
+
+from xmodule.util.misc import escape_invalid_characters
+
+try:
+    from django.conf import settings as django_settings
+    from django.db import connections
+    DJANGO_AVAILABLE = True
+except ImportError:
+    DJANGO_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+
+# Files bigger than this are spooled to a temporary file while being written, instead of memory.
+SPOOL_MAX_SIZE = 1024 * 1024
+
+# Default number of assets whose data is read from the contentstore concurrently.
+ASSET_READ_WORKERS = 4
+
+# Size of the chunks yielded by `iter_export_tarball`.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of chunks buffered between the export thread and the consumer.
+STREAM_QUEUE_SIZE = 16
+
+# Asset attributes which are not exported to policies/assets.json.
+ASSET_POLICY_IGNORED_ATTRS = ['_id', 'md5', 'uploadDate', 'length', 'chunkSize', 'asset_key']
+
+
+class _TarArchive(object):
+    """
+    The tar stream shared by a `TarStreamFS` and all of the directories opened from it.
+    """
+    def __init__(self, fileobj):
+        self.tar = tarfile.open(fileobj=fileobj, mode='w|gz')
+        self.dirs = set([u''])
+        self.files = set()
+        self.lock = threading.RLock()
+
+    def _tarinfo(self, path, **kwargs):
+        """
+        Build a TarInfo for `path`, with ownership and times set the way a freshly written file would have them.
+        """
+        tarinfo = tarfile.TarInfo(name=path.encode('utf-8') if isinstance(path, unicode) else path)
+        tarinfo.mtime = time.time()
+        for attr, value in kwargs.iteritems():
+            setattr(tarinfo, attr, value)
+        return tarinfo
+
+    def add_dir(self, path):
+        """
+        Add `path` and any of its missing parents to the archive as directory entries.
+        """
+        with self.lock:
+            if path in self.dirs:
+                return
+            self.add_dir(dirname(path))
+            self.tar.addfile(self._tarinfo(path, type=tarfile.DIRTYPE, mode=0755))
+            self.dirs.add(path)
+
+    def add_file(self, path, fileobj, size):
+        """
+        Add `size` bytes read from `fileobj` to the archive as the file `path`.
+        """
+        with self.lock:
+            self.add_dir(dirname(path))
+            self.tar.addfile(self._tarinfo(path, size=size, mode=0644), fileobj)
+            self.files.add(path)
+
+    def close(self):
+        """
+        Write the end-of-archive marker and flush the compressor.
+        """
+        with self.lock:
+            self.tar.close()
+
+
+class _TarMemberFile(object):
+    """
+    A writable file which is added to the archive when it is closed.
+    """
+    def __init__(self, archive, path):
+        self._archive = archive
+        self._path = path
+        self._buffer = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        self.closed = False
+
+    def write(self, data):
+        self._buffer.write(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        size = self._buffer.tell()
+        self._buffer.seek(0)
+        try:
+            self._archive.add_file(self._path, self._buffer, size)
+        finally:
+            self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class TarStreamFS(object):
+    """
+    A write-only filesystem which streams everything written to it into a .tar.gz archive.
+
+    Only the operations the XML exporter relies on are supported. Files become part of the archive
+    when they are closed, so they can't be read back or rewritten; `exists` only reports on what
+    has already been written.
+    """
+    def __init__(self, fileobj=None, prefix=u'', archive=None):
+        """
+        `fileobj`: the file-like object the compressed archive is written to
+        `prefix`: the directory inside the archive which this filesystem is rooted at
+        """
+        self._archive = archive if archive is not None else _TarArchive(fileobj)
+        self._prefix = normpath(prefix).strip(u'/') if prefix else u''
+        if self._prefix:
+            self._archive.add_dir(self._prefix)
+
+    def _archive_path(self, path):
+        """
+        Map `path` relative to this filesystem onto the path inside the archive.
+        """
+        path = normpath(path).strip(u'/')
+        return pathjoin(self._prefix, path).strip(u'/') if self._prefix else path
+
+    def exists(self, path):
+        archive_path = self._archive_path(path)
+        return archive_path in self._archive.dirs or archive_path in self._archive.files
+
+    def isdir(self, path):
+        return self._archive_path(path) in self._archive.dirs
+
+    def isfile(self, path):
+        return self._archive_path(path) in self._archive.files
+
+    def makedir(self, path, recursive=False, allow_recreate=False):  # pylint: disable=unused-argument
+        """
+        Add a directory to the archive. Parents are always created, as tar has no notion of a missing parent.
+        """
+        self._archive.add_dir(self._archive_path(path))
+
+    def makeopendir(self, path, recursive=False):
+        self.makedir(path, recursive=recursive, allow_recreate=True)
+        return self.opendir(path)
+
+    def opendir(self, path):
+        return TarStreamFS(prefix=self._archive_path(path), archive=self._archive)
+
+    def open(self, path, mode='r', **kwargs):  # pylint: disable=unused-argument
+        if 'w' not in mode:
+            raise UnsupportedError('open', path=path, msg="TarStreamFS only supports opening files for writing")
+        return _TarMemberFile(self._archive, self._archive_path(path))
+
+    def setcontents(self, path, data=b'', **kwargs):  # pylint: disable=unused-argument
+        """
+        Add a file with the given contents, a string or a seekable file, to the archive without
+        buffering a copy of it.
+        """
+        if hasattr(data, 'read'):
+            data.seek(0, os.SEEK_END)
+            size = data.tell()
+            data.seek(0)
+            self._archive.add_file(self._archive_path(path), data, size)
+            return
+        if isinstance(data, unicode):
+            data = data.encode('utf-8')
+        self._archive.add_file(self._archive_path(path), StringIO(data), len(data))
+
+    def close(self):
+        """
+        Finish the archive. Only the root filesystem should be closed.
+        """
+        self._archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Don't terminate the archive if the export failed, so that it can't be mistaken for a complete one.
+        if exc_type is None:
+            self.close()
+
+
+def export_assets_to_fs(contentstore, course_key, export_fs, max_workers=ASSET_READ_WORKERS):
+    """
+    Export all of the course's static assets into `static/` and their attributes into
+    `policies/assets.json` of `export_fs`.
+
+    This is the filesystem-agnostic equivalent of `contentstore.export_all_for_course`. The data of
+    `max_workers` assets is read from the contentstore concurrently (see `ContentStore.iter_read_many`)
+    while the assets are written out in order.
+    """
+    policy = {}
+    assets, __ = contentstore.get_all_content_for_course(course_key)
+
+    asset_keys = [asset['asset_key'] for asset in assets]
+    for content, data in contentstore.iter_read_many(asset_keys, max_workers=max(max_workers, 1)):
+        try:
+            output_dir = u'static'
+            if content.import_path is not None:
+                output_dir = pathjoin(output_dir, os.path.dirname(content.import_path))
+            export_fs.makedir(output_dir, recursive=True, allow_recreate=True)
+            export_name = escape_invalid_characters(name=content.name, invalid_char_list=['/', '\\'])
+            export_fs.setcontents(pathjoin(output_dir, export_name), data)
+        finally:
+            data.close()
+
+    for asset in assets:
+        for attr, value in asset.iteritems():
+            if attr not in ASSET_POLICY_IGNORED_ATTRS:
+                policy.setdefault(asset['asset_key'].name, {})[attr] = value
+
+    export_fs.makedir(u'policies', recursive=True, allow_recreate=True)
+    with export_fs.open(u'policies/assets.json', 'w') as policy_file:
+        json.dump(policy, policy_file, sort_keys=True, indent=4)
+
+
+class _QueueWriter(object):
+    """
+    A file-like sink which hands the compressed archive to a consumer thread through a bounded queue.
+    """
+    def __init__(self, queue, cancelled):
+        self._queue = queue
+        self._cancelled = cancelled
+        self._buffer = []
+        self._buffered = 0
+
+    def _put(self, item):
+        """
+        Block until the consumer has room for `item`, giving up if the consumer went away.
+        """
+        while True:
+            if self._cancelled.is_set():
+                raise IOError("Export stream was closed by the consumer")
+            try:
+                self._queue.put(item, timeout=1)
+                return
+            except Queue.Full:
+                continue
+
+    def write(self, data):
+        self._buffer.append(data)
+        self._buffered += len(data)
+        if self._buffered >= STREAM_CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self._buffered:
+            self._put(b''.join(self._buffer))
+            self._buffer = []
+            self._buffered = 0
+
+    def finish(self, error=None):
+        """
+        Flush what's left and signal the end of the stream (or the error which ended it) to the consumer.
+        """
+        if error is None:
+            self.flush()
+        self._put(_StreamEnd(error))
+
+
+class _StreamEnd(object):
+    """
+    Sentinel marking the end of the export stream.
+    """
+    def __init__(self, error=None):
+        self.error = error
+
+
+def _close_db_connections():
+    """
+    Close the Django database connections opened by the current thread, which Django only closes
+    by itself for the thread handling a request.
+    """
+    if DJANGO_AVAILABLE and django_settings.configured:
+        for connection in connections.all():
+            connection.close()
+
+
+def iter_export_tarball(export_manager):
+    """
+    Run `export_manager.export_to_stream` in a background thread and yield the .tar.gz archive in chunks,
+    e.g. for use as the content of a `StreamingHttpResponse`.
+
+    Only a bounded number of chunks is buffered, so a slow consumer throttles the export. If the consumer
+    stops iterating, the export is abandoned. An exception raised by the export is re-raised here.
+    """
+    chunks = Queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+    cancelled = threading.Event()
+    writer = _QueueWriter(chunks, cancelled)
+
+    def produce():
+        """
+        Export into the queue, reporting how it ended.
+        """
+        try:
+            try:
+                export_manager.export_to_stream(writer)
+            finally:
+                _close_db_connections()
+        except Exception as exc:  # pylint: disable=broad-except
+            if not cancelled.is_set():
+                log.exception(u'Streaming export of %s failed', export_manager.courselike_key)
+            try:
+                writer.finish(exc)
+            except IOError:
+                pass
+        else:
+            try:
+                writer.finish()
+            except IOError:
+                pass
+
+    producer = threading.Thread(target=produce, name='export-{}'.format(export_manager.courselike_key))
+    producer.daemon = True
+    producer.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if isinstance(chunk, _StreamEnd):
+                if chunk.error is not None:
+                    raise chunk.error
+                return
+            yield chunk
+    finally:
+        cancelled.set()
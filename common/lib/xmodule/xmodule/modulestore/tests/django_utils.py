@@ -19,6 +19,7 @@ from openedx.core.lib.tempdir import mkdtemp_clean
 from xmodule.contentstore.django import _CONTENTSTORE
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.django import modulestore, clear_existing_modulestores
+from xmodule.modulestore.split_mongo.mongo_connection import clear_process_caches
 from xmodule.modulestore.tests.mongo_connection import MONGO_PORT_NUM, MONGO_HOST
 from xmodule.modulestore.tests.factories import XMODULE_FACTORY_LOCK
 
@@ -261,6 +262,7 @@ class SharedModuleStoreTestCase(TestCase):
         cls._settings_override.__enter__()
         XMODULE_FACTORY_LOCK.enable()
         clear_existing_modulestores()
+        clear_process_caches()
         cls.store = modulestore()
 
     @classmethod
@@ -380,6 +382,8 @@ class ModuleStoreTestCase(TestCase):
         # Clear out any existing modulestores,
         # which will cause them to be re-created
         clear_existing_modulestores()
+        # ... and anything they read which outlived them
+        clear_process_caches()
 
         self.addCleanup(drop_mongo_collections)
         self.addCleanup(RequestCache().clear_request_cache)
@@ -13,7 +13,7 @@ from opaque_keys.edx.locator import CourseLocator, AssetLocator
 from opaque_keys.edx.keys import AssetKey
 from xmodule.tests import DATA_DIR
 from xmodule.contentstore.mongo import MongoContentStore
-from xmodule.contentstore.content import StaticContent
+from xmodule.contentstore.content import StaticContent, StaticContentStream
 from xmodule.exceptions import NotFoundError
 import ddt
 from __builtin__ import delattr
@@ -124,6 +124,62 @@ class TestContentstore(unittest.TestCase):
             "Found unknown asset {}".format(unknown_asset)
         )
 
+    @ddt.data(True, False)
+    def test_find_many(self, deprecated):
+        """
+        Test using find_many
+        """
+        self.set_up_assets(deprecated)
+        asset_keys = [self.course1_key.make_asset_key('asset', filename) for filename in self.course1_files]
+        unknown_asset = self.course1_key.make_asset_key('asset', 'no_such_file.gif')
+
+        found = self.contentstore.find_many(asset_keys + [unknown_asset])
+        self.assertEqual(set(found), set(asset_keys))
+        for asset_key in asset_keys:
+            expected = self.contentstore.find(asset_key)
+            for propname in ['name', 'content_type', 'data', 'length', 'locked', 'import_path', 'thumbnail_location']:
+                self.assertEqual(getattr(found[asset_key], propname), getattr(expected, propname))
+
+        with self.assertRaises(NotFoundError):
+            self.contentstore.find_many(asset_keys + [unknown_asset], throw_on_not_found=True)
+
+    @ddt.data(True, False)
+    def test_iter_find_many(self, deprecated):
+        """
+        Test iter_find_many with concurrent batches
+        """
+        self.set_up_assets(deprecated)
+        asset_keys = [self.course1_key.make_asset_key('asset', filename) for filename in self.course1_files]
+        unknown_asset = self.course1_key.make_asset_key('asset', 'no_such_file.gif')
+        results = list(self.contentstore.iter_find_many(asset_keys + [unknown_asset], batch_size=1, max_workers=2))
+        self.assertEqual([asset_key for asset_key, __ in results], asset_keys + [unknown_asset])
+        # The data is only read when the content is streamed
+        for __, content in results[:-1]:
+            self.assertIsInstance(content, StaticContentStream)
+        self.assertEqual(
+            [''.join(content.stream_data()) for __, content in results[:-1]],
+            [self.contentstore.find(asset_key).data for asset_key in asset_keys]
+        )
+        self.assertIsNone(results[-1][1])
+
+    @ddt.data(True, False)
+    def test_iter_read_many(self, deprecated):
+        """
+        Test iter_read_many with concurrent reads
+        """
+        self.set_up_assets(deprecated)
+        asset_keys = [self.course1_key.make_asset_key('asset', filename) for filename in self.course1_files]
+        results = list(self.contentstore.iter_read_many(asset_keys, max_workers=2))
+        self.assertEqual([content.location for content, __ in results], asset_keys)
+        self.assertEqual(
+            [data.read() for __, data in results],
+            [self.contentstore.find(asset_key).data for asset_key in asset_keys]
+        )
+
+        unknown_asset = self.course1_key.make_asset_key('asset', 'no_such_file.gif')
+        with self.assertRaises(NotFoundError):
+            list(self.contentstore.iter_read_many(asset_keys + [unknown_asset], max_workers=2))
+
     @ddt.data(True, False)
     def test_export_for_course(self, deprecated):
         """
@@ -191,7 +247,7 @@ class TestContentstore(unittest.TestCase):
             dest_key = dest_course.make_asset_key('asset', filename)
             source = self.contentstore.find(asset_key)
             copied = self.contentstore.find(dest_key)
-            for propname in ['name', 'content_type', 'length', 'locked']:
+            for propname in ['name', 'content_type', 'length', 'locked', 'data']:
                 self.assertEqual(getattr(source, propname), getattr(copied, propname))
 
         __, count = self.contentstore.get_all_content_for_course(dest_course)
@@ -0,0 +1,93 @@
+"""
+Tests for the split modulestore's LRUCache and batched loading of lazy definitions.
+"""
+import unittest
+
+from bson import ObjectId
+from mock import Mock
+
+from xmodule.modulestore.split_mongo.definition_lazy_loader import DefinitionBatchLoader, DefinitionLazyLoader
+from xmodule.modulestore.split_mongo.lru import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Tests for LRUCache.
+    """
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(3)
+        for key in 'abc':
+            cache.set(key, key.upper())
+        self.assertEqual(cache.get('a'), 'A')
+        cache.set('d', 'D')
+        self.assertNotIn('b', cache)
+        self.assertEqual([cache.get(key) for key in 'acd'], ['A', 'C', 'D'])
+
+    def test_size_of(self):
+        cache = LRUCache(10, size_of=len)
+        cache.set('a', 'x' * 6)
+        cache.set('b', 'x' * 4)
+        self.assertEqual(cache.size, 10)
+        cache.set('a', 'x' * 2)
+        self.assertEqual(cache.size, 6)
+        cache.set('c', 'x' * 5)
+        self.assertEqual((len(cache), cache.size), (2, 7))
+        self.assertIsNone(cache.get('b'))
+
+        # too big to ever cache
+        cache.set('d', 'x' * 11)
+        self.assertNotIn('d', cache)
+
+        # sizes measured by the caller
+        cache.set('e', object(), size=3)
+        self.assertEqual(cache.size, 10)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+
+class TestDefinitionBatchLoader(unittest.TestCase):
+    """
+    Tests for DefinitionBatchLoader.
+    """
+    def setUp(self):
+        super(TestDefinitionBatchLoader, self).setUp()
+        self.ids = [ObjectId() for __ in range(4)]
+        # the last id has no definition
+        self.definitions = {
+            definition_id: {'_id': definition_id, 'fields': {'data': str(definition_id)}}
+            for definition_id in self.ids[:3]
+        }
+        self.modulestore = Mock()
+        self.modulestore.get_definitions.side_effect = lambda course_key, ids: [
+            self.definitions[definition_id] for definition_id in ids if definition_id in self.definitions
+        ]
+        self.batch_loader = DefinitionBatchLoader(self.modulestore)
+
+    def _loader(self, definition_id):
+        """
+        A lazy loader of `definition_id` using the batch loader.
+        """
+        return DefinitionLazyLoader(
+            self.modulestore, Mock(), 'html', definition_id, lambda fields: fields, batch_loader=self.batch_loader
+        )
+
+    def test_siblings_loaded_together(self):
+        loaders = [self._loader(definition_id) for definition_id in self.ids]
+        self.assertEqual(
+            [loader.fetch() for loader in loaders],
+            [self.definitions[definition_id] for definition_id in self.ids[:3]] + [None]
+        )
+        self.assertEqual(self.modulestore.get_definitions.call_count, 1)
+        self.assertEqual(set(self.modulestore.get_definitions.call_args[0][1]), set(self.ids))
+        self.assertFalse(self.modulestore.get_definition.called)
+
+    def test_fetched_copies(self):
+        definition_id = self.ids[0]
+        definition = self._loader(definition_id).fetch()
+        definition['fields']['data'] = 'changed'
+        self.assertEqual(self.definitions[definition_id]['fields']['data'], str(definition_id))
+
+        # another block sharing the definition gets it without loading it again, unchanged
+        self.assertEqual(self._loader(definition_id).fetch(), self.definitions[definition_id])
+        self.assertEqual(self.modulestore.get_definitions.call_count, 1)
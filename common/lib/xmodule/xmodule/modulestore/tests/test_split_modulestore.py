@@ -29,6 +29,9 @@ from ccx_keys.locator import CCXBlockUsageLocator
 from xmodule.modulestore.inheritance import InheritanceMixin
 from xmodule.x_module import XModuleMixin
 from xmodule.fields import Date, Timedelta
+from xmodule.modulestore.split_mongo.mongo_connection import (
+    CourseStructureCache, DefinitionCache, clear_process_caches
+)
 from xmodule.modulestore.split_mongo.split import SplitMongoModuleStore
 from xmodule.modulestore.tests.test_modulestore import check_has_course_method
 from xmodule.modulestore.split_mongo import BlockKey
@@ -537,6 +540,7 @@ class SplitModuleTest(unittest.TestCase):
 
     def setUp(self):
         super(SplitModuleTest, self).setUp()
+        clear_process_caches()
         self.user_id = random.getrandbits(32)
 
     def tearDown(self):
@@ -940,12 +944,15 @@ class TestCourseStructureCache(SplitModuleTest):
         self.cache.clear()
         # ... and after
         self.addCleanup(self.cache.clear)
+        self.addCleanup(CourseStructureCache.local_cache.clear)
 
         # make a new course:
         self.user = random.getrandbits(32)
         self.new_course = modulestore().create_course(
             'org', 'course', 'test_run', self.user, BRANCH_NAME_DRAFT,
         )
+        # ... which may have been read into the process cache
+        CourseStructureCache.local_cache.clear()
 
         super(TestCourseStructureCache, self).setUp()
 
@@ -965,6 +972,24 @@ class TestCourseStructureCache(SplitModuleTest):
         # now make sure that you get the same structure
         self.assertEqual(cached_structure, not_cached_structure)
 
+        # each read gets its own copy, whose blocks can be modified the way reads do
+        self.assertIsNot(cached_structure, not_cached_structure)
+        for block in cached_structure['blocks'].itervalues():
+            block.fields['display_name'] = 'Changed'
+            block.edit_info.edited_by = 'someone'
+        cached_structure['blocks'].clear()
+        self.assertEqual(self._get_structure(self.new_course), not_cached_structure)
+
+        # the process cache holds the converted structure, so the django cache isn't read
+        with patch.object(self.cache, 'get') as mock_cache_get:
+            self.assertEqual(self._get_structure(self.new_course), not_cached_structure)
+        self.assertFalse(mock_cache_get.called)
+
+        # without the process cache, the structure is read from the django cache
+        CourseStructureCache.local_cache.clear()
+        with check_mongo_calls(0):
+            self.assertEqual(self._get_structure(self.new_course), not_cached_structure)
+
     @patch('xmodule.modulestore.split_mongo.mongo_connection.get_cache')
     def test_course_structure_cache_no_cache_configured(self, mock_get_cache):
         mock_get_cache.side_effect = InvalidCacheBackendError
@@ -985,7 +1010,7 @@ class TestCourseStructureCache(SplitModuleTest):
             not_cached_structure = self._get_structure(self.new_course)
 
         # Since the test is using the dummy cache, it's not actually caching
-        # anything
+        # anything (not even in this process)
         with check_mongo_calls(1):
             cached_structure = self._get_structure(self.new_course)
 
@@ -1001,6 +1026,83 @@ class TestCourseStructureCache(SplitModuleTest):
         )
 
 
+class TestDefinitionCache(SplitModuleTest):
+    """Tests for the DefinitionCache"""
+
+    def setUp(self):
+        # use the default cache, since the `course_structure_cache`
+        # is a dummy cache during testing
+        self.cache = caches['default']
+
+        # make sure we clear the cache before every test...
+        self.cache.clear()
+        # ... and after
+        self.addCleanup(self.cache.clear)
+        self.addCleanup(DefinitionCache.local_cache.clear)
+
+        self.user = random.getrandbits(32)
+        self.new_course = modulestore().create_course(
+            'org', 'course', 'test_run', self.user, BRANCH_NAME_DRAFT,
+        )
+        # ... which may have been read into the process cache
+        DefinitionCache.local_cache.clear()
+        self.definition_id = self.new_course.definition_locator.definition_id
+
+        super(TestDefinitionCache, self).setUp()
+
+    @patch('xmodule.modulestore.split_mongo.mongo_connection.get_cache')
+    def test_definition_cache(self, mock_get_cache):
+        mock_get_cache.return_value = self.cache
+
+        with check_mongo_calls(1):
+            not_cached_definition = modulestore().db_connection.get_definition(self.definition_id)
+        with check_mongo_calls(0):
+            cached_definition = modulestore().db_connection.get_definition(self.definition_id)
+        self.assertEqual(cached_definition, not_cached_definition)
+
+        # each read gets its own copy
+        cached_definition['fields']['changed'] = True
+        self.assertNotIn('changed', modulestore().db_connection.get_definition(self.definition_id)['fields'])
+
+        # definitions which are only in the shared cache are read from it
+        DefinitionCache.local_cache.clear()
+        with check_mongo_calls(0):
+            self.assertEqual(
+                modulestore().db_connection.get_definitions([self.definition_id]),
+                [not_cached_definition]
+            )
+
+    def test_dummy_cache(self):
+        # Since the test is using the dummy cache, nothing is cached in
+        # this process either
+        with check_mongo_calls(1):
+            modulestore().db_connection.get_definition(self.definition_id)
+        with check_mongo_calls(1):
+            modulestore().db_connection.get_definition(self.definition_id)
+
+    @patch('xmodule.modulestore.split_mongo.mongo_connection.get_cache')
+    def test_definition_cache_no_cache_configured(self, mock_get_cache):
+        mock_get_cache.side_effect = InvalidCacheBackendError
+
+        with check_mongo_calls(1):
+            modulestore().db_connection.get_definition(self.definition_id)
+        with check_mongo_calls(1):
+            modulestore().db_connection.get_definitions([self.definition_id])
+
+    def test_lazy_definitions_batched(self):
+        """
+        Lazily loaded definitions of siblings are read in a single query.
+        """
+        chapter = modulestore().create_child(self.user, self.new_course.location, 'chapter')
+        for __ in range(3):
+            modulestore().create_child(self.user, chapter.location, 'html', fields={'data': u'<p>html</p>'})
+
+        chapter = modulestore().get_item(chapter.location)
+        with check_mongo_calls(1):
+            for child in chapter.get_children():
+                self.assertEqual(child.data, u'<p>html</p>')
+
+
 class SplitModuleItemTests(SplitModuleTest):
     '''
     Item read tests including inheritance
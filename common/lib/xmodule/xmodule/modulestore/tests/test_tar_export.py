@@ -0,0 +1,184 @@
+"""
+Tests for streaming exports into tar archives.
+"""
+import json
+import os
+import tarfile
+import unittest
+from StringIO import StringIO
+
+from mock import Mock, patch
+
+from xmodule.contentstore.content import ContentStore
+from xmodule.modulestore.tar_export import TarStreamFS, export_assets_to_fs, iter_export_tarball
+
+
+def _read_archive(data):
+    """
+    Returns a dict of member name -> contents (None for directories) of the .tar.gz archive in `data`.
+    """
+    with tarfile.open(fileobj=StringIO(data), mode='r:gz') as tar:
+        return {
+            member.name: tar.extractfile(member).read() if member.isfile() else None
+            for member in tar.getmembers()
+        }
+
+
+class FakeContent(object):
+    """
+    Stand-in for StaticContent.
+    """
+    def __init__(self, name, data, import_path=None):
+        self.name = name
+        self.data = data
+        self.import_path = import_path
+
+    def stream_data(self):
+        """
+        Yield the data a few bytes at a time.
+        """
+        for start in xrange(0, len(self.data), 3):
+            yield self.data[start:start + 3]
+
+
+class FakeContentStore(ContentStore):
+    """
+    In-memory contentstore holding the given assets and contents, keyed by asset name.
+    """
+    def __init__(self, assets, contents):
+        self.assets = assets
+        self.contents = contents
+
+    def find(self, location, throw_on_not_found=True, as_stream=False):
+        return self.contents[location.name]
+
+    def get_all_content_for_course(self, course_key, start=0, maxresults=-1, sort=None, filter_params=None):
+        return self.assets, len(self.assets)
+
+
+class TestTarStreamFS(unittest.TestCase):
+    """
+    Tests for TarStreamFS.
+    """
+    def test_write_files(self):
+        output = StringIO()
+        with TarStreamFS(output) as tar_fs:
+            course_fs = tar_fs.makeopendir('course')
+            with course_fs.open('course.xml', 'w') as course_xml:
+                course_xml.write('<course/>')
+            course_fs.makedir('chapter/nested', recursive=True, allow_recreate=True)
+            course_fs.setcontents('chapter/nested/a.xml', u'<chapter/>')
+            course_fs.setcontents('chapter/nested/b.xml', StringIO('<chapter/>'))
+            policies = course_fs.makeopendir('policies')
+            policies.setcontents('assets.json', '{}')
+
+            self.assertTrue(course_fs.isfile('course.xml'))
+            self.assertTrue(course_fs.isdir('chapter'))
+            self.assertTrue(tar_fs.exists('course/policies/assets.json'))
+            self.assertFalse(course_fs.exists('missing.xml'))
+
+        self.assertEqual(
+            _read_archive(output.getvalue()),
+            {
+                'course': None,
+                'course/course.xml': '<course/>',
+                'course/chapter': None,
+                'course/chapter/nested': None,
+                'course/chapter/nested/a.xml': '<chapter/>',
+                'course/chapter/nested/b.xml': '<chapter/>',
+                'course/policies': None,
+                'course/policies/assets.json': '{}',
+            }
+        )
+
+    def test_read_unsupported(self):
+        tar_fs = TarStreamFS(StringIO())
+        with self.assertRaises(Exception):
+            tar_fs.open('course.xml', 'r')
+
+    def test_not_terminated_on_error(self):
+        output = StringIO()
+        with self.assertRaises(ValueError):
+            with TarStreamFS(output) as tar_fs:
+                tar_fs.setcontents('course.xml', '<course/>')
+                raise ValueError()
+        with self.assertRaises(Exception):
+            _read_archive(output.getvalue())
+
+
+class TestExportAssetsToFS(unittest.TestCase):
+    """
+    Tests for export_assets_to_fs.
+    """
+    def _asset(self, name):
+        """
+        An asset as returned by get_all_content_for_course.
+        """
+        asset_key = Mock()
+        asset_key.name = name
+        return {'asset_key': asset_key, '_id': name, 'md5': 'abc', 'displayname': name, 'locked': False}
+
+    def test_export_assets(self):
+        assets = [self._asset('a.png'), self._asset('b.txt'), self._asset('c.js')]
+        contents = {
+            'a.png': FakeContent('a.png', 'png data'),
+            'b.txt': FakeContent('b/txt', 'txt data'),
+            'c.js': FakeContent('c.js', 'js data', import_path='js/c.js'),
+        }
+        contentstore = FakeContentStore(assets, contents)
+
+        output = StringIO()
+        with TarStreamFS(output) as tar_fs:
+            export_assets_to_fs(contentstore, Mock(), tar_fs, max_workers=2)
+
+        archive = _read_archive(output.getvalue())
+        self.assertEqual(archive['static/a.png'], 'png data')
+        self.assertEqual(archive['static/b_txt'], 'txt data')
+        self.assertEqual(archive['static/js/c.js'], 'js data')
+        self.assertEqual(
+            json.loads(archive['policies/assets.json']),
+            {
+                name: {'displayname': name, 'locked': False}
+                for name in ['a.png', 'b.txt', 'c.js']
+            }
+        )
+
+
+class TestIterExportTarball(unittest.TestCase):
+    """
+    Tests for iter_export_tarball.
+    """
+    def test_chunks(self):
+        data = os.urandom(1024 * 1024)
+
+        def export_to_stream(fileobj):
+            """
+            Export a single incompressible file.
+            """
+            with TarStreamFS(fileobj) as tar_fs:
+                tar_fs.setcontents('course/static/random.bin', data)
+
+        manager = Mock(export_to_stream=export_to_stream)
+        chunks = list(iter_export_tarball(manager))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(_read_archive(''.join(chunks))['course/static/random.bin'], data)
+
+    def test_error(self):
+        manager = Mock()
+        manager.export_to_stream.side_effect = ValueError('boom')
+        with self.assertRaises(ValueError):
+            list(iter_export_tarball(manager))
+
+    @patch('xmodule.modulestore.tar_export._close_db_connections')
+    def test_db_connections_closed(self, mock_close_db_connections):
+        def export_to_stream(fileobj):
+            """
+            Export a single file, while the database connections are still open.
+            """
+            self.assertFalse(mock_close_db_connections.called)
+            with TarStreamFS(fileobj) as tar_fs:
+                tar_fs.setcontents('course/course.xml', '<course/>')
+
+        manager = Mock(export_to_stream=export_to_stream)
+        list(iter_export_tarball(manager))
+        mock_close_db_connections.assert_called_once_with()
@@ -13,6 +13,7 @@ from xmodule.modulestore import EdxJSONEncoder, ModuleStoreEnum
 from xmodule.modulestore.inheritance import own_metadata
 from xmodule.modulestore.store_utilities import draft_node_constructor, get_draft_subtree_roots
 from xmodule.modulestore import LIBRARY_ROOT
+from xmodule.modulestore.tar_export import TarStreamFS, export_assets_to_fs, ASSET_READ_WORKERS
 from fs.osfs import OSFS
 from json import dumps
 import json
@@ -106,21 +107,24 @@ class ExportManager(object):
     """
     Manages XML exporting for courselike objects.
     """
-    def __init__(self, modulestore, contentstore, courselike_key, root_dir, target_dir):
+    def __init__(self, modulestore, contentstore, courselike_key, root_dir, target_dir,
+                 asset_workers=ASSET_READ_WORKERS):
         """
         Export all modules from `modulestore` and content from `contentstore` as xml to `root_dir`.
 
         `modulestore`: A `ModuleStore` object that is the source of the modules to export
         `contentstore`: A `ContentStore` object that is the source of the content to export, can be None
         `courselike_key`: The Locator of the Descriptor to export
-        `root_dir`: The directory to write the exported xml to
-        `target_dir`: The name of the directory inside `root_dir` to write the content to
+        `root_dir`: The directory to write the exported xml to; unused when exporting to a stream
+        `target_dir`: The name of the directory inside `root_dir` (or inside the archive) to write the content to
+        `asset_workers`: How many assets to read from the contentstore concurrently when exporting to a stream
         """
         self.modulestore = modulestore
         self.contentstore = contentstore
         self.courselike_key = courselike_key
         self.root_dir = root_dir
         self.target_dir = target_dir
+        self.asset_workers = asset_workers
 
     @abstractmethod
     def get_key(self):
@@ -150,13 +154,48 @@ class ExportManager(object):
         Get the target courselike object for this export.
         """
 
+    def export_assets(self, export_fs, root_courselike_dir):
+        """
+        Export the static assets and their policy file, if there is a contentstore.
+
+        When exporting to disk, `root_courselike_dir` is the directory `export_fs` is rooted at;
+        it is None when exporting to a stream.
+        """
+        if not self.contentstore:
+            return
+        if root_courselike_dir is not None:
+            self.contentstore.export_all_for_course(
+                self.courselike_key,
+                root_courselike_dir + '/static/',
+                root_courselike_dir + '/policies/assets.json',
+            )
+        else:
+            export_assets_to_fs(self.contentstore, self.courselike_key, export_fs, max_workers=self.asset_workers)
+
     def export(self):
         """
         Perform the export given the parameters handed to this class at init.
         """
+        fsm = OSFS(self.root_dir)
+        self._export(fsm, self.root_dir + '/' + self.target_dir)
+
+    def export_to_stream(self, fileobj):
+        """
+        Perform the export, writing it to `fileobj` as a .tar.gz archive whose top level directory is `target_dir`.
+
+        Nothing is written to local disk, so `fileobj` can be anything that accepts writes, e.g. an HTTP
+        response or an upload to remote storage. See `xmodule.modulestore.tar_export.iter_export_tarball`
+        for a way to get the archive as an iterator of chunks instead.
+        """
+        with TarStreamFS(fileobj) as fsm:
+            self._export(fsm, None)
+
+    def _export(self, fsm, root_courselike_dir):
+        """
+        Export into the `target_dir` directory of the filesystem `fsm`.
+        """
         with self.modulestore.bulk_operations(self.courselike_key):
 
-            fsm = OSFS(self.root_dir)
             root = lxml.etree.Element('unknown')
 
             # export only the published content
@@ -173,7 +212,6 @@ class ExportManager(object):
             self.process_root(root, export_fs)
 
             # Process extra items-- drafts, assets, etc
-            root_courselike_dir = self.root_dir + '/' + self.target_dir
             self.process_extra(root, courselike, root_courselike_dir, xml_centric_courselike_key, export_fs)
 
             # Any last pass adjustments
@@ -203,26 +241,21 @@ class CourseExportManager(ExportManager):
 
     def process_extra(self, root, courselike, root_courselike_dir, xml_centric_courselike_key, export_fs):
         # Export the modulestore's asset metadata.
-        asset_dir = root_courselike_dir + '/' + AssetMetadata.EXPORTED_ASSET_DIR + '/'
-        if not os.path.isdir(asset_dir):
-            os.makedirs(asset_dir)
+        export_fs.makedir(AssetMetadata.EXPORTED_ASSET_DIR, recursive=True, allow_recreate=True)
         asset_root = lxml.etree.Element(AssetMetadata.ALL_ASSETS_XML_TAG)
         course_assets = self.modulestore.get_all_asset_metadata(self.courselike_key, None)
         for asset_md in course_assets:
             # All asset types are exported using the "asset" tag - but their asset type is specified in each asset key.
             asset = lxml.etree.SubElement(asset_root, AssetMetadata.ASSET_XML_TAG)
             asset_md.to_xml(asset)
-        with OSFS(asset_dir).open(AssetMetadata.EXPORTED_ASSET_FILENAME, 'w') as asset_xml_file:
+        asset_xml_path = AssetMetadata.EXPORTED_ASSET_DIR + '/' + AssetMetadata.EXPORTED_ASSET_FILENAME
+        with export_fs.open(asset_xml_path, 'w') as asset_xml_file:
             lxml.etree.ElementTree(asset_root).write(asset_xml_file)
 
         # export the static assets
         policies_dir = export_fs.makeopendir('policies')
         if self.contentstore:
-            self.contentstore.export_all_for_course(
-                self.courselike_key,
-                root_courselike_dir + '/static/',
-                root_courselike_dir + '/policies/assets.json',
-            )
+            self.export_assets(export_fs, root_courselike_dir)
 
             # If we are using the default course image, export it to the
             # legacy location to support backwards compatibility.
@@ -237,10 +270,8 @@ class CourseExportManager(ExportManager):
                 except NotFoundError:
                     pass
                 else:
-                    output_dir = root_courselike_dir + '/static/images/'
-                    if not os.path.isdir(output_dir):
-                        os.makedirs(output_dir)
-                    with OSFS(output_dir).open('course_image.jpg', 'wb') as course_image_file:
+                    export_fs.makedir('static/images', recursive=True, allow_recreate=True)
+                    with export_fs.open('static/images/course_image.jpg', 'wb') as course_image_file:
                         course_image_file.write(course_image.data)
 
         # export the static tabs
@@ -320,13 +351,7 @@ class LibraryExportManager(ExportManager):
         """
         # export the static assets
         export_fs.makeopendir('policies')
-
-        if self.contentstore:
-            self.contentstore.export_all_for_course(
-                self.courselike_key,
-                self.root_dir + '/' + self.target_dir + '/static/',
-                self.root_dir + '/' + self.target_dir + '/policies/assets.json',
-            )
+        self.export_assets(export_fs, root_courselike_dir)
 
     def post_process(self, root, export_fs):
         """
@@ -355,6 +380,20 @@ def export_library_to_xml(modulestore, contentstore, library_key, root_dir, libr
     LibraryExportManager(modulestore, contentstore, library_key, root_dir, library_dir).export()
 
 
+def export_course_to_stream(modulestore, contentstore, course_key, fileobj, course_dir):
+    """
+    Thin wrapper for streaming a course export as a .tar.gz archive to `fileobj`. See ExportManager for details.
+    """
+    CourseExportManager(modulestore, contentstore, course_key, None, course_dir).export_to_stream(fileobj)
+
+
+def export_library_to_stream(modulestore, contentstore, library_key, fileobj, library_dir):
+    """
+    Thin wrapper for streaming a library export as a .tar.gz archive to `fileobj`. See ExportManager for details.
+    """
+    LibraryExportManager(modulestore, contentstore, library_key, None, library_dir).export_to_stream(fileobj)
+
+
 def adapt_references(subtree, destination_course_key, export_fs):
     """
     Map every reference in the subtree into destination_course_key and set it back into the xblock fields
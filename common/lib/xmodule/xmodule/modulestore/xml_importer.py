@@ -35,6 +35,7 @@ from xblock.runtime import KvsFieldData, DictKeyValueStore
 from xmodule.x_module import XModuleDescriptor, XModuleMixin
 from opaque_keys.edx.keys import UsageKey
 from xblock.fields import Scope, Reference, ReferenceList, ReferenceValueDict
+from xmodule.contentstore.asset_index import invalidate_course_asset_index
 from xmodule.contentstore.content import StaticContent
 from .inheritance import own_metadata
 from xmodule.errortracker import make_error_tracker
@@ -142,6 +143,7 @@ def import_static_content(
             # to subsitute in the module data
             remap_dict[fullname_with_subpath] = asset_key
 
+    invalidate_course_asset_index(target_id)
     return remap_dict
 
 
@@ -5,7 +5,7 @@ import unittest
 import ddt
 from path import Path as path
 from xmodule.contentstore.content import StaticContent, StaticContentStream
-from xmodule.contentstore.content import ContentStore
+from xmodule.contentstore.content import ContentStore, iter_concurrently
 from opaque_keys.edx.locations import SlashSeparatedCourseKey, AssetLocation
 from xmodule.static_content import _write_js, _list_descriptors
 
@@ -173,3 +173,30 @@ class ContentTest(unittest.TestCase):
         js_file_paths = [file_path for file_path in js_file_paths if os.path.basename(file_path).startswith('000-')]
         self.assertEqual(len(js_file_paths), 1)
         self.assertIn("XModule.Descriptor = (function () {", open(js_file_paths[0]).read())
+
+
+@ddt.ddt
+class IterConcurrentlyTest(unittest.TestCase):
+    """
+    Tests for iter_concurrently.
+    """
+    @ddt.data(1, 2, 5, 20)
+    def test_results_in_order(self, max_workers):
+        self.assertEqual(
+            list(iter_concurrently(lambda item: item * item, range(10), max_workers)),
+            [(item, item * item) for item in range(10)]
+        )
+
+    @ddt.data(1, 3)
+    def test_error(self, max_workers):
+        def func(item):
+            """ Fail on the third item. """
+            if item == 2:
+                raise ValueError(item)
+            return item
+
+        results = iter_concurrently(func, range(5), max_workers)
+        self.assertEqual(next(results), (0, 0))
+        self.assertEqual(next(results), (1, 1))
+        with self.assertRaises(ValueError):
+            next(results)
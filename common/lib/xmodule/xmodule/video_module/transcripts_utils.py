@@ -11,7 +11,10 @@ from pysrt import SubRipTime, SubRipItem, SubRipFile
 from lxml import etree
 from HTMLParser import HTMLParser
 
+from django.core.cache import cache
+
 from xmodule.exceptions import NotFoundError
+from xmodule.contentstore.asset_index import get_course_asset_digests, invalidate_course_asset_index
 from xmodule.contentstore.content import StaticContent
 from xmodule.contentstore.django import contentstore
 
@@ -20,6 +23,9 @@ from .bumper_utils import get_bumper_settings
 
 log = logging.getLogger(__name__)
 
+# How long converted transcripts are cached for, in seconds
+CONVERTED_TRANSCRIPT_TIMEOUT = 24 * 60 * 60
+
 
 class TranscriptException(Exception):  # pylint: disable=missing-docstring
     pass
@@ -75,6 +81,7 @@ def save_to_store(content, name, mime_type, location):
     content_location = Transcript.asset_location(location, name)
     content = StaticContent(content_location, name, mime_type, content)
     contentstore().save(content)
+    invalidate_course_asset_index(location.course_key)
     return content_location
 
 
@@ -509,6 +516,43 @@ class Transcript(object):
             elif output_format == 'srt':
                 return generate_srt_from_sjson(json.loads(content), speed=1.0)
 
+    @staticmethod
+    def get_converted(location, filename, input_format, output_format):
+        """
+        Return the content of the transcript asset named `filename`, converted from
+        `input_format` to `output_format`.
+
+        Converted transcripts are cached by the digest of the asset's content, which is
+        looked up in the course's asset index. Raises NotFoundError if there's no such asset.
+        """
+        asset_name = Transcript.asset_location(location, filename).name
+        asset_digests = get_course_asset_digests(location.course_key, [asset_name])
+        if asset_name not in asset_digests:
+            # Check the contentstore, in case the asset was saved without invalidating the index.
+            data = Transcript.get_asset(location, filename).data
+            invalidate_course_asset_index(location.course_key)
+            return Transcript.convert(data, input_format, output_format)
+
+        digest = asset_digests[asset_name]
+        if digest is None or input_format == output_format:
+            return Transcript.convert(Transcript.get_asset(location, filename).data, input_format, output_format)
+
+        cache_key = u'transcripts.converted.{}.{}.{}'.format(digest, input_format, output_format)
+        content = cache.get(cache_key)
+        if content is None:
+            content = Transcript.convert(Transcript.get_asset(location, filename).data, input_format, output_format)
+            cache.set(cache_key, content, CONVERTED_TRANSCRIPT_TIMEOUT)
+        return content
+
+    @staticmethod
+    def asset_exists(location, filename):
+        """
+        Return whether there's an asset named `filename` in the course of the module at `location`,
+        according to the course's asset index.
+        """
+        asset_name = Transcript.asset_location(location, filename).name
+        return asset_name in get_course_asset_digests(location.course_key, [asset_name])
+
     @staticmethod
     def asset(location, subs_id, lang='en', filename=None):
         """
@@ -543,6 +587,7 @@ class Transcript(object):
             log.info("Transcript asset %s was removed from store.", filename)
         except NotFoundError:
             pass
+        invalidate_course_asset_index(location.course_key)
         return StaticContent.compute_location(location.course_key, filename)
 
 
@@ -579,26 +624,18 @@ class VideoTranscriptsMixin(object):
             return set(translations)
 
         # If we've gotten this far, we're going to verify that the transcripts
-        # being referenced are actually in the contentstore.
+        # being referenced are actually in the contentstore, using the course's
+        # asset index.
         if sub:  # check if sjson exists for 'en'.
-            try:
-                Transcript.asset(self.location, sub, 'en')
-            except NotFoundError:
-                try:
-                    Transcript.asset(self.location, None, None, sub)
-                except NotFoundError:
-                    pass
-                else:
-                    translations = ['en']
-            else:
+            if (
+                    Transcript.asset_exists(self.location, subs_filename(sub, 'en')) or
+                    Transcript.asset_exists(self.location, sub)
+            ):
                 translations = ['en']
 
         for lang in other_lang:
-            try:
-                Transcript.asset(self.location, None, None, other_lang[lang])
-            except NotFoundError:
-                continue
-            translations.append(lang)
+            if Transcript.asset_exists(self.location, other_lang[lang]):
+                translations.append(lang)
 
         return translations
 
@@ -631,13 +668,13 @@ class VideoTranscriptsMixin(object):
                 log.debug("No subtitles for 'en' language")
                 raise ValueError
 
-            data = Transcript.asset(self.location, transcript_name, lang).data
             filename = u'{}.{}'.format(transcript_name, transcript_format)
-            content = Transcript.convert(data, 'sjson', transcript_format)
+            content = Transcript.get_converted(
+                self.location, subs_filename(transcript_name, lang), 'sjson', transcript_format
+            )
         else:
-            data = Transcript.asset(self.location, None, None, other_lang[lang]).data
             filename = u'{}.{}'.format(os.path.splitext(other_lang[lang])[0], transcript_format)
-            content = Transcript.convert(data, 'srt', transcript_format)
+            content = Transcript.get_converted(self.location, other_lang[lang], 'srt', transcript_format)
 
         if not content:
             log.debug('no subtitles produced in get_transcript')
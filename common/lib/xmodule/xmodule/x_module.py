@@ -1699,6 +1699,16 @@ class ModuleSystem(MetricsMixin, ConfigurableFragmentWrapper, Runtime):
         if user:
             self.user_id = user.id
 
+    def get_cached_fragment(self, block, view_name, context):  # pylint: disable=unused-argument
+        """
+        Return a fragment previously rendered for `block`'s `view_name` view that can be
+        used instead of rendering it again, or None.
+
+        Runtimes which cache rendered fragments override this; it's consulted before
+        the block is instantiated as an XModule, so that cached blocks needn't be.
+        """
+        return None
+
     def get(self, attr):
         """	provide uniform access to attributes (like etree)."""
         return self.__dict__.get(attr)
@@ -1779,6 +1789,10 @@ class CombinedSystem(object):
         """
         context = context or {}
         if view_name in PREVIEW_VIEWS:
+            if isinstance(self._module_system, ModuleSystem):
+                frag = self._module_system.get_cached_fragment(block, view_name, context)
+                if frag is not None:
+                    return frag
             block = self._get_student_block(block)
 
         return self.__getattr__('render')(block, view_name, context)
@@ -31,6 +31,9 @@ from certificates.queue import XQueueCertInterface
 
 log = logging.getLogger("edx.certificate")
 
+# How many students generate_certificates_for_students requests certificates for at a time
+CERTIFICATE_GENERATION_BATCH_SIZE = 100
+
 
 def get_certificates_for_user(username):
     """
@@ -112,16 +115,68 @@ def generate_user_certificates(student, course_key, course=None, insecure=False,
                                    generate_pdf=generate_pdf,
                                    forced_grade=forced_grade)
     if status in [CertificateStatuses.generating, CertificateStatuses.downloadable]:
-        emit_certificate_event('created', student, course_key, course, {
-            'user_id': student.id,
-            'course_id': unicode(course_key),
-            'certificate_id': cert.verify_uuid,
-            'enrollment_mode': cert.mode,
-            'generation_mode': generation_mode
-        })
+        _emit_certificate_created_event(student, course_key, course, cert, generation_mode)
     return status
 
 
+def generate_certificates_for_students(students, course_key, course=None, insecure=False, generation_mode='batch',
+                                       batch_size=CERTIFICATE_GENERATION_BATCH_SIZE):
+    """
+    Add the add-cert requests for many students into the xqueue, like
+    generate_user_certificates does for a single student.
+
+    The students are handled in batches of `batch_size`. Everything needed
+    to decide each student's certificate, other than their grade, is looked
+    up for the whole batch at once, and the course and the connection to the
+    xqueue are shared by all of the students.
+
+    Args:
+        students (list of User)
+        course_key (CourseKey)
+
+    Keyword Arguments:
+        course (Course): Optionally provide the course object; if not provided
+            it will be loaded.
+        insecure - (Boolean)
+        generation_mode - who has requested certificate generation.
+        batch_size - how many students to handle at a time.
+
+    Yields:
+        list of (User, str): For each batch once it has been handled, each
+            of its students and the student's certificate status.
+    """
+    if course is None:
+        course = modulestore().get_course(course_key, depth=0)
+    xqueue = XQueueCertInterface()
+    if insecure:
+        xqueue.use_https = False
+    generate_pdf = not has_html_certificates_enabled(course_key, course)
+
+    for start in xrange(0, len(students), batch_size):
+        batch = students[start:start + batch_size]
+        xqueue.prefetch_students(batch, course_key)
+        results = []
+        for student in batch:
+            status, cert = xqueue.add_cert(student, course_key, course=course, generate_pdf=generate_pdf)
+            if status in [CertificateStatuses.generating, CertificateStatuses.downloadable]:
+                _emit_certificate_created_event(student, course_key, course, cert, generation_mode)
+            results.append((student, status))
+        yield results
+
+
+def _emit_certificate_created_event(student, course_key, course, cert, generation_mode):
+    """
+    Emits the `edx.certificate.created` event for a newly requested certificate.
+    """
+    emit_certificate_event('created', student, course_key, course, {
+        'user_id': student.id,
+        'course_id': unicode(course_key),
+        'certificate_id': cert.verify_uuid,
+        'enrollment_mode': cert.mode,
+        'generation_mode': generation_mode
+    })
+
+
 def regenerate_user_certificates(student, course_key, course=None,
                                  forced_grade=None, template_file=None, insecure=False):
     """
@@ -105,6 +105,54 @@ class XQueueCertInterface(object):
         self.whitelist = CertificateWhitelist.objects.all()
         self.restricted = UserProfile.objects.filter(allow_certificate=False)
         self.use_https = True
+        self._prefetched = None
+
+    def prefetch_students(self, students, course_id):
+        """
+        Look up what add_cert needs to know about each of the given students
+        in the course (other than their grades) for all of them at once, so
+        that certificates can be requested for a batch of students without
+        querying for each student separately.
+
+        The lookups are used by add_cert until prefetch_students is next
+        called.
+        """
+        user_ids = [student.id for student in students]
+        profiles = list(
+            UserProfile.objects.filter(user_id__in=user_ids).values_list('user_id', 'name', 'allow_certificate')
+        )
+        self._prefetched = {
+            'course_id': course_id,
+            'user_ids': set(user_ids),
+            'statuses': dict(
+                GeneratedCertificate.objects.filter(
+                    user_id__in=user_ids, course_id=course_id
+                ).values_list('user_id', 'status')
+            ),
+            'names': {user_id: name for user_id, name, __ in profiles},
+            'restricted': {user_id for user_id, __, allow_certificate in profiles if not allow_certificate},
+            'whitelisted': set(
+                self.whitelist.filter(
+                    user_id__in=user_ids, course_id=course_id, whitelist=True
+                ).values_list('user_id', flat=True)
+            ),
+            'modes': dict(
+                CourseEnrollment.objects.filter(
+                    user_id__in=user_ids, course_id=course_id
+                ).values_list('user_id', 'mode')
+            ),
+            'verified': SoftwareSecurePhotoVerification.verified_user_ids(user_ids),
+        }
+
+    def _get_prefetched(self, student, course_id):
+        """
+        Return the lookups made by prefetch_students, if they include the
+        given student in the course; otherwise None.
+        """
+        prefetched = self._prefetched
+        if prefetched is None or prefetched['course_id'] != course_id or student.id not in prefetched['user_ids']:
+            return None
+        return prefetched
 
     def regen_cert(self, student, course_id, course=None, forced_grade=None, template_file=None, generate_pdf=True):
         """(Re-)Make certificate for a particular student in a particular course
@@ -143,6 +191,10 @@ class XQueueCertInterface(object):
             certificate.status = status.unavailable
             certificate.save()
 
+            prefetched = self._get_prefetched(student, course_id)
+            if prefetched is not None:
+                prefetched['statuses'][student.id] = certificate.status
+
             LOGGER.info(
                 (
                     u"The certificate status for student %s "
@@ -182,7 +234,7 @@ class XQueueCertInterface(object):
 
         raise NotImplementedError
 
-    # pylint: disable=too-many-statements
+    # pylint: disable=too-many-statements, too-many-branches
     def add_cert(self, student, course_id, course=None, forced_grade=None, template_file=None,
                  title='None', generate_pdf=True):
         """
@@ -223,7 +275,11 @@ class XQueueCertInterface(object):
             status.downloadable
         ]
 
-        cert_status = certificate_status_for_student(student, course_id)['status']
+        prefetched = self._get_prefetched(student, course_id)
+        if prefetched is not None:
+            cert_status = prefetched['statuses'].get(student.id, status.unavailable)
+        else:
+            cert_status = certificate_status_for_student(student, course_id)['status']
         new_status = cert_status
         cert = None
 
@@ -246,19 +302,29 @@ class XQueueCertInterface(object):
             # for every student
             if course is None:
                 course = modulestore().get_course(course_id, depth=0)
-            profile = UserProfile.objects.get(user=student)
-            profile_name = profile.name
+            if prefetched is not None and student.id in prefetched['names']:
+                profile_name = prefetched['names'][student.id]
+            else:
+                profile = UserProfile.objects.get(user=student)
+                profile_name = profile.name
 
             # Needed
             self.request.user = student
             self.request.session = {}
 
             course_name = course.display_name or unicode(course_id)
-            is_whitelisted = self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
+            if prefetched is not None:
+                is_whitelisted = student.id in prefetched['whitelisted']
+            else:
+                is_whitelisted = self.whitelist.filter(user=student, course_id=course_id, whitelist=True).exists()
             grade = grades.grade(student, self.request, course)
-            enrollment_mode, __ = CourseEnrollment.enrollment_mode_for_user(student, course_id)
+            if prefetched is not None:
+                enrollment_mode = prefetched['modes'].get(student.id)
+                user_is_verified = student.id in prefetched['verified']
+            else:
+                enrollment_mode, __ = CourseEnrollment.enrollment_mode_for_user(student, course_id)
+                user_is_verified = SoftwareSecurePhotoVerification.user_is_verified(student)
             mode_is_verified = enrollment_mode in GeneratedCertificate.VERIFIED_CERTS_MODES
-            user_is_verified = SoftwareSecurePhotoVerification.user_is_verified(student)
             cert_mode = enrollment_mode
 
             # For credit mode generate verified certificate
@@ -320,7 +386,12 @@ class XQueueCertInterface(object):
                 # otherwise, put a new certificate request
                 # on the queue
 
-                if self.restricted.filter(user=student).exists():
+                if prefetched is not None:
+                    is_restricted = student.id in prefetched['restricted']
+                else:
+                    is_restricted = self.restricted.filter(user=student).exists()
+
+                if is_restricted:
                     new_status = status.restricted
                     cert.status = new_status
                     cert.save()
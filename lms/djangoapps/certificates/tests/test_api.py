@@ -233,6 +233,34 @@ class GenerateUserCertificatesTest(EventTestMixin, WebCertificateTestMixin, Modu
         self.assertEqual(cert.status, 'error')
         self.assertIn(self.ERROR_REASON, cert.error_reason)
 
+    def test_generate_certificates_for_students(self):
+        restricted_student = UserFactory.create()
+        restricted_student.profile.allow_certificate = False
+        restricted_student.profile.save()
+        CourseEnrollment.enroll(restricted_student, self.course.id, mode='honor')
+
+        with self._mock_passing_grade():
+            with self._mock_queue() as mock_send_to_queue:
+                batches = list(certs_api.generate_certificates_for_students(
+                    [self.student, restricted_student], self.course.id, batch_size=1
+                ))
+
+        self.assertEqual(batches, [
+            [(self.student, CertificateStatuses.generating)],
+            [(restricted_student, CertificateStatuses.restricted)],
+        ])
+        self.assertEqual(mock_send_to_queue.call_count, 1)
+        cert = GeneratedCertificate.objects.get(user=self.student, course_id=self.course.id)
+        self.assert_event_emitted(
+            'edx.certificate.created',
+            user_id=self.student.id,
+            course_id=unicode(self.course.id),
+            certificate_url=certs_api.get_certificate_url(self.student.id, self.course.id),
+            certificate_id=cert.verify_uuid,
+            enrollment_mode=cert.mode,
+            generation_mode='batch'
+        )
+
     @patch.dict(settings.FEATURES, {'CERTIFICATES_HTML_VIEW': True})
     def test_new_cert_requests_returns_generating_for_html_certificate(self):
         """
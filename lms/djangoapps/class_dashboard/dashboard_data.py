@@ -1,71 +1,127 @@
 """
 Computes the data to display on the Instructor Dashboard
+
+The grade and "opened" distributions shown on the dashboard are aggregated over all of a
+course's StudentModules, which is too slow to do every time they're shown for large courses.
+Instead, they're rolled up into the tables in class_dashboard.models, which are rolled up
+again (in the background) when they're next shown after a score in the course changes, or
+after CLASS_DASHBOARD_ROLLUP_MAX_AGE seconds. The outline of the course they're shown on is
+built from the course's cached block structure.
 """
+from datetime import datetime, timedelta
 from util.json_request import JsonResponse
 import json
 
 from courseware import models
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Count
 from django.utils.translation import ugettext as _
+from pytz import UTC
 
+from lms.djangoapps.course_blocks.api import get_course_blocks
 from xmodule.modulestore.django import modulestore
-from xmodule.modulestore.inheritance import own_metadata
 from instructor_analytics.csvs import create_csv_response
+from util.query import iter_by_pk, use_read_replica_if_available
 
 from opaque_keys.edx.locations import Location
 
+from class_dashboard.models import CourseMetricsRollup, ProblemGradeCount, SequentialOpenCount
+from class_dashboard.transformers import ClassDashboardOutlineTransformer
+
 # Used to limit the length of list displayed to the screen.
 MAX_SCREEN_LIST_LENGTH = 250
 
 
-def get_problem_grade_distribution(course_id):
+def _problem_grade_counts(course_id):
     """
-    Returns the grade distribution per problem for the course
+    Aggregate query on studentmodule table for grade data for all problems in course.
 
-    `course_id` the course ID for the course interested in
-
-    Output is 2 dicts:
-      'prob-grade_distrib' where the key is the problem 'module_id' and the value is a dict with:
-        'max_grade' - max grade for this problem
-        'grade_distrib' - array of tuples (`grade`,`count`).
-      'total_student_count' where the key is problem 'module_id' and the value is number of students
-        attempting the problem
+    Returns (`module_state_key`, `grade`, `max_grade`, `count`) rows.
     """
-
-    # Aggregate query on studentmodule table for grade data for all problems in course
-    db_query = models.StudentModule.objects.filter(
+    return use_read_replica_if_available(models.StudentModule.objects.filter(
         course_id__exact=course_id,
         grade__isnull=False,
         module_type__exact="problem",
-    ).values('module_state_key', 'grade', 'max_grade').annotate(count_grade=Count('grade'))
+    )).values_list('module_state_key', 'grade', 'max_grade').annotate(count_grade=Count('grade'))
+
 
+def _sequential_open_counts(course_id):
+    """
+    Aggregate query on studentmodule table for "opening a subsection" data.
+
+    Returns (`module_state_key`, `count`) rows.
+    """
+    return use_read_replica_if_available(models.StudentModule.objects.filter(
+        course_id__exact=course_id,
+        module_type__exact="sequential",
+    )).values_list('module_state_key').annotate(count_sequential=Count('module_state_key'))
+
+
+def _problem_grade_distribution(course_id, rows):
+    """
+    Returns the grade distribution per problem for the course (in the format returned by
+    get_problem_grade_distribution) from (`module_state_key`, `grade`, `max_grade`, `count`)
+    rows.
+    """
     prob_grade_distrib = {}
     total_student_count = {}
 
     # Loop through resultset building data for each problem
-    for row in db_query:
-        curr_problem = course_id.make_usage_key_from_deprecated_string(row['module_state_key'])
+    for module_state_key, grade, max_grade, count_grade in rows:
+        curr_problem = course_id.make_usage_key_from_deprecated_string(module_state_key)
 
         # Build set of grade distributions for each problem that has student responses
         if curr_problem in prob_grade_distrib:
-            prob_grade_distrib[curr_problem]['grade_distrib'].append((row['grade'], row['count_grade']))
+            prob_grade_distrib[curr_problem]['grade_distrib'].append((grade, count_grade))
 
-            if (prob_grade_distrib[curr_problem]['max_grade'] != row['max_grade']) and \
-                    (prob_grade_distrib[curr_problem]['max_grade'] < row['max_grade']):
-                prob_grade_distrib[curr_problem]['max_grade'] = row['max_grade']
+            if (prob_grade_distrib[curr_problem]['max_grade'] != max_grade) and \
+                    (prob_grade_distrib[curr_problem]['max_grade'] < max_grade):
+                prob_grade_distrib[curr_problem]['max_grade'] = max_grade
 
         else:
             prob_grade_distrib[curr_problem] = {
-                'max_grade': row['max_grade'],
-                'grade_distrib': [(row['grade'], row['count_grade'])]
+                'max_grade': max_grade,
+                'grade_distrib': [(grade, count_grade)]
             }
 
         # Build set of total students attempting each problem
-        total_student_count[curr_problem] = total_student_count.get(curr_problem, 0) + row['count_grade']
+        total_student_count[curr_problem] = total_student_count.get(curr_problem, 0) + count_grade
 
     return prob_grade_distrib, total_student_count
 
 
+def _sequential_open_distrib(course_id, rows):
+    """
+    Returns the number of students that opened each subsection (in the format returned by
+    get_sequential_open_distrib) from (`module_state_key`, `count`) rows.
+    """
+    # Build set of "opened" data for each subsection that has "opened" data
+    sequential_open_distrib = {}
+    for module_state_key, count_sequential in rows:
+        row_loc = course_id.make_usage_key_from_deprecated_string(module_state_key)
+        sequential_open_distrib[row_loc] = count_sequential
+
+    return sequential_open_distrib
+
+
+def get_problem_grade_distribution(course_id):
+    """
+    Returns the grade distribution per problem for the course
+
+    `course_id` the course ID for the course interested in
+
+    Output is 2 dicts:
+      'prob-grade_distrib' where the key is the problem 'module_id' and the value is a dict with:
+        'max_grade' - max grade for this problem
+        'grade_distrib' - array of tuples (`grade`,`count`).
+      'total_student_count' where the key is problem 'module_id' and the value is number of students
+        attempting the problem
+    """
+    return _problem_grade_distribution(course_id, _problem_grade_counts(course_id))
+
+
 def get_sequential_open_distrib(course_id):
     """
     Returns the number of students that opened each subsection/sequential of the course
@@ -74,20 +130,189 @@ def get_sequential_open_distrib(course_id):
 
     Outputs a dict mapping the 'module_id' to the number of students that have opened that subsection/sequential.
     """
+    return _sequential_open_distrib(course_id, _sequential_open_counts(course_id))
 
-    # Aggregate query on studentmodule table for "opening a subsection" data
-    db_query = models.StudentModule.objects.filter(
-        course_id__exact=course_id,
-        module_type__exact="sequential",
-    ).values('module_state_key').annotate(count_sequential=Count('module_state_key'))
 
-    # Build set of "opened" data for each subsection that has "opened" data
-    sequential_open_distrib = {}
-    for row in db_query:
-        row_loc = course_id.make_usage_key_from_deprecated_string(row['module_state_key'])
-        sequential_open_distrib[row_loc] = row['count_sequential']
+def _rollup_stale_cache_key(course_id):
+    """
+    The cache key of the flag marking the course's rolled up metrics as out of date.
+    """
+    return u'class_dashboard.rollup.stale.{}'.format(course_id)
 
-    return sequential_open_distrib
+
+def _rollup_scheduled_cache_key(course_id):
+    """
+    The cache key of the flag marking that the course's metrics are to be rolled up in the background.
+    """
+    return u'class_dashboard.rollup.scheduled.{}'.format(course_id)
+
+
+def mark_course_metrics_stale(course_id):
+    """
+    Marks the course's rolled up metrics as out of date, so that they're rolled up again
+    the next time they're needed.
+    """
+    cache.set(_rollup_stale_cache_key(course_id), True, None)
+
+
+def rollup_course_metrics(course_id):
+    """
+    Rolls up the course's metrics: replaces its ProblemGradeCounts and SequentialOpenCounts
+    with ones aggregated from its StudentModules.
+
+    `course_id` the course ID for the course interested in
+    """
+    # Unmark the metrics as out of date before aggregating them, so that scores which change
+    # while they're being aggregated mark them again.
+    cache.delete(_rollup_stale_cache_key(course_id))
+    computed = datetime.now(UTC)
+
+    problem_grade_counts = [
+        ProblemGradeCount(
+            course_id=course_id,
+            module_state_key=course_id.make_usage_key_from_deprecated_string(module_state_key),
+            grade=grade,
+            max_grade=max_grade,
+            count=count_grade,
+        )
+        for module_state_key, grade, max_grade, count_grade in _problem_grade_counts(course_id)
+    ]
+    sequential_open_counts = [
+        SequentialOpenCount(
+            course_id=course_id,
+            module_state_key=course_id.make_usage_key_from_deprecated_string(module_state_key),
+            count=count_sequential,
+        )
+        for module_state_key, count_sequential in _sequential_open_counts(course_id)
+    ]
+
+    with transaction.atomic():
+        ProblemGradeCount.objects.filter(course_id=course_id).delete()
+        ProblemGradeCount.objects.bulk_create(problem_grade_counts)
+        SequentialOpenCount.objects.filter(course_id=course_id).delete()
+        SequentialOpenCount.objects.bulk_create(sequential_open_counts)
+        CourseMetricsRollup.objects.update_or_create(course_id=course_id, defaults={'computed': computed})
+
+    cache.delete(_rollup_scheduled_cache_key(course_id))
+
+
+def _ensure_course_metrics_rolled_up(course_id):
+    """
+    Makes sure the course's metrics have been rolled up, rolling them up now if they never
+    have been. If they're out of date, they're rolled up again in the background, and the
+    ones rolled up before are used in the meantime.
+    """
+    try:
+        rollup = CourseMetricsRollup.objects.get(course_id=course_id)
+    except CourseMetricsRollup.DoesNotExist:
+        rollup_course_metrics(course_id)
+        return
+
+    max_age = settings.CLASS_DASHBOARD_ROLLUP_MAX_AGE
+    is_stale = (
+        cache.get(_rollup_stale_cache_key(course_id)) or
+        rollup.computed < datetime.now(UTC) - timedelta(seconds=max_age)
+    )
+    # Only schedule one roll up of the course's metrics at a time.
+    if is_stale and cache.add(_rollup_scheduled_cache_key(course_id), True, max_age):
+        # Import here to avoid circular import.
+        from class_dashboard.tasks import rollup_course_metrics as rollup_course_metrics_task
+        rollup_course_metrics_task.delay(unicode(course_id))
+
+
+def get_rolled_up_problem_grade_distribution(course_id, problem_set=None):
+    """
+    Returns the grade distribution per problem for the course, in the format returned by
+    get_problem_grade_distribution, from the course's rolled up metrics.
+
+    `course_id` the course ID for the course interested in
+
+    `problem_set` if given, an array of UsageKeys of the problems interested in
+
+    The grades of each problem are ordered by `grade`.
+    """
+    _ensure_course_metrics_rolled_up(course_id)
+    rows = ProblemGradeCount.objects.filter(course_id=course_id)
+    if problem_set is not None:
+        rows = rows.filter(module_state_key__in=problem_set)
+    return _problem_grade_distribution(
+        course_id,
+        rows.order_by('module_state_key', 'grade').values_list('module_state_key', 'grade', 'max_grade', 'count'),
+    )
+
+
+def get_rolled_up_sequential_open_distrib(course_id):
+    """
+    Returns the number of students that opened each subsection of the course, in the format
+    returned by get_sequential_open_distrib, from the course's rolled up metrics.
+
+    `course_id` the course ID for the course interested in
+    """
+    _ensure_course_metrics_rolled_up(course_id)
+    return _sequential_open_distrib(
+        course_id,
+        SequentialOpenCount.objects.filter(course_id=course_id).values_list('module_state_key', 'count'),
+    )
+
+
+def get_course_outline(course_id):
+    """
+    Returns the outline of the course that the metrics are shown on, from the course's cached
+    block structure.
+
+    `course_id` the course ID for the course interested in
+
+    Returns an array of dicts in the order of the sections. Each dict has:
+      'display_name' - display name for the section
+      'subsections' - array of dicts in the order of the section's subsections, with:
+        'location' - the subsection's UsageKey
+        'display_name' - display name for the subsection
+        'problems' - array of dicts in the order of the problems in the subsection's units, with:
+          'location' - the problem's UsageKey
+          'display_name' - display name for the problem
+          'label' - label to display for the problem
+    """
+    block_structure = get_course_blocks(
+        # The outline isn't specific to any user
+        None,
+        modulestore().make_course_usage_key(course_id),
+        transformers=[ClassDashboardOutlineTransformer()],
+    )
+
+    def get_display_name(block_key):
+        """
+        Returns the display name of the given block.
+        """
+        return block_structure.get_transformer_block_field(
+            block_key, ClassDashboardOutlineTransformer, ClassDashboardOutlineTransformer.DISPLAY_NAME, ''
+        )
+
+    # Iterate through sections, subsections, units, problems
+    outline = []
+    for section in block_structure.get_children(block_structure.root_block_usage_key):
+        subsections = []
+        for c_subsection, subsection in enumerate(block_structure.get_children(section), 1):
+            problems = []
+            for c_unit, unit in enumerate(block_structure.get_children(subsection), 1):
+                unit_problems = [child for child in block_structure.get_children(unit) if child.block_type == 'problem']
+                for c_problem, problem in enumerate(unit_problems, 1):
+                    problems.append({
+                        'location': problem,
+                        'display_name': get_display_name(problem),
+                        # Construct label to display for this problem
+                        'label': "P{0}.{1}.{2}".format(c_subsection, c_unit, c_problem),
+                    })
+            subsections.append({
+                'location': subsection,
+                'display_name': get_display_name(subsection),
+                'problems': problems,
+            })
+        outline.append({
+            'display_name': get_display_name(section),
+            'subsections': subsections,
+        })
+
+    return outline
 
 
 def get_problem_set_grade_distrib(course_id, problem_set):
@@ -148,80 +373,65 @@ def get_d3_problem_grade_distrib(course_id):
       'data' - data for the d3_stacked_bar_graph function of the grade distribution for that problem
     """
 
-    prob_grade_distrib, total_student_count = get_problem_grade_distribution(course_id)
+    prob_grade_distrib, total_student_count = get_rolled_up_problem_grade_distribution(course_id)
     d3_data = []
 
-    # Retrieve course object down to problems
-    course = modulestore().get_course(course_id, depth=4)
-
-    # Iterate through sections, subsections, units, problems
-    for section in course.get_children():
+    # Iterate through sections, and the problems in each
+    for section in get_course_outline(course_id):
         curr_section = {}
-        curr_section['display_name'] = own_metadata(section).get('display_name', '')
+        curr_section['display_name'] = section['display_name']
         data = []
-        c_subsection = 0
-        for subsection in section.get_children():
-            c_subsection += 1
-            c_unit = 0
-            for unit in subsection.get_children():
-                c_unit += 1
-                c_problem = 0
-                for child in unit.get_children():
-
-                    # Student data is at the problem level
-                    if child.location.category == 'problem':
-                        c_problem += 1
-                        stack_data = []
-
-                        # Construct label to display for this problem
-                        label = "P{0}.{1}.{2}".format(c_subsection, c_unit, c_problem)
-
-                        # Only problems in prob_grade_distrib have had a student submission.
-                        if child.location in prob_grade_distrib:
-
-                            # Get max_grade, grade_distribution for this problem
-                            problem_info = prob_grade_distrib[child.location]
-
-                            # Get problem_name for tooltip
-                            problem_name = own_metadata(child).get('display_name', '')
-
-                            # Compute percent of this grade over max_grade
-                            max_grade = float(problem_info['max_grade'])
-                            for (grade, count_grade) in problem_info['grade_distrib']:
-                                percent = 0.0
-                                if max_grade > 0:
-                                    percent = round((grade * 100.0) / max_grade, 1)
-
-                                # Compute percent of students with this grade
-                                student_count_percent = 0
-                                if total_student_count.get(child.location, 0) > 0:
-                                    student_count_percent = count_grade * 100 / total_student_count[child.location]
-
-                                # Tooltip parameters for problem in grade distribution view
-                                tooltip = {
-                                    'type': 'problem',
-                                    'label': label,
-                                    'problem_name': problem_name,
-                                    'count_grade': count_grade,
-                                    'percent': percent,
-                                    'grade': grade,
-                                    'max_grade': max_grade,
-                                    'student_count_percent': student_count_percent,
-                                }
-
-                                # Construct data to be sent to d3
-                                stack_data.append({
-                                    'color': percent,
-                                    'value': count_grade,
-                                    'tooltip': tooltip,
-                                    'module_url': child.location.to_deprecated_string(),
-                                })
-
-                        problem = {
-                            'xValue': label,
-                            'stackData': stack_data,
+        for subsection in section['subsections']:
+            for child in subsection['problems']:
+                stack_data = []
+                label = child['label']
+
+                # Only problems in prob_grade_distrib have had a student submission.
+                if child['location'] in prob_grade_distrib:
+
+                    # Get max_grade, grade_distribution for this problem
+                    problem_info = prob_grade_distrib[child['location']]
+
+                    # Get problem_name for tooltip
+                    problem_name = child['display_name']
+
+                    # Compute percent of this grade over max_grade
+                    max_grade = float(problem_info['max_grade'])
+                    for (grade, count_grade) in problem_info['grade_distrib']:
+                        percent = 0.0
+                        if max_grade > 0:
+                            percent = round((grade * 100.0) / max_grade, 1)
+
+                        # Compute percent of students with this grade
+                        student_count_percent = 0
+                        if total_student_count.get(child['location'], 0) > 0:
+                            student_count_percent = count_grade * 100 / total_student_count[child['location']]
+
+                        # Tooltip parameters for problem in grade distribution view
+                        tooltip = {
+                            'type': 'problem',
+                            'label': label,
+                            'problem_name': problem_name,
+                            'count_grade': count_grade,
+                            'percent': percent,
+                            'grade': grade,
+                            'max_grade': max_grade,
+                            'student_count_percent': student_count_percent,
                         }
-                        data.append(problem)
+
+                        # Construct data to be sent to d3
+                        stack_data.append({
+                            'color': percent,
+                            'value': count_grade,
+                            'tooltip': tooltip,
+                            'module_url': child['location'].to_deprecated_string(),
+                        })
+
+                problem = {
+                    'xValue': label,
+                    'stackData': stack_data,
+                }
+                data.append(problem)
         curr_section['data'] = data
 
         d3_data.append(curr_section)
@@ -239,28 +449,23 @@ def get_d3_sequential_open_distrib(course_id):
       'display_name' - display name for the section
       'data' - data for the d3_stacked_bar_graph function of how many students opened each sequential/subsection
     """
-    sequential_open_distrib = get_sequential_open_distrib(course_id)
+    sequential_open_distrib = get_rolled_up_sequential_open_distrib(course_id)
 
     d3_data = []
 
-    # Retrieve course object down to subsection
-    course = modulestore().get_course(course_id, depth=2)
-
     # Iterate through sections, subsections
-    for section in course.get_children():
+    for section in get_course_outline(course_id):
         curr_section = {}
-        curr_section['display_name'] = own_metadata(section).get('display_name', '')
+        curr_section['display_name'] = section['display_name']
         data = []
-        c_subsection = 0
 
         # Construct data for each subsection to be sent to d3
-        for subsection in section.get_children():
-            c_subsection += 1
-            subsection_name = own_metadata(subsection).get('display_name', '')
+        for c_subsection, subsection in enumerate(section['subsections'], 1):
+            subsection_name = subsection['display_name']
 
             num_students = 0
-            if subsection.location in sequential_open_distrib:
-                num_students = sequential_open_distrib[subsection.location]
+            if subsection['location'] in sequential_open_distrib:
+                num_students = sequential_open_distrib[subsection['location']]
 
             stack_data = []
 
@@ -276,7 +481,7 @@ def get_d3_sequential_open_distrib(course_id):
                 'color': 0,
                 'value': num_students,
                 'tooltip': tooltip,
-                'module_url': subsection.location.to_deprecated_string(),
+                'module_url': subsection['location'].to_deprecated_string(),
             })
             subsection = {
                 'xValue': "SS {0}".format(c_subsection),
@@ -313,30 +518,19 @@ def get_d3_section_grade_distrib(course_id, section):
         'tooltip' - (Optional) Text to display on mouse hover
     """
 
-    # Retrieve course object down to problems
-    course = modulestore().get_course(course_id, depth=4)
-
     problem_set = []
     problem_info = {}
-    c_subsection = 0
-    for subsection in course.get_children()[section].get_children():
-        c_subsection += 1
-        c_unit = 0
-        for unit in subsection.get_children():
-            c_unit += 1
-            c_problem = 0
-            for child in unit.get_children():
-                if child.location.category == 'problem':
-                    c_problem += 1
-                    problem_set.append(child.location)
-                    problem_info[child.location] = {
-                        'id': child.location.to_deprecated_string(),
-                        'x_value': "P{0}.{1}.{2}".format(c_subsection, c_unit, c_problem),
-                        'display_name': own_metadata(child).get('display_name', ''),
-                    }
+    for subsection in get_course_outline(course_id)[section]['subsections']:
+        for child in subsection['problems']:
+            problem_set.append(child['location'])
+            problem_info[child['location']] = {
+                'id': child['location'].to_deprecated_string(),
+                'x_value': child['label'],
+                'display_name': child['display_name'],
+            }
 
     # Retrieve grade distribution for these problems
-    grade_distrib = get_problem_set_grade_distrib(course_id, problem_set)
+    grade_distrib, __ = get_rolled_up_problem_grade_distribution(course_id, problem_set)
 
     d3_data = []
 
@@ -385,15 +579,7 @@ def get_section_display_name(course_id):
     The ith string in the array is the display name of the ith section in the course.
     """
 
-    course = modulestore().get_course(course_id, depth=4)
-
-    section_display_name = [""] * len(course.get_children())
-    i = 0
-    for section in course.get_children():
-        section_display_name[i] = own_metadata(section).get('display_name', '')
-        i += 1
-
-    return section_display_name
+    return [section['display_name'] for section in get_course_outline(course_id)]
 
 
 def get_array_section_has_problem(course_id):
@@ -405,25 +591,10 @@ def get_array_section_has_problem(course_id):
     The ith value in the array is true if the ith section in the course contains problems and false otherwise.
     """
 
-    course = modulestore().get_course(course_id, depth=4)
-
-    b_section_has_problem = [False] * len(course.get_children())
-    i = 0
-    for section in course.get_children():
-        for subsection in section.get_children():
-            for unit in subsection.get_children():
-                for child in unit.get_children():
-                    if child.location.category == 'problem':
-                        b_section_has_problem[i] = True
-                        break  # out of child loop
-                if b_section_has_problem[i]:
-                    break  # out of unit loop
-            if b_section_has_problem[i]:
-                break  # out of subsection loop
-
-        i += 1
-
-    return b_section_has_problem
+    return [
+        any(subsection['problems'] for subsection in section['subsections'])
+        for section in get_course_outline(course_id)
+    ]
 
 
 def get_students_opened_subsection(request, csv=False):
@@ -438,13 +609,17 @@ def get_students_opened_subsection(request, csv=False):
     csv = request.GET.get('csv')
 
     # Query for "opened a subsection" students
-    students = models.StudentModule.objects.select_related('student').filter(
+    student_modules = models.StudentModule.objects.filter(
         module_state_key__exact=module_state_key,
         module_type__exact='sequential',
-    ).values('student__username', 'student__profile__name').order_by('student__profile__name')
+    )
 
     results = []
     if not csv:
+        students = use_read_replica_if_available(student_modules).select_related('student').values(
+            'student__username', 'student__profile__name'
+        ).order_by('student__profile__name')
+
         # Restrict screen list length
         # Adding 1 so can tell if list is larger than MAX_SCREEN_LIST_LENGTH
         # without doing another select.
@@ -471,8 +646,9 @@ def get_students_opened_subsection(request, csv=False):
         filename = sanitize_filename(' '.join(tooltip.split(' ')[3:]))
 
         header = [_("Name").encode('utf-8'), _("Username").encode('utf-8')]
-        for student in students:
-            results.append([student['student__profile__name'], student['student__username']])
+        students = iter_by_pk(student_modules, fields=('student__profile__name', 'student__username'))
+        for name, username in sorted(students):
+            results.append([name, username])
 
         response = create_csv_response(filename, header, results)
         return response
@@ -490,14 +666,18 @@ def get_students_problem_grades(request, csv=False):
     csv = request.GET.get('csv')
 
     # Query for "problem grades" students
-    students = models.StudentModule.objects.select_related('student').filter(
+    student_modules = models.StudentModule.objects.filter(
         module_state_key=module_state_key,
         module_type__exact='problem',
         grade__isnull=False,
-    ).values('student__username', 'student__profile__name', 'grade', 'max_grade').order_by('student__profile__name')
+    )
 
     results = []
     if not csv:
+        students = use_read_replica_if_available(student_modules).select_related('student').values(
+            'student__username', 'student__profile__name', 'grade', 'max_grade'
+        ).order_by('student__profile__name')
+
         # Restrict screen list length
         # Adding 1 so can tell if list is larger than MAX_SCREEN_LIST_LENGTH
         # without doing another select.
@@ -529,12 +709,16 @@ def get_students_problem_grades(request, csv=False):
         filename = sanitize_filename(tooltip[:tooltip.rfind(' - ')])
 
         header = [_("Name").encode('utf-8'), _("Username").encode('utf-8'), _("Grade").encode('utf-8'), _("Percent").encode('utf-8')]
-        for student in students:
+        students = iter_by_pk(
+            student_modules,
+            fields=('student__profile__name', 'student__username', 'grade', 'max_grade'),
+        )
+        for name, username, grade, max_grade in sorted(students):
 
             percent = 0
-            if student['max_grade'] > 0:
-                percent = round(student['grade'] * 100 / student['max_grade'])
-            results.append([student['student__profile__name'], student['student__username'], student['grade'], percent])
+            if max_grade > 0:
+                percent = round(grade * 100 / max_grade)
+            results.append([name, username, grade, percent])
 
         response = create_csv_response(filename, header, results)
         return response
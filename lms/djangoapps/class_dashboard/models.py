@@ -0,0 +1,56 @@
+"""
+Database models for the class dashboard (the Metrics tab of the instructor dashboard).
+
+The metrics shown on the dashboard are aggregated over all of a course's StudentModules,
+which is too slow to do on every page load for large courses, so they're rolled up into
+these tables instead (see dashboard_data.rollup_course_metrics).
+
+This app uses migrations. If you make changes to these models, be sure to create an
+appropriate migration file and check it in at the same time as your model changes. To do
+that,
+
+1. Go to the edx-platform dir
+2. ./manage.py lms makemigrations class_dashboard --settings=devstack
+"""
+from django.db import models
+
+from xmodule_django.models import CourseKeyField, UsageKeyField
+
+
+class CourseMetricsRollup(models.Model):
+    """
+    When a course's metrics were last rolled up.
+    """
+    class Meta(object):
+        app_label = 'class_dashboard'
+
+    course_id = CourseKeyField(max_length=255, unique=True)
+    computed = models.DateTimeField()
+
+
+class ProblemGradeCount(models.Model):
+    """
+    How many students have each grade (out of each maximum grade) on a problem, as of
+    when the course's metrics were last rolled up.
+    """
+    class Meta(object):
+        app_label = 'class_dashboard'
+
+    course_id = CourseKeyField(max_length=255, db_index=True)
+    module_state_key = UsageKeyField(max_length=255, db_column='module_id')
+    grade = models.FloatField()
+    max_grade = models.FloatField(null=True)
+    count = models.IntegerField()
+
+
+class SequentialOpenCount(models.Model):
+    """
+    How many students have opened a subsection, as of when the course's metrics were
+    last rolled up.
+    """
+    class Meta(object):
+        app_label = 'class_dashboard'
+
+    course_id = CourseKeyField(max_length=255, db_index=True)
+    module_state_key = UsageKeyField(max_length=255, db_column='module_id')
+    count = models.IntegerField()
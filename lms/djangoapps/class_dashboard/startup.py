@@ -0,0 +1,4 @@
+"""Code run at server start up to initialize the class_dashboard app."""
+
+# Import the tasks module to ensure that signal handlers are registered.
+import class_dashboard.tasks  # pylint: disable=unused-import
@@ -0,0 +1,35 @@
+"""
+Asynchronous tasks for the class dashboard app.
+"""
+from django.conf import settings
+from django.dispatch import receiver
+
+from courseware.models import SCORE_CHANGED
+from lms import CELERY_APP
+from opaque_keys.edx.keys import CourseKey
+
+from class_dashboard import dashboard_data
+
+
+@receiver(SCORE_CHANGED)
+def score_changed_handler(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Consume signals that indicate score changes, by marking the course's
+    rolled up metrics as out of date. See the definition of
+    courseware.models.SCORE_CHANGED for a description of the signal.
+
+    The metrics aren't rolled up again until they're next looked at, so that
+    learners' requests don't wait on them, and so that a course's metrics are
+    only rolled up once for however many scores change in the meantime.
+    """
+    course_id = kwargs.get('course_id', None)
+    if settings.FEATURES.get('CLASS_DASHBOARD') and course_id is not None:
+        dashboard_data.mark_course_metrics_stale(CourseKey.from_string(course_id))
+
+
+@CELERY_APP.task(name='class_dashboard.tasks.rollup_course_metrics')
+def rollup_course_metrics(course_id):
+    """
+    Roll up the metrics of the course with the given id (as a string).
+    """
+    dashboard_data.rollup_course_metrics(CourseKey.from_string(course_id))
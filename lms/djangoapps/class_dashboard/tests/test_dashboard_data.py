@@ -10,9 +10,10 @@ from mock import patch
 from nose.plugins.attrib import attr
 
 from capa.tests.response_xml_factory import StringResponseXMLFactory
+from courseware.models import SCORE_CHANGED
 from courseware.tests.factories import StudentModuleFactory
 from student.tests.factories import UserFactory, CourseEnrollmentFactory, AdminFactory
-from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory, check_mongo_calls
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 
 from class_dashboard.dashboard_data import (
@@ -23,6 +24,8 @@ from class_dashboard.dashboard_data import (
     get_students_opened_subsection, get_students_problem_grades,
 )
 from class_dashboard.views import has_instructor_access_for_class
+# Register the signal handlers
+import class_dashboard.tasks  # pylint: disable=unused-import
 
 USER_COUNT = 11
 
@@ -143,6 +146,45 @@ class TestGetProblemGradeDistribution(SharedModuleStoreTestCase):
                     sum_values += problem['value']
                 self.assertEquals(USER_COUNT, sum_values)
 
+    def test_get_d3_problem_grade_distrib_rolled_up(self):
+
+        def problem_student_count():
+            """ The number of students counted for the first problem """
+            stack_data = get_d3_problem_grade_distrib(self.course.id)[0]['data'][0]['stackData']
+            return sum(problem['value'] for problem in stack_data)
+
+        self.assertEquals(USER_COUNT, problem_student_count())
+
+        # The grades are read from the metrics rolled up before
+        StudentModuleFactory.create(
+            grade=1,
+            max_grade=1,
+            student=UserFactory.create(),
+            course_id=self.course.id,
+            module_state_key=self.items[0].location,
+        )
+        self.assertEquals(USER_COUNT, problem_student_count())
+
+        # until a score in the course changes
+        SCORE_CHANGED.send(
+            sender=None,
+            points_possible=1,
+            points_earned=1,
+            user_id=self.users[0].id,
+            course_id=unicode(self.course.id),
+            usage_id=unicode(self.items[0].location),
+        )
+        self.assertEquals(USER_COUNT + 1, problem_student_count())
+
+    def test_course_outline_cached(self):
+
+        get_section_display_name(self.course.id)
+        with check_mongo_calls(0):
+            section_display_name = get_section_display_name(self.course.id)
+            b_section_has_problem = get_array_section_has_problem(self.course.id)
+        self.assertEquals(section_display_name, [u"test factory section omega \u03a9"])
+        self.assertEquals(b_section_has_problem, [True])
+
     def test_get_d3_sequential_open_distrib(self):
 
         d3_data = get_d3_sequential_open_distrib(self.course.id)
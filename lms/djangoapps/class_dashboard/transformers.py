@@ -0,0 +1,50 @@
+"""
+Class Dashboard Outline Transformer
+"""
+from openedx.core.lib.block_cache.transformer import BlockStructureTransformer
+from xmodule.modulestore.inheritance import own_metadata
+
+
+class ClassDashboardOutlineTransformer(BlockStructureTransformer):
+    """
+    Collects the display names which the class dashboard shows for the
+    blocks in its outline of the course, so that the outline can be built
+    from the course's cached block structure rather than from the
+    modulestore.
+    """
+    VERSION = 1
+
+    DISPLAY_NAME = 'display_name'
+
+    # The types of the blocks which are named on the dashboard
+    NAMED_BLOCK_TYPES = ('chapter', 'sequential', 'problem')
+
+    @classmethod
+    def name(cls):
+        """
+        Unique identifier for the transformer's class;
+        same identifier used in setup.py.
+        """
+        return "class_dashboard:outline"
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collects the display name of each block which is named on the
+        dashboard. Like the dashboard always has, only the names which are
+        explicitly set are used (rather than the blocks' default names).
+        """
+        for block_key in block_structure.topological_traversal():
+            if block_key.block_type in cls.NAMED_BLOCK_TYPES:
+                block_structure.set_transformer_block_field(
+                    block_key,
+                    cls,
+                    cls.DISPLAY_NAME,
+                    own_metadata(block_structure.get_xblock(block_key)).get('display_name', ''),
+                )
+
+    def transform(self, usage_info, block_structure):
+        """
+        The outline isn't specific to any user, so there's nothing to do.
+        """
+        pass
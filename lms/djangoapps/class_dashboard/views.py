@@ -21,7 +21,7 @@ def has_instructor_access_for_class(user, course_id):
     Returns true if the `user` is an instructor for the course.
     """
 
-    course = get_course_with_access(user, 'staff', course_id, depth=None)
+    course = get_course_with_access(user, 'staff', course_id)
     return bool(has_access(user, 'staff', course))
 
 
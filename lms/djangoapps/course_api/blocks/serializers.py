@@ -1,69 +1,139 @@
 """
 Serializers for Course Blocks related return objects.
 """
+from django.utils.http import RFC3986_SUBDELIMS, urlquote
 from rest_framework import serializers
 from rest_framework.reverse import reverse
 
 from .transformers import SUPPORTED_FIELDS
 
 
-class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+# Stands in for a block's usage key in the URL templates built by _BlockSerialization.
+USAGE_KEY_PLACEHOLDER = 'USAGEKEYPLACEHOLDER'
+
+
+class _BlockSerialization(object):
     """
-    Serializer for single course block
+    What's needed to serialize the blocks of a single request, worked out
+    once for all of its blocks: the data to return for each block, and
+    templates of the blocks' URLs.
+
+    The URLs of every block differ only by the block's usage key, so rather
+    than reversing them for each block, they're reversed once (per course)
+    with a placeholder for the usage key, which is then substituted with each
+    block's (quoted like reverse() would quote it).
     """
-    def _get_field(self, block_key, transformer, field_name, default):
+    CONTEXT_KEY = '_block_serialization'
+
+    def __init__(self, context):
+        self.request = context['request']
+        self.block_structure = context['block_structure']
+        self.include_children = 'children' in context['requested_fields']
+        self.fields = [
+            supported_field
+            for supported_field in SUPPORTED_FIELDS
+            if supported_field.requested_field_name in context['requested_fields']
+        ]
+        self.columns = [(field.transformer, field.block_field_name) for field in self.fields]
+        self._lms_web_url_templates = {}
+        self._student_view_url_template = None
+
+    @classmethod
+    def for_context(cls, context):
+        """
+        Returns the _BlockSerialization for the given serializer context,
+        creating it the first time it's needed.
+        """
+        if cls.CONTEXT_KEY not in context:
+            context[cls.CONTEXT_KEY] = cls(context)
+        return context[cls.CONTEXT_KEY]
+
+    @staticmethod
+    def _fill_template(template, block_key):
         """
-        Get the field value requested.  The field may be an XBlock field, a
-        transformer block field, or an entire tranformer block data dict.
+        Returns the URL template with the given block's usage key in place
+        of the placeholder.
         """
-        if transformer is None:
-            value = self.context['block_structure'].get_xblock_field(block_key, field_name)
-        elif field_name is None:
-            value = self.context['block_structure'].get_transformer_block_data(block_key, transformer)
-        else:
-            value = self.context['block_structure'].get_transformer_block_field(block_key, transformer, field_name)
+        return template.replace(
+            USAGE_KEY_PLACEHOLDER,
+            urlquote(unicode(block_key), safe=RFC3986_SUBDELIMS + '/~:@'),
+        )
 
-        return value if (value is not None) else default
+    def lms_web_url(self, block_key):
+        """
+        Returns the URL of the given block in the LMS.
+        """
+        course_key = block_key.course_key
+        template = self._lms_web_url_templates.get(course_key)
+        if template is None:
+            template = self._lms_web_url_templates[course_key] = reverse(
+                'jump_to',
+                kwargs={'course_id': unicode(course_key), 'location': USAGE_KEY_PLACEHOLDER},
+                request=self.request,
+            )
+        return self._fill_template(template, block_key)
 
-    def to_representation(self, block_key):
+    def student_view_url(self, block_key):
         """
-        Return a serializable representation of the requested block
+        Returns the URL of the given block's rendered student view.
+        """
+        if self._student_view_url_template is None:
+            self._student_view_url_template = reverse(
+                'courseware.views.render_xblock',
+                kwargs={'usage_key_string': USAGE_KEY_PLACEHOLDER},
+                request=self.request,
+            )
+        return self._fill_template(self._student_view_url_template, block_key)
+
+    def serialize(self, block_key, field_values):
+        """
+        Return a serializable representation of the given block, whose
+        values of self.columns are given.
         """
         # create response data dict for basic fields
         data = {
             'id': unicode(block_key),
-            'lms_web_url': reverse(
-                'jump_to',
-                kwargs={'course_id': unicode(block_key.course_key), 'location': unicode(block_key)},
-                request=self.context['request'],
-            ),
-            'student_view_url': reverse(
-                'courseware.views.render_xblock',
-                kwargs={'usage_key_string': unicode(block_key)},
-                request=self.context['request'],
-            ),
+            'lms_web_url': self.lms_web_url(block_key),
+            'student_view_url': self.student_view_url(block_key),
         }
 
         # add additional requested fields that are supported by the various transformers
-        for supported_field in SUPPORTED_FIELDS:
-            if supported_field.requested_field_name in self.context['requested_fields']:
-                field_value = self._get_field(
-                    block_key,
-                    supported_field.transformer,
-                    supported_field.block_field_name,
-                    supported_field.default_value,
-                )
-                if field_value is not None:
-                    # only return fields that have data
-                    data[supported_field.serializer_field_name] = field_value
-
-        if 'children' in self.context['requested_fields']:
-            children = self.context['block_structure'].get_children(block_key)
+        for supported_field, field_value in zip(self.fields, field_values):
+            if field_value is None:
+                field_value = supported_field.default_value
+            if field_value is not None:
+                # only return fields that have data
+                data[supported_field.serializer_field_name] = field_value
+
+        if self.include_children:
+            children = self.block_structure.get_children(block_key)
             if children:
                 data['children'] = [unicode(child) for child in children]
 
         return data
 
+    def serialize_blocks(self, block_keys=None):
+        """
+        Returns an iterator of the usage key and serializable representation
+        of each of the given blocks (by default, all of the blocks in the
+        block structure), reading all of their data in a single pass.
+        """
+        for block_key, field_values in self.block_structure.get_block_field_values(self.columns, block_keys):
+            yield block_key, self.serialize(block_key, field_values)
+
+
+class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Serializer for single course block
+    """
+    def to_representation(self, block_key):
+        """
+        Return a serializable representation of the requested block
+        """
+        serialization = _BlockSerialization.for_context(self.context)
+        __, data = next(serialization.serialize_blocks([block_key]))
+        return data
+
 
 class BlockDictSerializer(serializers.Serializer):  # pylint: disable=abstract-method
     """
@@ -77,7 +147,8 @@ class BlockDictSerializer(serializers.Serializer):  # pylint: disable=abstract-m
         """
         Serialize to a dictionary of blocks keyed by the block's usage_key.
         """
+        serialization = _BlockSerialization.for_context(self.context)
         return {
-            unicode(block_key): BlockSerializer(block_key, context=self.context).data
-            for block_key in structure
+            unicode(block_key): data
+            for block_key, data in serialization.serialize_blocks()
         }
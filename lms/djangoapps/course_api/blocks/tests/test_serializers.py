@@ -1,7 +1,9 @@
 """
 Tests for Course Blocks serializers
 """
+from django.test.client import RequestFactory
 from mock import MagicMock
+from rest_framework.reverse import reverse
 
 from student.tests.factories import UserFactory
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
@@ -147,3 +149,25 @@ class TestBlockDictSerializer(TestBlockSerializerBase):
         serializer = self.create_serializer()
         for serialized_block in serializer.data['blocks'].itervalues():
             self.assert_extended_block(serialized_block)
+
+    def test_urls(self):
+        self.serializer_context['request'] = RequestFactory().get('/')
+        serializer = self.create_serializer()
+        for block_key_string, serialized_block in serializer.data['blocks'].iteritems():
+            block_key = deserialize_usage_key(block_key_string, self.course.id)
+            self.assertEquals(
+                serialized_block['lms_web_url'],
+                reverse(
+                    'jump_to',
+                    kwargs={'course_id': unicode(self.course.id), 'location': block_key_string},
+                    request=self.serializer_context['request'],
+                ),
+            )
+            self.assertEquals(
+                serialized_block['student_view_url'],
+                reverse(
+                    'courseware.views.render_xblock',
+                    kwargs={'usage_key_string': unicode(block_key)},
+                    request=self.serializer_context['request'],
+                ),
+            )
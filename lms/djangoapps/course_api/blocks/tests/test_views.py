@@ -1,8 +1,11 @@
 """
 Tests for Blocks Views
 """
+import json
 
+from django.conf import settings
 from django.core.urlresolvers import reverse
+from django.test.utils import override_settings
 from string import join
 
 from opaque_keys.edx.locator import CourseLocator
@@ -217,6 +220,15 @@ class TestBlocksView(TestBlocksViewMixin, SharedModuleStoreTestCase):
         )
         self.verify_response_with_requested_fields(response)
 
+    def test_streamed_response(self):
+        params = {'requested_fields': self.requested_fields}
+        response = self.verify_response(params=params)
+        with override_settings(FEATURES=dict(settings.FEATURES, STREAM_COURSE_BLOCKS_API_RESPONSES=True)):
+            streamed_response = self.verify_response(params=params)
+        self.assertTrue(streamed_response.streaming)
+        self.assertEquals(streamed_response['Content-Type'], 'application/json')
+        self.assertEquals(json.loads(''.join(streamed_response.streaming_content)), response.data)
+
 
 class TestBlocksInCourseView(TestBlocksViewMixin, SharedModuleStoreTestCase):
     """
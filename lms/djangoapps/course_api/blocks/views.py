@@ -1,9 +1,12 @@
 """
 CourseBlocks API views
 """
+from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
+from rest_framework.compat import SHORT_SEPARATORS, LONG_SEPARATORS
 from rest_framework.generics import ListAPIView
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
 from opaque_keys import InvalidKeyError
@@ -15,6 +18,32 @@ from xmodule.modulestore.exceptions import ItemNotFoundError
 from .api import get_blocks
 from .forms import BlockListGetForm
 
+# How many bytes of a streamed response to send at a time
+STREAMING_CHUNK_SIZE = 64 * 1024
+
+
+def _stream_json(data, renderer):
+    """
+    Returns an iterator of chunks of the given data encoded as JSON, encoded
+    like the given JSONRenderer would.
+    """
+    encoder = renderer.encoder_class(
+        ensure_ascii=renderer.ensure_ascii,
+        separators=SHORT_SEPARATORS if renderer.compact else LONG_SEPARATORS,
+    )
+    chunk = []
+    chunk_size = 0
+    for part in encoder.iterencode(data):
+        part = part.replace(u'\u2028', u'\\u2028').replace(u'\u2029', u'\\u2029').encode('utf-8')
+        chunk.append(part)
+        chunk_size += len(part)
+        if chunk_size >= STREAMING_CHUNK_SIZE:
+            yield ''.join(chunk)
+            chunk = []
+            chunk_size = 0
+    if chunk:
+        yield ''.join(chunk)
+
 
 @view_auth_classes()
 class BlocksView(DeveloperErrorViewMixin, ListAPIView):
@@ -168,22 +197,41 @@ class BlocksView(DeveloperErrorViewMixin, ListAPIView):
             raise ValidationError(params.errors)
 
         try:
-            return Response(
-                get_blocks(
-                    request,
-                    params.cleaned_data['usage_key'],
-                    params.cleaned_data['user'],
-                    params.cleaned_data['depth'],
-                    params.cleaned_data.get('nav_depth'),
-                    params.cleaned_data['requested_fields'],
-                    params.cleaned_data.get('block_counts', []),
-                    params.cleaned_data.get('student_view_data', []),
-                    params.cleaned_data['return_type']
-                )
+            blocks = get_blocks(
+                request,
+                params.cleaned_data['usage_key'],
+                params.cleaned_data['user'],
+                params.cleaned_data['depth'],
+                params.cleaned_data.get('nav_depth'),
+                params.cleaned_data['requested_fields'],
+                params.cleaned_data.get('block_counts', []),
+                params.cleaned_data.get('student_view_data', []),
+                params.cleaned_data['return_type']
             )
         except ItemNotFoundError as exception:
             raise Http404("Block not found: {}".format(exception.message))
 
+        if self._should_stream(request):
+            return StreamingHttpResponse(
+                _stream_json(blocks, request.accepted_renderer),
+                content_type=request.accepted_renderer.media_type,
+            )
+        return Response(blocks)
+
+    @staticmethod
+    def _should_stream(request):
+        """
+        Returns whether the response to the given request should be streamed
+        as it's encoded, which is only done for plain (unindented) JSON.
+        """
+        # Subclasses of JSONRenderer may encode differently, so they're not streamed.
+        renderer_type = type(getattr(request, 'accepted_renderer', None))
+        return (
+            settings.FEATURES.get('STREAM_COURSE_BLOCKS_API_RESPONSES', False) and
+            renderer_type is JSONRenderer and
+            'indent' not in (getattr(request, 'accepted_media_type', None) or '')
+        )
+
 
 @view_auth_classes()
 class BlocksInCourseView(BlocksView):
@@ -24,6 +24,7 @@ from xblock.field_data import FieldData
 from xmodule.modulestore.inheritance import InheritanceMixin
 
 NOTSET = object()
+INHERITABLE_FIELDS = frozenset(InheritanceMixin.fields)
 ENABLED_OVERRIDE_PROVIDERS_KEY = "courseware.field_overrides.enabled_providers.{course_id}"
 
 
@@ -147,8 +148,7 @@ class OverrideFieldData(FieldData):
             # If this is an inheritable field and an override is set above,
             # then we want to return False here, so the field_data uses the
             # override and not the original value for this block.
-            inheritable = InheritanceMixin.fields.keys()
-            if name in inheritable:
+            if name in INHERITABLE_FIELDS:
                 for ancestor in _lineage(block):
                     if self.get_override(ancestor, name) is not NOTSET:
                         return False
@@ -162,8 +162,7 @@ class OverrideFieldData(FieldData):
         # The `default` method is overloaded by the field storage system to
         # also handle inheritance.
         if self.providers and not overrides_disabled():
-            inheritable = InheritanceMixin.fields.keys()
-            if name in inheritable:
+            if name in INHERITABLE_FIELDS:
                 for ancestor in _lineage(block):
                     value = self.get_override(ancestor, name)
                     if value is not NOTSET:
@@ -239,10 +238,16 @@ class FieldOverrideProvider(object):
 
 def _lineage(block):
     """
-    Returns an iterator over all ancestors of the given block, starting with
-    its immediate parent and ending at the root of the block tree.
+    Returns a tuple of all ancestors of the given block, starting with its
+    immediate parent and ending at the root of the block tree.
+
+    Finding a block's parent reads its fields (through any overrides), and the
+    lineage is needed for every inheritable field, so it's memoized on the
+    block and each of its ancestors.
     """
-    parent = block.get_parent()
-    while parent:
-        yield parent
-        parent = parent.get_parent()
+    lineage = getattr(block, '_override_lineage', None)
+    if lineage is None:
+        parent = block.get_parent()
+        lineage = (parent,) + _lineage(parent) if parent else ()
+        block._override_lineage = lineage  # pylint: disable=protected-access
+    return lineage
@@ -49,9 +49,7 @@ from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import UsageKey, CourseKey
 from opaque_keys.edx.locations import SlashSeparatedCourseKey
 from openedx.core.lib.xblock_utils import (
-    replace_course_urls,
-    replace_jump_to_id_urls,
-    replace_static_urls,
+    replace_urls,
     add_staff_markup,
     wrap_xblock,
     request_token as xblock_request_token,
@@ -80,6 +78,7 @@ from util import milestones_helpers
 from lms.djangoapps.verify_student.services import ReverificationService
 
 from edx_proctoring.services import ProctoringService
+from openedx.core.djangoapps.content.block_fragments.cache import BlockFragmentCache
 from openedx.core.djangoapps.credit.services import CreditService
 
 from .field_overrides import OverrideFieldData
@@ -633,27 +632,23 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
     # prefix is going to have to be specific to the module, not the directory
     # that the xml was loaded from
 
-    # Rewrite urls beginning in /static to point to course-specific content
-    block_wrappers.append(partial(
-        replace_static_urls,
-        getattr(descriptor, 'data_dir', None),
-        course_id=course_id,
-        static_asset_path=static_asset_path or descriptor.static_asset_path
-    ))
-
-    # Allow URLs of the form '/course/' refer to the root of multicourse directory
-    #   hierarchy of this course
-    block_wrappers.append(partial(replace_course_urls, course_id))
-
-    # this will rewrite intra-courseware links (/jump_to_id/<id>). This format
+    # Rewrite urls beginning in /static to point to course-specific content,
+    # allow URLs of the form '/course/' refer to the root of multicourse directory
+    #   hierarchy of this course,
+    # and rewrite intra-courseware links (/jump_to_id/<id>). This format
     # is an improvement over the /course/... format for studio authored courses,
     # because it is agnostic to course-hierarchy.
+    # These are all done in a single pass over the block's html.
     # NOTE: module_id is empty string here. The 'module_id' will get assigned in the replacement
     # function, we just need to specify something to get the reverse() to work.
     block_wrappers.append(partial(
-        replace_jump_to_id_urls,
+        replace_urls,
         course_id,
-        reverse('jump_to_id', kwargs={'course_id': course_id.to_deprecated_string(), 'module_id': ''}),
+        data_dir=getattr(descriptor, 'data_dir', None),
+        static_asset_path=static_asset_path or descriptor.static_asset_path,
+        jump_to_id_base_url=reverse(
+            'jump_to_id', kwargs={'course_id': course_id.to_deprecated_string(), 'module_id': ''}
+        ),
     ))
 
     if settings.FEATURES.get('DISPLAY_DEBUG_INFO_TO_STAFF'):
@@ -693,6 +688,22 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
 
     user_is_staff = bool(has_access(user, u'staff', descriptor.location, course_id))
 
+    # Staff see debugging markup and masquerading staff see filtered blocks, so only
+    # share fragments rendered for (and with) other users.
+    fragment_cache = None
+    if settings.FEATURES.get('ENABLE_BLOCK_FRAGMENT_CACHE') and not user_is_staff \
+            and not is_masquerading_as_specific_student(user, course_id):
+        fragment_cache = BlockFragmentCache(
+            course_id,
+            settings.BLOCK_FRAGMENT_CACHE_TYPES,
+            request_token,
+            wrapper_settings=(
+                wrap_xmodule_display,
+                static_asset_path or descriptor.static_asset_path,
+                settings.FEATURES.get('LICENSING', False),
+            ),
+        )
+
     system = LmsModuleSystem(
         track_function=track_function,
         render_template=render_to_string,
@@ -749,6 +760,7 @@ def get_module_system_for_user(user, student_data,  # TODO  # pylint: disable=to
         rebind_noauth_module_to_user=rebind_noauth_module_to_user,
         user_location=user_location,
         request_token=request_token,
+        fragment_cache=fragment_cache,
     )
 
     # pass position specified in URL to module through ModuleSystem
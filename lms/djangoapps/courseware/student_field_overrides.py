@@ -4,6 +4,8 @@ by the individual due dates feature.
 """
 import json
 
+import request_cache
+
 from .field_overrides import FieldOverrideProvider
 from .models import StudentFieldOverride
 
@@ -43,19 +45,52 @@ def _get_overrides_for_user(user, block):
     Gets all of the individual student overrides for given user and block.
     Returns a dictionary of field override values keyed by field name.
     """
-    query = StudentFieldOverride.objects.filter(
-        course_id=block.runtime.course_id,
-        location=block.location,
-        student_id=user.id,
-    )
+    course_overrides = _get_course_overrides_for_user(user, block.runtime.course_id)
     overrides = {}
-    for override in query:
-        field = block.fields[override.field]
-        value = field.from_json(json.loads(override.value))
-        overrides[override.field] = value
+    for field_name, value in course_overrides.get(_location_key(block.location), {}).iteritems():
+        field = block.fields[field_name]
+        overrides[field_name] = field.from_json(json.loads(value))
     return overrides
 
 
+def _get_course_overrides_for_user(user, course_id):
+    """
+    Gets all of the individual student overrides for the given user in the given
+    course, loading them all at once the first time they're needed in a request.
+    Returns a dictionary of {field name: JSON value} dictionaries, keyed by
+    `_location_key`.
+    """
+    overrides_cache = request_cache.get_cache('courseware.student_field_overrides')
+    cache_key = (user.id, unicode(course_id))
+    if cache_key not in overrides_cache:
+        overrides = {}
+        query = StudentFieldOverride.objects.filter(
+            course_id=course_id,
+            student_id=user.id,
+        )
+        for override in query:
+            overrides.setdefault(_location_key(override.location), {})[override.field] = override.value
+        overrides_cache[cache_key] = overrides
+    return overrides_cache[cache_key]
+
+
+def _location_key(location):
+    """
+    The key of the overrides of `location` in the dictionaries returned by
+    `_get_course_overrides_for_user`: the location as stored in the database.
+    """
+    return StudentFieldOverride._meta.get_field('location').get_prep_value(location)
+
+
+def _clear_cached_overrides(user, block):
+    """
+    Forgets the overrides loaded for the `user` in `block`'s course, after they've changed.
+    """
+    overrides_cache = request_cache.get_cache('courseware.student_field_overrides')
+    overrides_cache.pop((user.id, unicode(block.runtime.course_id)), None)
+    getattr(block, '_student_overrides', {}).pop(user.id, None)
+
+
 def override_field_for_user(user, block, name, value):
     """
     Overrides a field for the `user`.  `block` and `name` specify the block
@@ -70,6 +105,7 @@ def override_field_for_user(user, block, name, value):
     field = block.fields[name]
     override.value = json.dumps(field.to_json(value))
     override.save()
+    _clear_cached_overrides(user, block)
 
 
 def clear_override_for_user(user, block, name):
@@ -87,3 +123,4 @@ def clear_override_for_user(user, block, name):
             field=name).delete()
     except StudentFieldOverride.DoesNotExist:
         pass
+    _clear_cached_overrides(user, block)
@@ -5,6 +5,7 @@ import unittest
 from nose.plugins.attrib import attr
 
 from django.test.utils import override_settings
+from mock import Mock
 from xblock.field_data import DictFieldData
 from xmodule.modulestore.tests.factories import CourseFactory
 from xmodule.modulestore.tests.django_utils import (
@@ -12,6 +13,7 @@ from xmodule.modulestore.tests.django_utils import (
 )
 
 from ..field_overrides import (
+    _lineage,
     disable_overrides,
     FieldOverrideProvider,
     OverrideFieldData,
@@ -116,6 +118,28 @@ class ResolveDottedTests(unittest.TestCase):
         )
 
 
+@attr('shard_1')
+class LineageTests(unittest.TestCase):
+    """
+    Tests for `_lineage`.
+    """
+
+    def test_lineage_memoized(self):
+        root = Mock(spec=['get_parent'], get_parent=Mock(return_value=None))
+        parent = Mock(spec=['get_parent'], get_parent=Mock(return_value=root))
+        first = Mock(spec=['get_parent'], get_parent=Mock(return_value=parent))
+        second = Mock(spec=['get_parent'], get_parent=Mock(return_value=parent))
+
+        self.assertEqual(_lineage(first), (parent, root))
+        self.assertEqual(_lineage(first), (parent, root))
+        self.assertEqual(_lineage(second), (parent, root))
+        self.assertEqual(_lineage(root), ())
+
+        # Siblings share their parent's lineage.
+        self.assertEqual(parent.get_parent.call_count, 1)
+        self.assertEqual(first.get_parent.call_count, 1)
+
+
 class TestOverrideProvider(FieldOverrideProvider):
     """
     A concrete implementation of `FieldOverrideProvider` for testing.
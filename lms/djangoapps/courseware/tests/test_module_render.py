@@ -39,6 +39,7 @@ from courseware.tests.tests import LoginEnrollmentTestCase
 from courseware.tests.test_submitting_problems import TestSubmittingProblems
 from lms.djangoapps.lms_xblock.runtime import quote_slashes
 from lms.djangoapps.lms_xblock.field_data import LmsFieldData
+from openedx.core.djangoapps.content.block_fragments.cache import invalidate_course
 from student.models import anonymous_id_for_user
 from xmodule.modulestore.tests.django_utils import (
     TEST_DATA_MIXED_TOY_MODULESTORE,
@@ -627,11 +628,14 @@ class TestTOC(ModuleStoreTestCase):
     #     - 1 for its grandchildren
     # Split makes 6 queries to load the course to depth 2:
     #     - load the structure
-    #     - load 5 definitions
+    #     - load 5 definitions (the course's and 4 videos'), each on its own:
+    #       they're read as soon as their blocks are created, so none of them
+    #       are waiting to be loaded together
     # Split makes 5 queries to render the toc:
     #     - it loads the active version at the start of the bulk operation
     #     - it loads 4 definitions, because it instantiates 4 VideoModules
-    #       each of which access a Scope.content field in __init__
+    #       each of which access a Scope.content field in __init__ (the
+    #       definitions aren't cached between requests under the test settings)
     @ddt.data((ModuleStoreEnum.Type.mongo, 3, 0, 0), (ModuleStoreEnum.Type.split, 6, 0, 5))
     @ddt.unpack
     def test_toc_toy_from_chapter(self, default_ms, setup_finds, setup_sends, toc_finds):
@@ -667,11 +671,14 @@ class TestTOC(ModuleStoreTestCase):
     #     - 1 for its grandchildren
     # Split makes 6 queries to load the course to depth 2:
     #     - load the structure
-    #     - load 5 definitions
+    #     - load 5 definitions (the course's and 4 videos'), each on its own:
+    #       they're read as soon as their blocks are created, so none of them
+    #       are waiting to be loaded together
     # Split makes 5 queries to render the toc:
     #     - it loads the active version at the start of the bulk operation
     #     - it loads 4 definitions, because it instantiates 4 VideoModules
-    #       each of which access a Scope.content field in __init__
+    #       each of which access a Scope.content field in __init__ (the
+    #       definitions aren't cached between requests under the test settings)
     @ddt.data((ModuleStoreEnum.Type.mongo, 3, 0, 0), (ModuleStoreEnum.Type.split, 6, 0, 5))
     @ddt.unpack
     def test_toc_toy_from_section(self, default_ms, setup_finds, setup_sends, toc_finds):
@@ -1171,6 +1178,69 @@ class TestHtmlModifiers(ModuleStoreTestCase):
         )
 
 
+@patch.dict('django.conf.settings.FEATURES', {'ENABLE_BLOCK_FRAGMENT_CACHE': True})
+class TestBlockFragmentCache(ModuleStoreTestCase):
+    """
+    Tests that the rendered fragments of html blocks are shared between users.
+    """
+    def setUp(self):
+        super(TestBlockFragmentCache, self).setUp()
+        self.course = CourseFactory.create()
+        self.descriptor = ItemFactory.create(
+            category='html',
+            parent_location=self.course.location,
+            data='<p>Shared content</p><a href="/course/bar/content">link</a>',
+        )
+
+    def _render(self, user=None):
+        """
+        Render the html block for a new request by `user` (by default, a new user),
+        returning the request token and the rendered content.
+        """
+        request = RequestFactory().get('/')
+        request.user = user or UserFactory.create()
+        request.session = {}
+        field_data_cache = FieldDataCache.cache_for_descriptor_descendents(
+            self.course.id, request.user, self.descriptor
+        )
+        module = render.get_module_for_descriptor(
+            request.user, request, self.descriptor, field_data_cache, self.course.id
+        )
+        return render.xblock_request_token(request), module.render(STUDENT_VIEW).content
+
+    def test_shared_between_users(self):
+        first_token, first_content = self._render()
+        with patch('xmodule.html_module.HtmlModule.get_html') as get_html:
+            second_token, second_content = self._render()
+        self.assertFalse(get_html.called)
+        self.assertIn(second_token, second_content)
+        self.assertEqual(second_content, first_content.replace(first_token, second_token))
+
+    def test_invalidated_on_publish(self):
+        self._render()
+        invalidate_course(self.course.id)
+        with patch('xmodule.html_module.HtmlModule.get_html', return_value='changed') as get_html:
+            __, content = self._render()
+        self.assertTrue(get_html.called)
+        self.assertIn('changed', content)
+
+    def test_personalized_not_shared(self):
+        self.descriptor.data = '<p>%%USER_ID%%</p>'
+        self.descriptor = self.store.update_item(self.descriptor, self.user.id)
+        user = UserFactory.create()
+        __, content = self._render(user)
+        self.assertIn(anonymous_id_for_user(user, None), content)
+        other_user = UserFactory.create()
+        __, content = self._render(other_user)
+        self.assertIn(anonymous_id_for_user(other_user, None), content)
+
+    def test_staff_not_cached(self):
+        with patch('xmodule.html_module.HtmlModule.get_html', return_value='<p>Rendered for staff</p>'):
+            self._render(GlobalStaffFactory.create())
+        __, content = self._render()
+        self.assertNotIn('Rendered for staff', content)
+
+
 class XBlockWithJsonInitData(XBlock):
     """
     Pure XBlock to use in tests, with JSON init data.
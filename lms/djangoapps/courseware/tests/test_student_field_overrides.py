@@ -0,0 +1,63 @@
+"""
+Tests for `student_field_overrides` module.
+"""
+from datetime import datetime
+
+from nose.plugins.attrib import attr
+from pytz import UTC
+
+from request_cache.middleware import RequestCache
+from student.tests.factories import UserFactory
+from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
+
+from ..student_field_overrides import (
+    clear_override_for_user,
+    get_override_for_user,
+    override_field_for_user,
+)
+
+
+@attr('shard_1')
+class StudentFieldOverridesTests(ModuleStoreTestCase):
+    """
+    Tests for individual student field overrides.
+    """
+
+    def setUp(self):
+        super(StudentFieldOverridesTests, self).setUp()
+        self.user = UserFactory.create()
+        self.course = CourseFactory.create()
+        self.chapter = ItemFactory.create(parent=self.course, category='chapter')
+        self.sequentials = [
+            ItemFactory.create(parent=self.chapter, category='sequential') for __ in range(3)
+        ]
+        self.due = datetime(2015, 11, 1, tzinfo=UTC)
+        RequestCache.clear_request_cache()
+        self.addCleanup(RequestCache.clear_request_cache)
+
+    def test_course_overrides_loaded_at_once(self):
+        for sequential in self.sequentials[:2]:
+            override_field_for_user(self.user, sequential, 'due', self.due)
+        RequestCache.clear_request_cache()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                [get_override_for_user(self.user, sequential, 'due') for sequential in self.sequentials],
+                [self.due, self.due, None]
+            )
+            self.assertIsNone(get_override_for_user(self.user, self.chapter, 'due'))
+
+    def test_overrides_changed(self):
+        sequential = self.sequentials[0]
+        self.assertIsNone(get_override_for_user(self.user, sequential, 'due'))
+
+        override_field_for_user(self.user, sequential, 'due', self.due)
+        self.assertEqual(get_override_for_user(self.user, sequential, 'due'), self.due)
+
+        clear_override_for_user(self.user, sequential, 'due')
+        self.assertIsNone(get_override_for_user(self.user, sequential, 'due'))
+
+    def test_other_users(self):
+        override_field_for_user(self.user, self.sequentials[0], 'due', self.due)
+        self.assertIsNone(get_override_for_user(UserFactory.create(), self.sequentials[0], 'due'))
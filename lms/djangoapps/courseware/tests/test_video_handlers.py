@@ -13,6 +13,7 @@ from datetime import timedelta, datetime
 from webob import Request
 from mock import MagicMock, Mock, patch
 
+from xmodule.contentstore.asset_index import invalidate_course_asset_index
 from xmodule.contentstore.content import StaticContent
 from xmodule.contentstore.django import contentstore
 from xmodule.modulestore.django import modulestore
@@ -107,6 +108,7 @@ def _upload_file(subs_file, location, filename):
     content = StaticContent(content_location, filename, mime_type, subs_file.read())
     contentstore().save(content)
     del_cached_content(content.location)
+    invalidate_course_asset_index(location.course_key)
 
 
 def attach_sub(item, filename):
@@ -17,8 +17,10 @@ from django.contrib.auth.models import User
 from xblock.fields import Scope, ScopeBase
 from courseware.models import StudentModule, StudentModuleHistory
 from edx_user_state_client.interface import XBlockUserStateClient, XBlockUserState
+from opaque_keys.edx.keys import UsageKey
 
 from openedx.core.djangoapps.call_stack_manager import donottrack
+from util.query import DEFAULT_BATCH_SIZE, iter_by_pk
 
 
 class DjangoXBlockUserStateClient(XBlockUserStateClient):
@@ -346,6 +348,30 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
 
             yield XBlockUserState(username, block_key, state, history_entry.created, scope)
 
+    def _iter_all(self, student_modules, course_key, scope, batch_size):
+        """
+        Yields XBlockUserState tuples for each of the given StudentModules (in the given course)
+        which have state, reading them from the read replica in batches of `batch_size`.
+        """
+        rows = iter_by_pk(
+            student_modules,
+            fields=('student__username', 'module_state_key', 'state', 'modified'),
+            batch_size=batch_size or DEFAULT_BATCH_SIZE,
+        )
+        for username, module_state_key, state, modified in rows:
+            if state is None:
+                continue
+
+            state = json.loads(state)
+
+            # If the state is the empty dict, then it has been deleted, and so
+            # conformant UserStateClients should treat it as if it doesn't exist.
+            if state == {}:
+                continue
+
+            usage_key = UsageKey.from_string(module_state_key).map_into_course(course_key)
+            yield XBlockUserState(username, usage_key, state, modified, scope)
+
     @donottrack(StudentModule, StudentModuleHistory)
     def iter_all_for_block(self, block_key, scope=Scope.user_state, batch_size=None):
         """
@@ -355,7 +381,11 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         """
         if scope != Scope.user_state:
             raise ValueError("Only Scope.user_state is supported")
-        raise NotImplementedError()
+        student_modules = StudentModule.objects.filter(
+            course_id=block_key.course_key,
+            module_state_key=block_key,
+        )
+        return self._iter_all(student_modules, block_key.course_key, scope, batch_size)
 
     @donottrack(StudentModule, StudentModuleHistory)
     def iter_all_for_course(self, course_key, block_type=None, scope=Scope.user_state, batch_size=None):
@@ -366,4 +396,7 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         """
         if scope != Scope.user_state:
             raise ValueError("Only Scope.user_state is supported")
-        raise NotImplementedError()
+        student_modules = StudentModule.objects.filter(course_id=course_key)
+        if block_type is not None:
+            student_modules = student_modules.filter(module_type=block_type)
+        return self._iter_all(student_modules, course_key, scope, batch_size)
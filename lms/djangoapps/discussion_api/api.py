@@ -39,7 +39,8 @@ from django_comment_common.signals import (
 from django_comment_client.utils import get_accessible_discussion_modules, is_commentable_cohorted
 from lms.lib.comment_client.comment import Comment
 from lms.lib.comment_client.thread import Thread
-from lms.lib.comment_client.utils import CommentClientRequestError
+from lms.lib.comment_client.user import User as CommentClientUser
+from lms.lib.comment_client.utils import CommentClientRequestError, call_concurrently
 from openedx.core.djangoapps.course_groups.cohorts import get_cohort_id
 
 
@@ -298,7 +299,9 @@ def get_thread_list(
         })
 
     course = _get_course_or_404(course_key, request.user)
-    context = get_context(course, request)
+    # The requester is retrieved along with the threads below
+    cc_requester = CommentClientUser.from_django_user(request.user)
+    context = get_context(course, request, cc_requester=cc_requester)
 
     query_params = {
         "user_id": unicode(request.user.id),
@@ -324,12 +327,21 @@ def get_thread_list(
             })
 
     if following:
-        threads, result_page, num_pages = context["cc_requester"].subscribed_threads(query_params)
+        follower = CommentClientUser(id=unicode(request.user.id), course_id=course.id)
+        __, (threads, result_page, num_pages) = call_concurrently(
+            cc_requester.retrieve,
+            lambda: follower.subscribed_threads(query_params),
+        )
     else:
         query_params["course_id"] = unicode(course.id)
         query_params["commentable_ids"] = ",".join(topic_id_list) if topic_id_list else None
         query_params["text"] = text_search
-        threads, result_page, num_pages, text_search_rewrite = Thread.search(query_params)
+        __, (threads, result_page, num_pages, text_search_rewrite) = call_concurrently(
+            cc_requester.retrieve,
+            lambda: Thread.search(query_params),
+        )
+    cc_requester["course_id"] = course.id
+
     # The comments service returns the last page of results if the requested
     # page is beyond the last page, but we want be consistent with DRF's general
     # behavior and return a 404 in that case
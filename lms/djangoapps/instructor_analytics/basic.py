@@ -20,6 +20,7 @@ from microsite_configuration import microsite
 from student.models import CourseEnrollmentAllowed
 from edx_proctoring.api import get_all_exam_attempts
 from courseware.models import StudentModule
+from util.query import iter_by_pk
 from certificates.models import GeneratedCertificate
 from django.db.models import Count
 from certificates.models import CertificateStatuses
@@ -389,15 +390,17 @@ def list_problem_responses(course_key, problem_location):
     if problem_key.course_key != course_key:
         return []
 
-    smdat = StudentModule.objects.filter(
-        course_id=course_key,
-        module_state_key=problem_key
+    smdat = iter_by_pk(
+        StudentModule.objects.filter(
+            course_id=course_key,
+            module_state_key=problem_key
+        ),
+        fields=('student_id', 'student__username', 'state'),
     )
-    smdat = smdat.order_by('student')
 
     return [
-        {'username': response.student.username, 'state': response.state}
-        for response in smdat
+        {'username': username, 'state': state}
+        for __, username, state in sorted(smdat)
     ]
 
 
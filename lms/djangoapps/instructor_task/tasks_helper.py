@@ -19,11 +19,11 @@ from celery.states import SUCCESS, FAILURE
 from django.contrib.auth.models import User
 from django.core.files.storage import DefaultStorage
 from django.db import transaction, reset_queries
-from django.db.models import Q
 import dogstats_wrapper as dog_stats_api
 from pytz import UTC
 from StringIO import StringIO
 from edxmako.shortcuts import render_to_string
+from request_cache.middleware import RequestCache
 from instructor.paidcourse_enrollment_report import PaidCourseEnrollmentReportProvider
 from shoppingcart.models import (
     PaidCourseRegistration, CourseRegCodeItem, InvoiceTransaction,
@@ -33,6 +33,7 @@ from survey.models import SurveyAnswer
 
 from track.views import task_track
 from util.db import outer_atomic
+from util.query import iter_by_pk
 from util.file import course_filename_prefix_generator, UniversalNewlineIterator
 from xblock.runtime import KvsFieldData
 from xmodule.modulestore.django import modulestore
@@ -44,7 +45,7 @@ from certificates.models import (
     CertificateStatuses,
     GeneratedCertificate
 )
-from certificates.api import generate_user_certificates
+from certificates.api import generate_certificates_for_students
 from courseware.courses import get_course_by_id, get_problems_in_section
 from courseware.grades import iterate_grades_for
 from courseware.models import StudentModule
@@ -59,7 +60,7 @@ from instructor_analytics.basic import (
 from instructor_analytics.csvs import format_dictlist
 from instructor_task.models import ReportStore, InstructorTask, PROGRESS
 from lms.djangoapps.lms_xblock.runtime import LmsPartitionService
-from openedx.core.djangoapps.course_groups.cohorts import get_cohort
+from openedx.core.djangoapps.course_groups.cohorts import get_cohorts_for_users
 from openedx.core.djangoapps.course_groups.models import CourseUserGroup
 from openedx.core.djangoapps.content.course_structures.models import CourseStructure
 from opaque_keys.edx.keys import UsageKey
@@ -285,9 +286,16 @@ def run_main_task(entry_id, task_fcn, action_name):
         TASK_LOG.error(message)
         raise ValueError(message)
 
-    # Now do the work
-    with dog_stats_api.timer('instructor_tasks.time.overall', tags=[u'action:{name}'.format(name=action_name)]):
-        task_progress = task_fcn(entry_id, course_id, task_input, action_name)
+    # Now do the work.  Celery workers never pass through the RequestCache
+    # middleware, so empty the request cache around the task ourselves: values
+    # cached by an earlier task (such as a student's due date extensions) would
+    # otherwise be stale here, and would pile up for the life of the worker.
+    RequestCache.clear_request_cache()
+    try:
+        with dog_stats_api.timer('instructor_tasks.time.overall', tags=[u'action:{name}'.format(name=action_name)]):
+            task_progress = task_fcn(entry_id, course_id, task_input, action_name)
+    finally:
+        RequestCache.clear_request_cache()
 
     # Release any queries that the connection has been hanging onto
     reset_queries()
@@ -375,6 +383,12 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
     task_progress = TaskProgress(action_name, modules_to_update.count(), start_time)
     task_progress.update_task_state()
 
+    # The modules are read in batches, and from the primary database since they're written back.
+    modules_to_update = iter_by_pk(
+        modules_to_update,
+        read_replica=False,
+        progress_callback=lambda __: task_progress.update_task_state(),
+    )
     for module_to_update in modules_to_update:
         task_progress.attempted += 1
         module_descriptor = problems[unicode(module_to_update.module_state_key)]
@@ -688,7 +702,12 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
     course_is_cohorted = is_course_cohorted(course.id)
     teams_enabled = course.teams_enabled
     cohorts_header = ['Cohort Name'] if course_is_cohorted else []
+    # Look up the cohorts of all the students at once, rather than one student at a time
+    student_cohorts = get_cohorts_for_users(
+        course_id, enrolled_students.values_list('id', flat=True)
+    ) if course_is_cohorted else {}
     teams_header = ['Team Name'] if teams_enabled else []
+    student_teams = CourseTeamMembership.get_teams_for_users(course_id) if teams_enabled else {}
 
     experiment_partitions = get_split_user_partitions(course.user_partitions)
     group_configs_header = [u'Experiment Group ({})'.format(partition.name) for partition in experiment_partitions]
@@ -750,7 +769,7 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
 
             cohorts_group_name = []
             if course_is_cohorted:
-                group = get_cohort(student, course_id, assign=False)
+                group = student_cohorts.get(student.id)
                 cohorts_group_name.append(group.name if group else '')
 
             group_configs_group_names = []
@@ -760,11 +779,8 @@ def upload_grades_csv(_xmodule_instance_args, _entry_id, course_id, _task_input,
 
             team_name = []
             if teams_enabled:
-                try:
-                    membership = CourseTeamMembership.objects.get(user=student, team__course_id=course_id)
-                    team_name.append(membership.team.name)
-                except CourseTeamMembership.DoesNotExist:
-                    team_name.append('')
+                team = student_teams.get(student.id)
+                team_name.append(team.name if team else '')
 
             enrollment_mode = CourseEnrollment.enrollment_mode_for_user(student, course_id)[0]
             verification_status = SoftwareSecurePhotoVerification.verification_status_for_user(
@@ -1435,19 +1451,15 @@ def generate_students_certificates(
     task_progress.update_task_state(extra_meta=current_step)
 
     course = modulestore().get_course(course_id, depth=0)
-    # Generate certificate for each student
-    for student in students_require_certs:
-        task_progress.attempted += 1
-        status = generate_user_certificates(
-            student,
-            course_id,
-            course=course
-        )
-
-        if status in [CertificateStatuses.generating, CertificateStatuses.downloadable]:
-            task_progress.succeeded += 1
-        else:
-            task_progress.failed += 1
+    # Generate certificates for the students a batch at a time, reporting progress after each batch
+    for results in generate_certificates_for_students(students_require_certs, course_id, course=course):
+        for __, status in results:
+            task_progress.attempted += 1
+            if status in [CertificateStatuses.generating, CertificateStatuses.downloadable]:
+                task_progress.succeeded += 1
+            else:
+                task_progress.failed += 1
+        task_progress.update_task_state(extra_meta=current_step)
 
     return task_progress.update_task_state(extra_meta=current_step)
 
@@ -1560,12 +1572,14 @@ def students_require_certificate(course_id, enrolled_students, statuses_to_regen
         return list(students_require_certificates)
     else:
         # compute those students whose certificates are already generated
-        students_already_have_certs = User.objects.filter(
-            ~Q(generatedcertificate__status=CertificateStatuses.unavailable),
-            generatedcertificate__course_id=course_id)
+        students_already_have_certs = GeneratedCertificate.objects.filter(
+            course_id=course_id
+        ).exclude(
+            status=CertificateStatuses.unavailable
+        ).values('user_id')
 
         # Return all the enrolled student skipping the ones whose certificates have already been generated
-        return list(set(enrolled_students) - set(students_already_have_certs))
+        return list(enrolled_students.exclude(id__in=students_already_have_certs))
 
 
 def invalidate_generated_certificates(course_id, enrolled_students, certificate_statuses):  # pylint: disable=invalid-name
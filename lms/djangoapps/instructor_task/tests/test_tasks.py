@@ -16,6 +16,7 @@ from xmodule.modulestore.exceptions import ItemNotFoundError
 from opaque_keys.edx.locations import i4xEncoder
 
 from courseware.models import StudentModule
+from request_cache import get_cache
 from courseware.tests.factories import StudentModuleFactory
 from student.tests.factories import UserFactory, CourseEnrollmentFactory
 
@@ -222,6 +223,12 @@ class TestRescoreInstructorTask(TestInstructorTasks):
     def test_rescore_with_no_state(self):
         self._test_run_with_no_state(rescore_problem, 'rescored')
 
+    def test_rescore_clears_request_cache(self):
+        # Values cached by an earlier task in the same worker must not leak into this one
+        get_cache('courseware.student_field_overrides')['stale'] = {}
+        self._test_run_with_no_state(rescore_problem, 'rescored')
+        self.assertEqual(get_cache('courseware.student_field_overrides'), {})
+
     def test_rescore_with_failure(self):
         self._test_run_with_failure(rescore_problem, 'We expected this to fail')
 
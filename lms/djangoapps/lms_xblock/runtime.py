@@ -212,8 +212,32 @@ class LmsModuleSystem(ModuleSystem):  # pylint: disable=abstract-method
         services['fs'] = xblock.reference.plugins.FSService()
         services['settings'] = SettingsService()
         self.request_token = kwargs.pop('request_token', None)
+        self.fragment_cache = kwargs.pop('fragment_cache', None)
+        if self.fragment_cache is not None:
+            self.fragment_cache.partition_service = services['partitions']
         super(LmsModuleSystem, self).__init__(**kwargs)
 
+    def get_cached_fragment(self, block, view_name, context):
+        """
+        Return the fragment cached for `block`'s `view_name` view by this runtime's
+        BlockFragmentCache, if any.
+
+        See :meth:`xmodule.x_module.ModuleSystem.get_cached_fragment`
+        """
+        if self.fragment_cache is None or self.applicable_aside_types(block):
+            return None
+        return self.fragment_cache.get(block, view_name)
+
+    def render(self, block, view_name, context=None):
+        """
+        Render the block as usual, caching the resulting fragment if this runtime has a
+        BlockFragmentCache and the block's asides don't need rendering too.
+        """
+        frag = super(LmsModuleSystem, self).render(block, view_name, context)
+        if self.fragment_cache is not None and not self.applicable_aside_types(block):
+            self.fragment_cache.set(block, view_name, frag, self.anonymous_student_id)
+        return frag
+
     def handler_url(self, *args, **kwargs):
         """
         Implement the XBlock runtime handler_url interface.
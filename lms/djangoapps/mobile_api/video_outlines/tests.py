@@ -7,11 +7,12 @@ import ddt
 import itertools
 from uuid import uuid4
 from collections import namedtuple
+from mock import patch
 
 from edxval import api
 from mobile_api.models import MobileApiConfig
 from xmodule.modulestore.tests.factories import ItemFactory
-from xmodule.video_module import transcripts_utils
+from xmodule.video_module import transcripts_utils, VideoDescriptor
 from xmodule.modulestore.django import modulestore
 from xmodule.partitions.partitions import Group, UserPartition
 
@@ -603,6 +604,20 @@ class TestVideoSummaryList(
         self.assertEqual(course_outline[2]['summary']['size'], 0)
         self.assertFalse(course_outline[2]['summary']['only_on_web'])
 
+    def test_outline_from_cached_blocks(self):
+        self.login_and_enroll()
+        self._create_video_with_subs()
+        with patch.object(
+            VideoDescriptor, 'get_transcripts_info', autospec=True, side_effect=VideoDescriptor.get_transcripts_info
+        ) as mock_get_transcripts_info:
+            for __ in range(2):
+                course_outline = self.api_response().data
+                self.assertEqual(len(course_outline), 1)
+                self.assertEqual(course_outline[0]['summary']['language'], 'en')
+
+        # the videos' data is collected once, and then read from the cached block structure
+        self.assertEqual(mock_get_transcripts_info.call_count, 1)
+
     def test_with_nameless_unit(self):
         self.login_and_enroll()
         ItemFactory.create(
@@ -0,0 +1,126 @@
+"""
+Video Summary Transformer
+"""
+from openedx.core.lib.block_cache.transformer import BlockStructureTransformer
+
+
+class VideoSummaryTransformer(BlockStructureTransformer):
+    """
+    Collects everything the mobile video outline needs to know about each
+    video in a course, other than which videos the user can access: the
+    video's place in the course outline, and the data summarizing it
+    (without its encodings, which are looked up in VAL for the whole course
+    at once).
+    """
+    VERSION = 1
+
+    SUMMARY = 'summary'
+    PATH = 'path'
+    URL_KWARGS = 'url_kwargs'
+    HIDDEN_FROM_TOC = 'hidden_from_toc'
+
+    @classmethod
+    def name(cls):
+        """
+        Unique identifier for the transformer's class;
+        same identifier used in setup.py.
+        """
+        return "mobile_api:video_summary"
+
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collects the outline data of each of the course's videos.
+        """
+        # The chain of ancestors of each block, starting from the root
+        # block, following each block's first parent.
+        ancestors = {}
+
+        for block_key in block_structure.topological_traversal():
+            parents = block_structure.get_parents(block_key)
+            ancestors[block_key] = ancestors[parents[0]] + [parents[0]] if parents else []
+
+            if block_key.block_type != 'video':
+                continue
+
+            video = block_structure.get_xblock(block_key)
+            outline_ancestors = [block_structure.get_xblock(ancestor_key) for ancestor_key in ancestors[block_key]]
+
+            # For now, videos in (or under) blocks with the 'hide_from_toc' setting
+            # are left out of the outline, as these blocks may not have human-readable
+            # names to display on the mobile clients.
+            block_structure.set_transformer_block_field(
+                block_key,
+                cls,
+                cls.HIDDEN_FROM_TOC,
+                any(block.hide_from_toc for block in outline_ancestors + [video]),
+            )
+            block_structure.set_transformer_block_field(
+                block_key,
+                cls,
+                cls.PATH,
+                [
+                    {
+                        # to be consistent with other edx-platform clients, return the defaulted display name
+                        'name': block.display_name_with_default,
+                        'category': block.category,
+                        'id': unicode(block.location),
+                    }
+                    for block in outline_ancestors[1:]
+                ],
+            )
+            block_structure.set_transformer_block_field(
+                block_key, cls, cls.URL_KWARGS, cls._get_url_kwargs(block_structure, ancestors[block_key])
+            )
+            block_structure.set_transformer_block_field(block_key, cls, cls.SUMMARY, cls._get_summary(video))
+
+    @staticmethod
+    def _get_url_kwargs(block_structure, ancestor_keys):
+        """
+        Returns the kwargs (other than the course id) of the courseware URL of
+        the section and unit of the block with the given ancestors.
+        """
+        url_kwargs = {}
+        if len(ancestor_keys) > 1:
+            url_kwargs['chapter'] = ancestor_keys[1].block_id
+        if len(ancestor_keys) > 2:
+            url_kwargs['section'] = ancestor_keys[2].block_id
+        if len(ancestor_keys) > 3:
+            section_children = block_structure.get_children(ancestor_keys[2])
+            position = 1
+            for child_key in section_children:
+                if child_key.block_id == ancestor_keys[3].block_id:
+                    break
+                position += 1
+            url_kwargs['position'] = position
+        return url_kwargs
+
+    @staticmethod
+    def _get_summary(video):
+        """
+        Returns the data summarizing the given video which doesn't depend on
+        the request.
+        """
+        summary = {
+            'name': video.display_name,
+            'only_on_web': video.only_on_web,
+        }
+        if video.only_on_web:
+            return summary
+
+        transcripts_info = video.get_transcripts_info()
+        summary.update({
+            'edx_video_id': video.edx_video_id,
+            'html5_sources': video.html5_sources,
+            'source': video.source,
+            'transcript_languages': video.available_translations(transcripts_info, verify_assets=False),
+            'language': video.get_default_transcript_language(transcripts_info),
+        })
+        return summary
+
+    def transform(self, usage_info, block_structure):
+        """
+        The outline data is only read from the block structure, so there's
+        nothing to do for the user.
+        """
+        pass
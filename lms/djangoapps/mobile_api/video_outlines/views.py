@@ -15,11 +15,13 @@ from rest_framework import generics
 from rest_framework.response import Response
 from opaque_keys.edx.locator import BlockUsageLocator
 
+from lms.djangoapps.course_blocks.api import get_course_blocks, COURSE_BLOCK_ACCESS_TRANSFORMERS
 from xmodule.exceptions import NotFoundError
 from xmodule.modulestore.django import modulestore
 
 from ..utils import mobile_view, mobile_course_access
 from .serializers import BlockOutline, video_summary
+from .transformers import VideoSummaryTransformer
 
 
 @mobile_view()
@@ -74,13 +76,18 @@ class VideoSummaryList(generics.ListAPIView):
               Management System.
     """
 
-    @mobile_course_access(depth=None)
+    @mobile_course_access()
     def list(self, request, course, *args, **kwargs):
         video_profiles = MobileApiConfig.get_video_profiles()
+        block_structure = get_course_blocks(
+            request.user,
+            course.location,
+            transformers=COURSE_BLOCK_ACCESS_TRANSFORMERS + [VideoSummaryTransformer()],
+        )
         video_outline = list(
             BlockOutline(
                 course.id,
-                course,
+                block_structure,
                 {"video": partial(video_summary, video_profiles)},
                 request,
                 video_profiles,
@@ -8,6 +8,7 @@ from model_utils import FieldTracker
 from django.core.exceptions import ObjectDoesNotExist
 from django.contrib.auth.models import User
 from django.db import models
+from django.db.models import F
 from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy
 from django_countries.fields import CountryField
@@ -152,6 +153,17 @@ class CourseTeam(models.Model):
         self.team_size = CourseTeamMembership.objects.filter(team=self).count()
         self.save()
 
+    def update_team_size(self, delta):
+        """Add delta to team_size, as a single UPDATE which doesn't need the
+        team's memberships to be counted.
+
+        The update is made in the database, rather than by saving this
+        object, so that concurrent membership changes can't overwrite each
+        other's.
+        """
+        CourseTeam.objects.filter(pk=self.pk).update(team_size=F('team_size') + delta)
+        self.team_size += delta
+
 
 class CourseTeamMembership(models.Model):
     """This model represents the membership of a single user in a single team."""
@@ -192,22 +204,20 @@ class CourseTeamMembership(models.Model):
 
     def save(self, *args, **kwargs):
         """Customize save method to set the last_activity_at if it does not
-        currently exist. Also resets the team's size if this model is
+        currently exist. Also increments the team's size if this model is
         being created.
         """
-        should_reset_team_size = False
-        if self.pk is None:
-            should_reset_team_size = True
+        is_new = self.pk is None
         if not self.last_activity_at:
             self.last_activity_at = datetime.utcnow().replace(tzinfo=pytz.utc)
         super(CourseTeamMembership, self).save(*args, **kwargs)
-        if should_reset_team_size:
-            self.team.reset_team_size()
+        if is_new:
+            self.team.update_team_size(1)
 
     def delete(self, *args, **kwargs):
-        """Recompute the related team's team_size after deleting a membership"""
+        """Decrement the related team's team_size after deleting a membership"""
         super(CourseTeamMembership, self).delete(*args, **kwargs)
-        self.team.reset_team_size()
+        self.team.update_team_size(-1)
 
     @classmethod
     def get_memberships(cls, username=None, course_ids=None, team_id=None):
@@ -229,6 +239,25 @@ class CourseTeamMembership(models.Model):
 
         return queryset
 
+    @classmethod
+    def get_teams_for_users(cls, course_id, user_ids=None):
+        """
+        Get the teams of users in a course, in a single query.
+
+        Args:
+            course_id: the course_id of the course we're interested in
+            user_ids (list of int, optional): The ids of the users to get the
+              teams of. Defaults to all of the users on teams in the course.
+
+        Returns:
+            A dict of the users' CourseTeams, keyed by their ids. Users who
+            aren't on a team in the course are left out.
+        """
+        queryset = cls.objects.filter(team__course_id=course_id).select_related('team')
+        if user_ids is not None:
+            queryset = queryset.filter(user_id__in=user_ids)
+        return {membership.user_id: membership.team for membership in queryset}
+
     @classmethod
     def user_in_team_for_course(cls, user, course_id):
         """
@@ -87,6 +87,31 @@ class TeamMembershipTest(SharedModuleStoreTestCase):
         team = CourseTeam.objects.get(id=self.team1.id)
         self.assertEqual(team.team_size, 3)
 
+    def test_team_size_concurrent_memberships(self):
+        """Test that the team size field counts the memberships created
+        through stale copies of the team.
+        """
+        user4 = UserFactory.create(username='user4')
+        CourseEnrollmentFactory.create(user=user4, course_id=COURSE_KEY1)
+        stale_team = CourseTeam.objects.get(id=self.team1.id)
+        self.team1.add_user(self.user3)
+        stale_team.add_user(user4)
+        self.assertEqual(CourseTeam.objects.get(id=self.team1.id).team_size, 4)
+
+    @ddt.data(
+        (None, {'user1': 'team1', 'user2': 'team1'}),
+        (['user1', 'user3'], {'user1': 'team1'}),
+    )
+    @ddt.unpack
+    def test_get_teams_for_users(self, usernames, expected_teams):
+        user_ids = [getattr(self, username).id for username in usernames] if usernames is not None else None
+        with self.assertNumQueries(1):
+            teams = CourseTeamMembership.get_teams_for_users(COURSE_KEY1, user_ids)
+            self.assertEqual(
+                {user_id: team.team_id for user_id, team in teams.items()},
+                {getattr(self, username).id: team_id for username, team_id in expected_teams.items()}
+            )
+
     @ddt.data(
         (None, None, None, 3),
         ('user1', None, None, 2),
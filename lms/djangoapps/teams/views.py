@@ -155,7 +155,7 @@ class TeamsDashboardView(GenericAPIView):
 
         user = request.user
 
-        user_teams = CourseTeam.objects.filter(membership__user=user)
+        user_teams = CourseTeam.objects.filter(membership__user=user).prefetch_related('membership__user')
         user_teams_data = self._serialize_and_paginate(
             MyTeamsPagination,
             user_teams,
@@ -463,7 +463,7 @@ class TeamsListView(ExpandableFieldViewMixin, GenericAPIView):
             serializer = self.get_serializer(page, many=True)
             order_by_input = None
         else:
-            queryset = CourseTeam.objects.filter(**result_filter)
+            queryset = CourseTeam.objects.filter(**result_filter).prefetch_related('membership__user')
             order_by_input = request.query_params.get('order_by', 'name')
             if order_by_input == 'name':
                 # MySQL does case-insensitive order_by.
@@ -1131,7 +1131,7 @@ class MembershipListView(ExpandableFieldViewMixin, GenericAPIView):
             return Response(status=status.HTTP_404_NOT_FOUND)
 
         course_module = modulestore().get_course(team.course_id)
-        if course_module.teams_max_size is not None and team.users.count() >= course_module.teams_max_size:
+        if course_module.teams_max_size is not None and team.team_size >= course_module.teams_max_size:
             return Response(
                 build_api_error(ugettext_noop("This team is already full.")),
                 status=status.HTTP_400_BAD_REQUEST
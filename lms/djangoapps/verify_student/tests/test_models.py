@@ -317,6 +317,21 @@ class TestPhotoVerification(ModuleStoreTestCase):
         attempt.save()
         assert_true(SoftwareSecurePhotoVerification.user_is_verified(user), attempt.status)
 
+    def test_verified_user_ids(self):
+        """
+        Test that the verified users among many are looked up together.
+        """
+        verified_user, unverified_user, other_user = UserFactory.create_batch(3)
+        SoftwareSecurePhotoVerification.objects.create(user=verified_user, status="approved")
+        SoftwareSecurePhotoVerification.objects.create(user=unverified_user, status="denied")
+        SoftwareSecurePhotoVerification.objects.create(user=other_user, status="approved")
+
+        with self.assertNumQueries(1):
+            verified_user_ids = SoftwareSecurePhotoVerification.verified_user_ids(
+                [verified_user.id, unverified_user.id]
+            )
+        assert_equals(verified_user_ids, {verified_user.id})
+
     def test_user_has_valid_or_pending(self):
         """
         Determine whether we have to prompt this user to verify, or if they've
@@ -275,6 +275,11 @@ VIRTUAL_UNIVERSITIES = ENV_TOKENS.get('VIRTUAL_UNIVERSITIES', [])
 META_UNIVERSITIES = ENV_TOKENS.get('META_UNIVERSITIES', {})
 COMMENTS_SERVICE_URL = ENV_TOKENS.get("COMMENTS_SERVICE_URL", '')
 COMMENTS_SERVICE_KEY = ENV_TOKENS.get("COMMENTS_SERVICE_KEY", '')
+COMMENTS_SERVICE_TIMEOUT = ENV_TOKENS.get("COMMENTS_SERVICE_TIMEOUT", 5)
+COMMENTS_SERVICE_POOL_SIZE = ENV_TOKENS.get("COMMENTS_SERVICE_POOL_SIZE", 10)
+COMMENTS_SERVICE_MAX_RETRIES = ENV_TOKENS.get("COMMENTS_SERVICE_MAX_RETRIES", 1)
+COMMENTS_SERVICE_MAX_CONCURRENCY = ENV_TOKENS.get("COMMENTS_SERVICE_MAX_CONCURRENCY", 4)
+COMMENTS_SERVICE_READ_CACHE_TIMEOUT = ENV_TOKENS.get("COMMENTS_SERVICE_READ_CACHE_TIMEOUT", 10)
 CERT_QUEUE = ENV_TOKENS.get("CERT_QUEUE", 'test-pull')
 ZENDESK_URL = ENV_TOKENS.get("ZENDESK_URL")
 FEEDBACK_SUBMISSION_EMAIL = ENV_TOKENS.get("FEEDBACK_SUBMISSION_EMAIL")
@@ -663,6 +668,8 @@ FACEBOOK_API_VERSION = AUTH_TOKENS.get("FACEBOOK_API_VERSION")
 FACEBOOK_APP_SECRET = AUTH_TOKENS.get("FACEBOOK_APP_SECRET")
 FACEBOOK_APP_ID = AUTH_TOKENS.get("FACEBOOK_APP_ID")
 
+BLOCK_FRAGMENT_CACHE_TYPES = ENV_TOKENS.get('BLOCK_FRAGMENT_CACHE_TYPES', BLOCK_FRAGMENT_CACHE_TYPES)
+
 XBLOCK_SETTINGS = ENV_TOKENS.get('XBLOCK_SETTINGS', {})
 XBLOCK_SETTINGS.setdefault("VideoDescriptor", {})["licensing_enabled"] = FEATURES.get("LICENSING", False)
 XBLOCK_SETTINGS.setdefault("VideoModule", {})['YOUTUBE_API_KEY'] = AUTH_TOKENS.get('YOUTUBE_API_KEY', YOUTUBE_API_KEY)
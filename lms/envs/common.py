@@ -399,8 +399,18 @@ FEATURES = {
     # Enable the max score cache to speed up grading
     'ENABLE_MAX_SCORE_CACHE': True,
 
+    # Cache the rendered fragments of blocks whose rendering isn't personalized
+    # (see BLOCK_FRAGMENT_CACHE_TYPES). Needs a cache shared with Studio, so that
+    # publishing a course invalidates its fragments.
+    'ENABLE_BLOCK_FRAGMENT_CACHE': False,
+
     # Enable LTI Provider feature.
     'ENABLE_LTI_PROVIDER': False,
+
+    # Stream the Course Blocks API's JSON responses as they're encoded, rather
+    # than encoding them in full before sending them (large courses' responses
+    # can be many megabytes).
+    'STREAM_COURSE_BLOCKS_API_RESPONSES': False,
 }
 
 # Ignore static asset files on import which match this pattern
@@ -719,6 +729,11 @@ XBLOCK_MIXINS = (LmsBlockMixin, InheritanceMixin, XModuleMixin, EditInfoMixin)
 # Allow any XBlock in the LMS
 XBLOCK_SELECT_FUNCTION = prefer_xmodules
 
+# The block types whose student views are cached when FEATURES['ENABLE_BLOCK_FRAGMENT_CACHE']
+# is set. They must render the same for every user, apart from their user-scoped fields
+# and the user's anonymous id (blocks using either aren't cached).
+BLOCK_FRAGMENT_CACHE_TYPES = ('html',)
+
 ############# ModuleStore Configuration ##########
 
 MODULESTORE_BRANCH = 'published-only'
@@ -2164,8 +2179,12 @@ VERIFY_STUDENT = {
 
 ### This enables the Metrics tab for the Instructor dashboard ###########
 FEATURES['CLASS_DASHBOARD'] = False
-if FEATURES.get('CLASS_DASHBOARD'):
-    INSTALLED_APPS += ('class_dashboard',)
+# The app is installed whether or not the feature is enabled, so that the tables of the
+# metrics it rolls up exist whenever the feature is enabled (e.g. in an environment's settings).
+INSTALLED_APPS += ('class_dashboard',)
+
+# How old (in seconds) a course's rolled up metrics can get before they're rolled up again
+CLASS_DASHBOARD_ROLLUP_MAX_AGE = 60 * 60
 
 ################ Enable credit eligibility feature ####################
 ENABLE_CREDIT_ELIGIBILITY = True
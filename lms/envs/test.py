@@ -237,6 +237,11 @@ CACHES = {
     },
 }
 
+# Call the comments service one request at a time, so that tests see requests in a fixed order
+COMMENTS_SERVICE_MAX_CONCURRENCY = 1
+# Don't cache the comments service's responses, which tests mock differently from one test to the next
+COMMENTS_SERVICE_READ_CACHE_TIMEOUT = 0
+
 # Dummy secret key for dev
 SECRET_KEY = '85920908f28904ed733fe576320db18cabd7b6cd'
 
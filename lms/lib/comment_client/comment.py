@@ -25,6 +25,7 @@ class Comment(models.Model):
 
     base_url = "{prefix}/comments".format(prefix=settings.PREFIX)
     type = 'comment'
+    read_cached = True
 
     @property
     def thread(self):
@@ -65,6 +66,7 @@ class Comment(models.Model):
             metric_action='comment.abuse.flagged'
         )
         voteable._update_from_response(response)
+        voteable._invalidate_read_cache()
 
     def unFlagAbuse(self, user, voteable, removeAll):
         if voteable.type == 'thread':
@@ -86,6 +88,7 @@ class Comment(models.Model):
             metric_action='comment.abuse.unflagged'
         )
         voteable._update_from_response(response)
+        voteable._invalidate_read_cache()
 
 
 def _url_for_thread_comments(thread_id):
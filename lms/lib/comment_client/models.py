@@ -1,5 +1,6 @@
 import logging
 
+from . import read_cache
 from .utils import extract, perform_request, CommentClientRequestError
 
 
@@ -14,6 +15,8 @@ class Model(object):
     base_url = None
     default_retrieve_params = {}
     metric_tag_fields = []
+    # whether changes to instances need to invalidate their course's cached reads (see read_cache)
+    read_cached = False
 
     DEFAULT_ACTIONS_WITH_ID = ['get', 'put', 'delete']
     DEFAULT_ACTIONS_WITHOUT_ID = ['get_all', 'post']
@@ -110,6 +113,13 @@ class Model(object):
                     )
                 )
 
+    def _invalidate_read_cache(self):
+        """
+        Invalidate the cached reads of this instance's course, if they include it.
+        """
+        if self.read_cached:
+            read_cache.invalidate_course(self.attributes.get('course_id'))
+
     def updatable_attributes(self):
         return extract(self.attributes, self.updatable_fields)
 
@@ -152,6 +162,7 @@ class Model(object):
             )
         self.retrieved = True
         self._update_from_response(response)
+        self._invalidate_read_cache()
         self.after_save(self)
 
     def delete(self):
@@ -159,6 +170,7 @@ class Model(object):
         response = perform_request('delete', url, metric_tags=self._metric_tags, metric_action='model.delete')
         self.retrieved = True
         self._update_from_response(response)
+        self._invalidate_read_cache()
 
     @classmethod
     def url_with_id(cls, params={}):
@@ -0,0 +1,206 @@
+"""
+A short-lived cache of the comments service's responses to reads of threads.
+
+Thread lists and threads are read far more often than they're written, so responses are
+cached for COMMENTS_SERVICE_READ_CACHE_TIMEOUT seconds under the current generation of
+their course. Saving or deleting any of the course's threads or comments (or voting on,
+flagging or pinning them) moves the generation on, invalidating everything cached for it.
+
+The comments service sets some fields of threads for the user they're read for (whether
+the user has read them). These are cached separately for each user, so the rest of the
+response is shared by everyone making the same request; the group a user reads as is one
+of the request's params, so users only share responses with the rest of their group.
+"""
+import copy
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Default for COMMENTS_SERVICE_READ_CACHE_TIMEOUT: how many seconds responses are cached for
+# (0 disables the cache)
+DEFAULT_READ_CACHE_TIMEOUT = 10
+
+# Fields of threads which the comments service sets for the user they're read for
+USER_SPECIFIC_FIELDS = ('read', 'unread_comments_count')
+
+# Request params which filter the response for the user, or change the user's read state;
+# requests with any of these set aren't cached.
+UNCACHEABLE_PARAMS = ('unread', 'mark_as_read')
+
+
+def _timeout():
+    """
+    How many seconds responses are cached for.
+    """
+    return getattr(settings, 'COMMENTS_SERVICE_READ_CACHE_TIMEOUT', DEFAULT_READ_CACHE_TIMEOUT)
+
+
+def _course_generation_key(course_id):
+    """
+    The cache key of the generation of the responses cached for `course_id`.
+    """
+    return u'comment_client.read_cache.course.{}'.format(course_id)
+
+
+def _user_generation_key(user_id):
+    """
+    The cache key of the generation of the user-specific fields cached for `user_id`.
+    """
+    return u'comment_client.read_cache.user.{}'.format(user_id)
+
+
+def _get_generations(keys):
+    """
+    Return the current generations stored under `keys`, as a tuple.
+    """
+    generations = cache.get_many(keys)
+    for key in keys:
+        if generations.get(key) is None:
+            # Start from the current time rather than 0, so that responses cached under
+            # an evicted generation are never mistaken for current ones.
+            cache.add(key, int(time.time() * 1000), None)
+            generations[key] = cache.get(key)
+    return tuple(generations[key] for key in keys)
+
+
+def _bump_generation(key):
+    """
+    Move the generation stored under `key` on.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), None)
+
+
+def invalidate_course(course_id):
+    """
+    Invalidate all of the responses cached for `course_id`.
+    """
+    if course_id is not None:
+        _bump_generation(_course_generation_key(course_id))
+
+
+def invalidate_user(user_id):
+    """
+    Invalidate all of the user-specific fields cached for `user_id`.
+    """
+    if user_id is not None:
+        _bump_generation(_user_generation_key(user_id))
+
+
+def _threads(response):
+    """
+    The threads in `response`, which is either a page of threads or a single thread.
+    """
+    return response['collection'] if 'collection' in response else [response]
+
+
+def _split_response(response):
+    """
+    Split `response` into a copy of it without USER_SPECIFIC_FIELDS, and a dict of those
+    fields' values by thread id.
+    """
+    shared = copy.deepcopy(response)
+    user_fields = {}
+    for thread in _threads(shared):
+        user_fields[thread.get('id')] = {
+            field: thread.pop(field) for field in USER_SPECIFIC_FIELDS if field in thread
+        }
+    return shared, user_fields
+
+
+def _merge_response(shared, user_fields):
+    """
+    Add the user-specific fields split from a response by `_split_response` back into it.
+    """
+    for thread in _threads(shared):
+        thread.update(user_fields.get(thread.get('id'), {}))
+    return shared
+
+
+class ReadCache(object):
+    """
+    The cached response to a single GET request for threads.
+
+    Usage:
+
+        read = ReadCache(url, params, course_id)
+        response = read.get()
+        if response is None:
+            response = perform_request('get', url, params)
+            read.set(response)
+    """
+    def __init__(self, url, params, course_id=None):
+        """
+        Arguments:
+            url (str): The url being requested
+            params (dict): The params of the request. The user_id param, if any, only
+                affects USER_SPECIFIC_FIELDS.
+            course_id (str): The course the request is for, if known in advance. If not,
+                it's taken from the response.
+        """
+        self.course_id = course_id
+        self.user_id = params.get('user_id')
+        self.enabled = _timeout() > 0 and not any(params.get(param) for param in UNCACHEABLE_PARAMS)
+        shared_params = {name: value for name, value in params.iteritems() if name != 'user_id'}
+        digest = hashlib.sha1(json.dumps([url, shared_params], sort_keys=True, default=unicode)).hexdigest()
+        self.key = u'comment_client.read_cache.{}'.format(digest)
+        self.user_key = u'{}.user.{}'.format(self.key, self.user_id)
+        self.generations = None
+
+    def _generations(self, course_id):
+        """
+        The current generations of `course_id` and of the user, as a tuple.
+        """
+        keys = [_course_generation_key(course_id)]
+        if self.user_id is not None:
+            keys.append(_user_generation_key(self.user_id))
+        return _get_generations(keys)
+
+    def get(self):
+        """
+        Return the cached response, or None if there isn't a current one.
+        """
+        if not self.enabled:
+            return None
+        keys = [self.key] + ([self.user_key] if self.user_id is not None else [])
+        entries = cache.get_many(keys)
+        shared = entries.get(self.key)
+        if shared is not None:
+            self.course_id = shared['course_id']
+        if self.course_id is None:
+            return None
+
+        # Note the generations before the request is made, so that a response made stale
+        # by a write while it's being requested is never cached as current.
+        self.generations = self._generations(self.course_id)
+        if shared is None or shared['generation'] != self.generations[0]:
+            return None
+        if self.user_id is None:
+            return shared['response']
+        user_entry = entries.get(self.user_key)
+        if user_entry is None or user_entry['generations'] != self.generations:
+            return None
+        return _merge_response(shared['response'], user_entry['fields'])
+
+    def set(self, response):
+        """
+        Cache `response`, which is the comments service's response to the request.
+        """
+        if not self.enabled:
+            return
+        course_id = self.course_id or response.get('course_id')
+        if course_id is None:
+            return
+        generations = self.generations or self._generations(course_id)
+        shared, user_fields = _split_response(response)
+        entries = {
+            self.key: {'course_id': course_id, 'generation': generations[0], 'response': shared},
+        }
+        if self.user_id is not None:
+            entries[self.user_key] = {'generations': generations, 'fields': user_fields}
+        cache.set_many(entries, _timeout())
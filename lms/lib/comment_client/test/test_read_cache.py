@@ -0,0 +1,101 @@
+"""
+Tests for the cache of reads of threads from the comments service
+"""
+import json
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.utils import override_settings
+from mock import Mock, patch
+
+from lms.lib.comment_client import Comment, Thread, read_cache
+
+COURSE_ID = u'edX/test/2015'
+
+
+def _thread(thread_id, read=False):
+    """ A thread as returned by the comments service """
+    return {
+        'id': thread_id,
+        'course_id': COURSE_ID,
+        'title': 'Thread {}'.format(thread_id),
+        'read': read,
+        'unread_comments_count': 0 if read else 3,
+    }
+
+
+@override_settings(COMMENTS_SERVICE_READ_CACHE_TIMEOUT=60)
+@patch('lms.lib.comment_client.utils.requests.Session.request')
+class ReadCacheTestCase(TestCase):
+    """ Tests for the comment client's read cache """
+
+    def setUp(self):
+        super(ReadCacheTestCase, self).setUp()
+        cache.clear()
+
+    def _respond(self, mock_request, data):
+        """ Make the comments service respond with `data` """
+        mock_request.return_value = Mock(status_code=200, text=json.dumps(data), json=lambda: data)
+
+    def _search(self, **params):
+        """ Search the course's threads """
+        params.setdefault('course_id', COURSE_ID)
+        return Thread.search(params)[0]
+
+    def test_search_shared_between_users(self, mock_request):
+        self._respond(mock_request, {'collection': [_thread('1', read=True)], 'page': 1, 'num_pages': 1})
+        self.assertTrue(self._search(user_id='1', group_id=1)[0]['read'])
+        self.assertTrue(self._search(user_id='1', group_id=1)[0]['read'])
+        self.assertEqual(mock_request.call_count, 1)
+
+        # Another user's read state isn't taken from the cache, but the rest of the response is
+        self._respond(mock_request, {'collection': [_thread('1')], 'page': 1, 'num_pages': 1})
+        self.assertFalse(self._search(user_id='2', group_id=1)[0]['read'])
+        self.assertEqual(self._search(group_id=1)[0], {'id': '1', 'course_id': COURSE_ID, 'title': 'Thread 1'})
+        self.assertEqual(mock_request.call_count, 2)
+
+        # Other groups don't share responses
+        self._search(user_id='1', group_id=2)
+        self.assertEqual(mock_request.call_count, 3)
+
+    def test_uncacheable_params(self, mock_request):
+        self._respond(mock_request, {'collection': [_thread('1')], 'page': 1, 'num_pages': 1})
+        self._search(user_id='1', unread='true')
+        self._search(user_id='1', unread='true')
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_invalidated_by_writes(self, mock_request):
+        self._respond(mock_request, {'collection': [_thread('1')], 'page': 1, 'num_pages': 1})
+        self._search(user_id='1')
+        self._respond(mock_request, _thread('2'))
+        Thread(course_id=COURSE_ID, title='Thread 2', body='', user_id='1', commentable_id='a').save()
+        self._search(user_id='1')
+        self.assertEqual(mock_request.call_count, 3)
+
+        self._respond(mock_request, {'id': '3', 'course_id': COURSE_ID, 'thread_id': '1', 'body': ''})
+        Comment(id='3').delete()
+        self._search(user_id='1')
+        self.assertEqual(mock_request.call_count, 5)
+
+        # Changes to other courses don't invalidate the course's reads
+        read_cache.invalidate_course(u'edX/other/2015')
+        self._search(user_id='1')
+        self.assertEqual(mock_request.call_count, 5)
+
+    def test_retrieve(self, mock_request):
+        self._respond(mock_request, _thread('1', read=True))
+        self.assertTrue(Thread(id='1').retrieve(user_id='1', mark_as_read=False).read)
+        self.assertTrue(Thread(id='1').retrieve(user_id='1', mark_as_read=False).read)
+        self.assertEqual(mock_request.call_count, 1)
+
+        # Marking a thread as read is never served from the cache, and invalidates the user's read states
+        Thread(id='1').retrieve(user_id='1')
+        Thread(id='1').retrieve(user_id='1', mark_as_read=False)
+        self.assertEqual(mock_request.call_count, 3)
+
+    @override_settings(COMMENTS_SERVICE_READ_CACHE_TIMEOUT=0)
+    def test_disabled(self, mock_request):
+        self._respond(mock_request, {'collection': [_thread('1')], 'page': 1, 'num_pages': 1})
+        self._search(user_id='1')
+        self._search(user_id='1')
+        self.assertEqual(mock_request.call_count, 2)
@@ -0,0 +1,78 @@
+"""
+Tests for the comment client's request utilities
+"""
+import threading
+
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils import translation
+from mock import Mock, patch
+from requests.packages.urllib3.exceptions import ConnectTimeoutError, ReadTimeoutError
+
+from lms.lib.comment_client import utils
+
+
+@override_settings(COMMENTS_SERVICE_MAX_CONCURRENCY=4)
+class CallConcurrentlyTestCase(TestCase):
+    """ Tests for call_concurrently """
+
+    def test_results_in_order(self):
+        threads = []
+
+        def call(value):
+            """ Returns a function recording its thread and returning `value` """
+            def func():  # pylint: disable=missing-docstring
+                threads.append(threading.current_thread())
+                return value
+            return func
+
+        self.assertEqual(utils.call_concurrently(call(1), call(2), call(3)), [1, 2, 3])
+        self.assertIn(threading.current_thread(), threads)
+        self.assertGreater(len(set(threads)), 1)
+
+    def test_first_exception_raised(self):
+        second = Mock(side_effect=ValueError)
+        third = Mock(side_effect=KeyError)
+        with self.assertRaises(ValueError):
+            utils.call_concurrently(lambda: 1, second, third)
+        self.assertTrue(third.called)
+
+    def test_language_passed_on(self):
+        with translation.override('eo'):
+            self.assertEqual(
+                utils.call_concurrently(translation.get_language, translation.get_language),
+                ['eo', 'eo']
+            )
+
+    @override_settings(COMMENTS_SERVICE_MAX_CONCURRENCY=1)
+    def test_sequential(self):
+        self.assertEqual(
+            utils.call_concurrently(threading.current_thread, threading.current_thread),
+            [threading.current_thread()] * 2
+        )
+
+
+class PerformRequestTestCase(TestCase):
+    """ Tests for perform_request """
+
+    @override_settings(COMMENTS_SERVICE_TIMEOUT=2)
+    @patch('lms.lib.comment_client.utils.requests.Session.request')
+    def test_session_reused(self, mock_request):
+        mock_request.return_value = Mock(status_code=200, text='{}', json=lambda: {})
+        utils.perform_request('get', 'http://localhost:4567/api/v1/threads')
+        utils.perform_request('get', 'http://localhost:4567/api/v1/users/1')
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_request.call_args[1]['timeout'], 2)
+        self.assertIs(utils.get_session(), utils.get_session())
+
+    def test_read_timeout_not_retried(self):
+        retries = utils.get_session().get_adapter('http://localhost:4567').max_retries
+        url = '/api/v1/threads/1/comments'
+        with self.assertRaises(ReadTimeoutError):
+            retries.increment('POST', url, error=ReadTimeoutError(None, url, 'Read timed out.'))
+
+    def test_connect_timeout_retried(self):
+        retries = utils.get_session().get_adapter('http://localhost:4567').max_retries
+        url = '/api/v1/threads/1/comments'
+        retried = retries.increment('POST', url, error=ConnectTimeoutError('Connect timed out.'))
+        self.assertEqual(retried.connect, retries.connect - 1)
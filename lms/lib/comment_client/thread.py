@@ -4,6 +4,7 @@ from eventtracking import tracker
 from .utils import merge_dict, strip_blank, strip_none, extract, perform_request
 from .utils import CommentClientRequestError
 import models
+import read_cache
 import settings
 
 log = logging.getLogger(__name__)
@@ -41,6 +42,7 @@ class Thread(models.Model):
     base_url = "{prefix}/threads".format(prefix=settings.PREFIX)
     default_retrieve_params = {'recursive': False}
     type = 'thread'
+    read_cached = True
 
     @classmethod
     def search(cls, query_params):
@@ -57,14 +59,18 @@ class Thread(models.Model):
             url = cls.url(action='get_all', params=extract(params, 'commentable_id'))
             if params.get('commentable_id'):
                 del params['commentable_id']
-        response = perform_request(
-            'get',
-            url,
-            params,
-            metric_tags=[u'course_id:{}'.format(query_params['course_id'])],
-            metric_action='thread.search',
-            paged_results=True
-        )
+        read = read_cache.ReadCache(url, params, course_id=query_params['course_id'])
+        response = read.get()
+        if response is None:
+            response = perform_request(
+                'get',
+                url,
+                params,
+                metric_tags=[u'course_id:{}'.format(query_params['course_id'])],
+                metric_action='thread.search',
+                paged_results=True
+            )
+            read.set(response)
         if query_params.get('text'):
             search_query = query_params['text']
             course_id = query_params['course_id']
@@ -131,13 +137,19 @@ class Thread(models.Model):
         }
         request_params = strip_none(request_params)
 
-        response = perform_request(
-            'get',
-            url,
-            request_params,
-            metric_action='model.retrieve',
-            metric_tags=self._metric_tags
-        )
+        read = read_cache.ReadCache(url, request_params, course_id=self.attributes.get('course_id'))
+        response = read.get()
+        if response is None:
+            response = perform_request(
+                'get',
+                url,
+                request_params,
+                metric_action='model.retrieve',
+                metric_tags=self._metric_tags
+            )
+            read.set(response)
+        if request_params['mark_as_read']:
+            read_cache.invalidate_user(request_params.get('user_id'))
         self._update_from_response(response)
 
     def flagAbuse(self, user, voteable):
@@ -156,6 +168,7 @@ class Thread(models.Model):
             metric_tags=self._metric_tags
         )
         voteable._update_from_response(response)
+        voteable._invalidate_read_cache()
 
     def unFlagAbuse(self, user, voteable, removeAll):
         if voteable.type == 'thread':
@@ -177,6 +190,7 @@ class Thread(models.Model):
             metric_action='thread.abuse.unflagged'
         )
         voteable._update_from_response(response)
+        voteable._invalidate_read_cache()
 
     def pin(self, user, thread_id):
         url = _url_for_pin_thread(thread_id)
@@ -189,6 +203,7 @@ class Thread(models.Model):
             metric_action='thread.pin'
         )
         self._update_from_response(response)
+        self._invalidate_read_cache()
 
     def un_pin(self, user, thread_id):
         url = _url_for_un_pin_thread(thread_id)
@@ -201,6 +216,7 @@ class Thread(models.Model):
             metric_action='thread.unpin'
         )
         self._update_from_response(response)
+        self._invalidate_read_cache()
 
 
 def _url_for_flag_abuse_thread(thread_id):
@@ -65,6 +65,7 @@ class User(models.Model):
             metric_tags=self._metric_tags + ['target.type:{}'.format(voteable.type)],
         )
         voteable._update_from_response(response)
+        voteable._invalidate_read_cache()
 
     def unvote(self, voteable):
         if voteable.type == 'thread':
@@ -82,6 +83,7 @@ class User(models.Model):
             metric_tags=self._metric_tags + ['target.type:{}'.format(voteable.type)],
         )
         voteable._update_from_response(response)
+        voteable._invalidate_read_cache()
 
     def active_threads(self, query_params={}):
         if not self.course_id:
@@ -2,13 +2,110 @@ from contextlib import contextmanager
 import dogstats_wrapper as dog_stats_api
 import logging
 import requests
+from requests.packages.urllib3.util.retry import Retry
+import sys
+import threading
 from django.conf import settings
+from multiprocessing.pool import ThreadPool
 from time import time
 from uuid import uuid4
+from django.utils import translation
 from django.utils.translation import get_language
 
 log = logging.getLogger(__name__)
 
+# Defaults for the settings which tune how the comments service is called:
+# COMMENTS_SERVICE_TIMEOUT: seconds to wait for the comments service to respond
+DEFAULT_TIMEOUT = 5
+# COMMENTS_SERVICE_POOL_SIZE: the most connections to the comments service kept open per process
+DEFAULT_POOL_SIZE = 10
+# COMMENTS_SERVICE_MAX_RETRIES: how often to retry failed connections (requests which reached
+# the comments service are never retried)
+DEFAULT_MAX_RETRIES = 1
+# COMMENTS_SERVICE_MAX_CONCURRENCY: the most calls made at once by call_concurrently
+DEFAULT_MAX_CONCURRENCY = 4
+
+_session = None
+_pool = None
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_session():
+    """
+    Return the process's requests.Session for calling the comments service, which keeps
+    connections to it alive between requests.
+    """
+    global _session  # pylint: disable=global-statement
+    if _session is None:
+        with _lock:
+            if _session is None:
+                pool_size = getattr(settings, 'COMMENTS_SERVICE_POOL_SIZE', DEFAULT_POOL_SIZE)
+                max_retries = getattr(settings, 'COMMENTS_SERVICE_MAX_RETRIES', DEFAULT_MAX_RETRIES)
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=pool_size,
+                    # Only retry connecting: a request which timed out after it was sent may
+                    # have been handled anyway, and sending it again could (for instance)
+                    # create a duplicate post.
+                    max_retries=Retry(total=max_retries, connect=max_retries, read=False, redirect=0),
+                )
+                session = requests.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session = session
+    return _session
+
+
+def _get_pool():
+    """
+    Return the process's pool of threads for call_concurrently.
+    """
+    global _pool  # pylint: disable=global-statement
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = ThreadPool(getattr(settings, 'COMMENTS_SERVICE_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY))
+    return _pool
+
+
+def call_concurrently(*funcs):
+    """
+    Call each of `funcs` (which take no arguments) at the same time, returning a list of
+    their results. If any raise an exception, the first one to (in the order of `funcs`)
+    is re-raised once they've all finished.
+
+    This is for making independent calls to the comments service without waiting for each
+    in turn, so `funcs` shouldn't do anything else which depends on the current thread
+    (such as querying the database); the active language is passed on to them.
+    """
+    max_concurrency = getattr(settings, 'COMMENTS_SERVICE_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY)
+    if len(funcs) < 2 or max_concurrency < 2 or getattr(_local, 'in_pool', False):
+        return [func() for func in funcs]
+
+    language = get_language()
+
+    def call(func):
+        """
+        Call `func` in a pool thread, returning its result or the exception info it raised.
+        """
+        _local.in_pool = True
+        try:
+            with translation.override(language):
+                return func(), None
+        except Exception:  # pylint: disable=broad-except
+            return None, sys.exc_info()
+        finally:
+            _local.in_pool = False
+
+    # Make the first call in this thread, rather than waiting for the others idly.
+    pending = [_get_pool().apply_async(call, (func,)) for func in funcs[1:]]
+    outcomes = [call(funcs[0])] + [result.get() for result in pending]
+    for __, exc_info in outcomes:
+        if exc_info is not None:
+            raise exc_info[0], exc_info[1], exc_info[2]
+    return [result for result, __ in outcomes]
+
 
 def strip_none(dic):
     return dict([(k, v) for k, v in dic.iteritems() if v is not None])
@@ -76,13 +173,13 @@ def perform_request(method, url, data_or_params=None, raw=False,
         data = None
         params = merge_dict(data_or_params, request_id_dict)
     with request_timer(request_id, method, url, metric_tags):
-        response = requests.request(
+        response = get_session().request(
             method,
             url,
             data=data,
             params=params,
             headers=headers,
-            timeout=5
+            timeout=getattr(settings, 'COMMENTS_SERVICE_TIMEOUT', DEFAULT_TIMEOUT)
         )
 
     metric_tags.append(u'status_code:{}'.format(response.status_code))
@@ -2,3 +2,4 @@
 Setup the signals on startup.
 """
 import openedx.core.djangoapps.content.course_structures.signals
+import openedx.core.djangoapps.content.block_fragments.signals
@@ -0,0 +1,8 @@
+"""
+A cache of the rendered fragments of XBlocks whose rendering doesn't depend on the
+user viewing them, so that the LMS can serve them without instantiating or
+rendering the blocks again.
+
+Cached fragments are invalidated when their course is published, so the cache
+has to be shared between the LMS and Studio.
+"""
@@ -0,0 +1,150 @@
+"""
+Caching of rendered XBlock fragments.
+"""
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.utils.translation import get_language
+from xblock.fields import UserScope
+from xblock.fragment import Fragment
+
+from xmodule.x_module import STUDENT_VIEW
+
+# Stands in for the request token (which is unique to each request) in cached fragments.
+REQUEST_TOKEN_PLACEHOLDER = u'%%REQUEST_TOKEN%%'
+
+# How long rendered fragments are cached for, in seconds.
+FRAGMENT_CACHE_TIMEOUT = 24 * 60 * 60
+
+
+def _generation_cache_key(course_key):
+    """
+    The cache key of the generation of `course_key`'s cached fragments.
+    """
+    return u'block_fragments.generation.{}'.format(course_key)
+
+
+def get_course_generation(course_key):
+    """
+    Return the current generation of `course_key`'s cached fragments. Fragments are
+    cached under their course's generation, so changing it invalidates them all.
+    """
+    key = _generation_cache_key(course_key)
+    generation = cache.get(key)
+    if generation is None:
+        # Start from the current time rather than 0, so that fragments cached under
+        # an evicted generation are never mistaken for current ones.
+        cache.add(key, int(time.time() * 1000), None)
+        generation = cache.get(key)
+    return generation
+
+
+def invalidate_course(course_key):
+    """
+    Invalidate all of `course_key`'s cached fragments.
+    """
+    key = _generation_cache_key(course_key)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), None)
+
+
+class BlockFragmentCache(object):
+    """
+    Caches the fragments rendered for a user by the blocks of a course, for use
+    by any other user who would see exactly the same fragment.
+
+    Only the student views of the given block types are cached, and then only when
+    none of the block's user-scoped fields are set and the fragment doesn't contain
+    the user's anonymous id; the block types must otherwise render the same for every
+    user. Fragments are cached as wrapped by the runtime, so anything which changes
+    how the runtime wraps fragments must be in `wrapper_settings`.
+    """
+    def __init__(self, course_key, block_types, request_token, partition_service=None, wrapper_settings=()):
+        """
+        Arguments:
+            course_key (CourseKey): The course whose blocks are being rendered
+            block_types (set): The types of the blocks to cache
+            request_token (str): The token unique to the current request, which is
+                substituted into cached fragments
+            partition_service (PartitionService): Used to find the user's groups in the
+                partitions that a block restricts access by
+            wrapper_settings (tuple): Anything else on which the wrapped fragments depend
+        """
+        self.course_key = course_key
+        self.block_types = block_types
+        self.request_token = request_token
+        self.partition_service = partition_service
+        self.wrapper_settings = wrapper_settings
+        self._generation = None
+
+    def get(self, block, view_name):
+        """
+        Return the fragment cached for `block`'s `view_name` view, or None.
+        """
+        key = self._cache_key(block, view_name)
+        if key is None:
+            return None
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        if self.request_token:
+            cached['content'] = cached['content'].replace(REQUEST_TOKEN_PLACEHOLDER, self.request_token)
+        return Fragment.from_dict(cached)
+
+    def set(self, block, view_name, frag, anonymous_student_id=None):
+        """
+        Cache `frag`, rendered by `block`'s `view_name` view, if it's not personalized.
+        """
+        key = self._cache_key(block, view_name)
+        if key is None:
+            return
+        if anonymous_student_id and anonymous_student_id in frag.content:
+            return
+        cached = frag.to_dict()
+        if self.request_token:
+            cached['content'] = cached['content'].replace(self.request_token, REQUEST_TOKEN_PLACEHOLDER)
+        cache.set(key, cached, FRAGMENT_CACHE_TIMEOUT)
+
+    def _cache_key(self, block, view_name):
+        """
+        The key `block`'s `view_name` fragment is cached under, or None if it can't be cached.
+        """
+        if view_name != STUDENT_VIEW or block.scope_ids.block_type not in self.block_types:
+            return None
+        if any(
+                field.scope.user == UserScope.ONE and field.is_set_on(block)
+                for field in block.fields.itervalues()
+        ):
+            return None
+
+        if self._generation is None:
+            self._generation = get_course_generation(self.course_key)
+        key_parts = [
+            unicode(self._generation),
+            unicode(block.scope_ids.usage_id),
+            view_name,
+            unicode(get_language()),
+            unicode(self._partition_groups(block)),
+            unicode(self.wrapper_settings),
+        ]
+        return u'block_fragments.{}'.format(
+            hashlib.sha1(u'|'.join(key_parts).encode('utf-8')).hexdigest()
+        )
+
+    def _partition_groups(self, block):
+        """
+        The user's group in each of the partitions that `block` restricts access by.
+        """
+        group_access = getattr(block, 'group_access', None)
+        if not group_access or self.partition_service is None:
+            return []
+        groups = []
+        for partition_id in sorted(group_access):
+            try:
+                groups.append((partition_id, self.partition_service.get_user_group_id_for_partition(partition_id)))
+            except ValueError:
+                groups.append((partition_id, None))
+        return groups
@@ -0,0 +1,26 @@
+"""
+Signal handlers for invalidating cached block fragments.
+"""
+from django.dispatch.dispatcher import receiver
+
+from xmodule.modulestore.django import SignalHandler
+
+from .cache import invalidate_course
+
+
+@receiver(SignalHandler.course_published)
+def _listen_for_course_publish(sender, course_key, **kwargs):  # pylint: disable=unused-argument
+    """
+    Catches the signal that a course has been published in the module
+    store and invalidates the course's cached fragments.
+    """
+    invalidate_course(course_key)
+
+
+@receiver(SignalHandler.course_deleted)
+def _listen_for_course_delete(sender, course_key, **kwargs):  # pylint: disable=unused-argument
+    """
+    Catches the signal that a course has been deleted from the module
+    store and invalidates the course's cached fragments.
+    """
+    invalidate_course(course_key)
@@ -0,0 +1,75 @@
+"""
+Tests for the block fragment cache.
+"""
+from django.test import TestCase
+from mock import Mock
+from opaque_keys.edx.locator import CourseLocator
+from xblock.fragment import Fragment
+
+from xmodule.x_module import STUDENT_VIEW
+
+from .cache import BlockFragmentCache, get_course_generation, invalidate_course
+
+
+class BlockFragmentCacheTestCase(TestCase):
+    """
+    Tests for BlockFragmentCache.
+    """
+    def setUp(self):
+        super(BlockFragmentCacheTestCase, self).setUp()
+        self.course_key = CourseLocator('org', 'course', 'run')
+        self.block = self._block('html')
+        self.partition_service = Mock()
+        self.partition_service.get_user_group_id_for_partition.return_value = 1
+
+    def _block(self, block_type, group_access=None):
+        """
+        A mock block of `block_type`, with no fields.
+        """
+        block = Mock(fields={}, group_access=group_access or {})
+        block.scope_ids.block_type = block_type
+        block.scope_ids.usage_id = self.course_key.make_usage_key(block_type, 'block')
+        return block
+
+    def _cache(self, request_token='token'):
+        """
+        A BlockFragmentCache of html blocks, for a request with `request_token`.
+        """
+        return BlockFragmentCache(
+            self.course_key, {'html'}, request_token, partition_service=self.partition_service
+        )
+
+    def test_request_token_replaced(self):
+        frag = Fragment(u'<div data-request-token="first">content</div>')
+        frag.add_javascript(u'var x;')
+        self._cache('first').set(self.block, STUDENT_VIEW, frag)
+
+        cached = self._cache('second').get(self.block, STUDENT_VIEW)
+        self.assertEqual(cached.content, u'<div data-request-token="second">content</div>')
+        self.assertEqual(cached.resources, frag.resources)
+
+    def test_not_cached(self):
+        problem = self._block('problem')
+        self._cache().set(problem, STUDENT_VIEW, Fragment(u'problem'))
+        self.assertIsNone(self._cache().get(problem, STUDENT_VIEW))
+
+        self._cache().set(self.block, 'author_view', Fragment(u'author'))
+        self.assertIsNone(self._cache().get(self.block, 'author_view'))
+
+        self._cache().set(self.block, STUDENT_VIEW, Fragment(u'for anon-id'), anonymous_student_id='anon-id')
+        self.assertIsNone(self._cache().get(self.block, STUDENT_VIEW))
+
+    def test_partition_groups(self):
+        block = self._block('html', group_access={10: [1, 2]})
+        self._cache().set(block, STUDENT_VIEW, Fragment(u'group 1'))
+        self.assertEqual(self._cache().get(block, STUDENT_VIEW).content, u'group 1')
+
+        self.partition_service.get_user_group_id_for_partition.return_value = 2
+        self.assertIsNone(self._cache().get(block, STUDENT_VIEW))
+
+    def test_invalidate_course(self):
+        generation = get_course_generation(self.course_key)
+        self._cache().set(self.block, STUDENT_VIEW, Fragment(u'content'))
+        invalidate_course(self.course_key)
+        self.assertNotEqual(get_course_generation(self.course_key), generation)
+        self.assertIsNone(self._cache().get(self.block, STUDENT_VIEW))
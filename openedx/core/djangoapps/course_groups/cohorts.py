@@ -5,8 +5,10 @@ forums, and to the cohort admin views.
 
 import logging
 import random
+import time
 
-from django.db.models.signals import post_save, m2m_changed
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, m2m_changed
 from django.dispatch import receiver
 from django.http import Http404
 from django.utils.translation import ugettext as _
@@ -81,6 +83,182 @@ def _cohort_membership_changed(sender, **kwargs):
         tracker.emit(event_name, event)
 
 
+# How long the cohorts of a course are cached for, in seconds
+COHORTS_CACHE_TIMEOUT = 24 * 60 * 60
+
+# How long the users' memberships of a course's cohorts are cached for, in seconds. This bounds how
+# long an entry can be wrong for if the transaction which changed the membership is rolled back.
+MEMBERSHIP_CACHE_TIMEOUT = 10 * 60
+
+# The number of users whose memberships are looked up in each query by get_cohorts_for_users
+MEMBERSHIP_QUERY_CHUNK_SIZE = 500
+
+# Cached in place of the id of a user's cohort, for users without a cohort
+_NO_COHORT = 0
+
+
+def _cohorts_version_cache_key(course_key):
+    """
+    The cache key of the version of the cached cohorts of `course_key`.
+    """
+    return u"cohorts.version.{}".format(course_key)
+
+
+def _get_cohorts_version(course_key):
+    """
+    Return the current version of the cached cohorts of `course_key`.
+    """
+    key = _cohorts_version_cache_key(course_key)
+    version = cache.get(key)
+    if version is None:
+        # Start from the current time rather than 0, so that cohorts cached under an
+        # evicted version are never mistaken for the current ones.
+        cache.add(key, int(time.time() * 1000), None)
+        version = cache.get(key)
+    return version
+
+
+def _invalidate_cohorts(course_key):
+    """
+    Invalidate the cached cohorts of `course_key`, and all of its users' memberships of them.
+    """
+    key = _cohorts_version_cache_key(course_key)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), None)
+
+
+def _cohort_map_cache_key(course_key, version):
+    """
+    The cache key of the cohorts of `course_key`.
+    """
+    return u"cohorts.cohort_map.{}.{}".format(course_key, version)
+
+
+def _membership_cache_key(course_key, version, user_id):
+    """
+    The cache key of the id of the cohort of the given user in `course_key`.
+    """
+    return u"cohorts.membership.{}.{}.{}".format(course_key, version, user_id)
+
+
+def _cache_memberships(course_key, cohort_ids):
+    """
+    Cache the memberships of users of the cohorts of `course_key`, given a dict of the ids of the
+    users' cohorts (or _NO_COHORT) keyed by the users' ids.
+
+    Memberships are changed by overwriting their cached entries rather than deleting them. The
+    changes aren't committed until later, so a deleted entry could be filled again with the old
+    membership by a concurrent request; but that request only fills entries which are missing
+    (see _get_cohorts_for_users), so it can't overwrite the new one.
+    """
+    version = _get_cohorts_version(course_key)
+    cache.set_many(
+        {
+            _membership_cache_key(course_key, version, user_id): cohort_id
+            for user_id, cohort_id in cohort_ids.iteritems()
+        },
+        MEMBERSHIP_CACHE_TIMEOUT
+    )
+
+
+def _get_cohort_map(course_key, version, refresh=False):
+    """
+    Return a dict of the cohorts of `course_key`, keyed by their ids.
+    """
+    key = _cohort_map_cache_key(course_key, version)
+    cohort_map = None if refresh else cache.get(key)
+    if cohort_map is None:
+        cohort_map = {
+            cohort.id: cohort
+            for cohort in CourseUserGroup.objects.filter(course_id=course_key, group_type=CourseUserGroup.COHORT)
+        }
+        cache.set(key, cohort_map, COHORTS_CACHE_TIMEOUT)
+    return cohort_map
+
+
+@receiver(post_save, sender=CourseUserGroup)
+def _invalidate_cohorts_on_cohort_save(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached cohorts of the cohort's course if the cohort is new, or has been renamed.
+
+    (Cohorts are also saved, unchanged, whenever their memberships change.)
+    """
+    if instance.group_type != CourseUserGroup.COHORT:
+        return
+    cohort_map = cache.get(_cohort_map_cache_key(instance.course_id, _get_cohorts_version(instance.course_id)))
+    if cohort_map is not None:
+        cached_cohort = cohort_map.get(instance.id)
+        if cached_cohort is not None and cached_cohort.name == instance.name:
+            return
+    _invalidate_cohorts(instance.course_id)
+
+
+@receiver(post_delete, sender=CourseUserGroup)
+def _invalidate_cohorts_on_cohort_delete(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached cohorts of the deleted cohort's course.
+    """
+    if instance.group_type == CourseUserGroup.COHORT:
+        _invalidate_cohorts(instance.course_id)
+
+
+@receiver(post_save, sender=CourseCohortsSettings)
+def _invalidate_cohorts_on_settings_save(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached cohorts of the course whose cohort settings have changed (for
+    instance, if it has been cohorted).
+    """
+    _invalidate_cohorts(instance.course_id)
+
+
+@receiver(post_save, sender=CohortMembership)
+def _cache_membership_on_save(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Cache the new membership of the user whose membership has changed.
+    """
+    _cache_memberships(instance.course_id, {instance.user_id: instance.course_user_group_id})
+
+
+@receiver(post_delete, sender=CohortMembership)
+def _cache_membership_on_delete(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Cache that the user whose membership has been deleted no longer has a cohort.
+    """
+    _cache_memberships(instance.course_id, {instance.user_id: _NO_COHORT})
+
+
+@receiver(m2m_changed, sender=CourseUserGroup.users.through)
+def _cache_memberships_on_users_changed(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Cache the new memberships of the users whose cohorts have changed.
+    """
+    action = kwargs["action"]
+    instance = kwargs["instance"]
+    pk_set = kwargs["pk_set"]
+
+    if kwargs["reverse"]:
+        # The cohorts of a user have changed
+        if action == "pre_clear":
+            cohorts = instance.course_groups.filter(group_type=CourseUserGroup.COHORT)
+        elif action in ["post_add", "post_remove"]:
+            cohorts = CourseUserGroup.objects.filter(pk__in=pk_set, group_type=CourseUserGroup.COHORT)
+        else:
+            return
+        for cohort in cohorts:
+            _cache_memberships(cohort.course_id, {instance.id: cohort.id if action == "post_add" else _NO_COHORT})
+    elif instance.group_type == CourseUserGroup.COHORT:
+        # The users of a cohort have changed
+        if action == "post_clear":
+            _invalidate_cohorts(instance.course_id)
+        elif action in ["post_add", "post_remove"]:
+            _cache_memberships(
+                instance.course_id,
+                dict.fromkeys(pk_set, instance.id if action == "post_add" else _NO_COHORT)
+            )
+
+
 # A 'default cohort' is an auto-cohort that is automatically created for a course if no cohort with automatic
 # assignment have been specified. It is intended to be used in a cohorted-course for users who have yet to be assigned
 # to a cohort.
@@ -180,18 +358,28 @@ def get_cohort(user, course_key, assign=True, use_cached=False):
         return request_cache.data.setdefault(cache_key, None)
 
     # If course is cohorted, check if the user already has a cohort.
+    cohort = _get_cohorts_for_users(course_key, [user.id]).get(user.id)
+    if cohort is not None:
+        return request_cache.data.setdefault(cache_key, cohort)
+
+    # Didn't find the group. If we do not want to assign, return here.
+    if not assign:
+        # Do not cache the cohort here, because in the next call assign
+        # may be True, and we will have to assign the user a cohort.
+        return None
+
+    # Check the database before assigning the user a cohort, in case they've
+    # been assigned one since their membership was cached.
     try:
         membership = CohortMembership.objects.get(
             course_id=course_key,
             user_id=user.id,
         )
+        # The cached membership was stale, so correct it.
+        _cache_memberships(course_key, {user.id: membership.course_user_group_id})
         return request_cache.data.setdefault(cache_key, membership.course_user_group)
     except CohortMembership.DoesNotExist:
-        # Didn't find the group. If we do not want to assign, return here.
-        if not assign:
-            # Do not cache the cohort here, because in the next call assign
-            # may be True, and we will have to assign the user a cohort.
-            return None
+        pass
 
     # Otherwise assign the user a cohort.
     membership = CohortMembership.objects.create(
@@ -201,6 +389,67 @@ def get_cohort(user, course_key, assign=True, use_cached=False):
     return request_cache.data.setdefault(cache_key, membership.course_user_group)
 
 
+def get_cohorts_for_users(course_key, user_ids):
+    """Returns the cohorts of the given users in the specified course.
+
+    Memberships are cached, so only the users whose memberships aren't cached
+    are looked up in the database, MEMBERSHIP_QUERY_CHUNK_SIZE at a time.
+    Unlike get_cohort, users without a cohort aren't assigned one.
+
+    Arguments:
+        course_key: CourseKey
+        user_ids: ids of Django Users
+
+    Returns:
+        A dict of the users' CourseUserGroup objects, keyed by their ids. Users
+        without a cohort are left out, as are all users if the course isn't
+        cohorted.
+    """
+    if not get_course_cohort_settings(course_key).is_cohorted:
+        return {}
+    return _get_cohorts_for_users(course_key, user_ids)
+
+
+def _get_cohorts_for_users(course_key, user_ids):
+    """
+    Returns the cohorts of the given users in the specified course (which is
+    assumed to be cohorted), as get_cohorts_for_users does.
+    """
+    version = _get_cohorts_version(course_key)
+    cache_keys = {_membership_cache_key(course_key, version, user_id): user_id for user_id in set(user_ids)}
+    cohort_ids = {
+        cache_keys[cache_key]: cohort_id
+        for cache_key, cohort_id in cache.get_many(cache_keys.keys()).iteritems()
+    }
+
+    uncached_user_ids = sorted(set(cache_keys.values()) - set(cohort_ids))
+    if uncached_user_ids:
+        looked_up_cohort_ids = dict.fromkeys(uncached_user_ids, _NO_COHORT)
+        for index in xrange(0, len(uncached_user_ids), MEMBERSHIP_QUERY_CHUNK_SIZE):
+            looked_up_cohort_ids.update(
+                CohortMembership.objects.filter(
+                    course_id=course_key,
+                    user_id__in=uncached_user_ids[index:index + MEMBERSHIP_QUERY_CHUNK_SIZE],
+                ).values_list('user_id', 'course_user_group_id')
+            )
+        # Only fill in missing entries, in case a membership was changed (and its entry
+        # overwritten) since it was looked up.
+        for user_id, cohort_id in looked_up_cohort_ids.iteritems():
+            cache.add(_membership_cache_key(course_key, version, user_id), cohort_id, MEMBERSHIP_CACHE_TIMEOUT)
+        cohort_ids.update(looked_up_cohort_ids)
+
+    cohort_map = _get_cohort_map(course_key, version)
+    if not set(cohort_ids.values()) - {_NO_COHORT} <= set(cohort_map):
+        # A cohort has been created since the cohorts were cached.
+        cohort_map = _get_cohort_map(course_key, version, refresh=True)
+
+    return {
+        user_id: cohort_map[cohort_id]
+        for user_id, cohort_id in cohort_ids.iteritems()
+        if cohort_id in cohort_map
+    }
+
+
 def _get_default_cohort(course_key):
     """
     Helper method to get a default cohort for assignment in get_cohort
@@ -17,7 +17,7 @@ from student.tests.factories import UserFactory
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.tests.django_utils import TEST_DATA_MIXED_TOY_MODULESTORE, ModuleStoreTestCase
 
-from ..models import CourseUserGroup, CourseCohort, CourseUserGroupPartitionGroup
+from ..models import CourseUserGroup, CourseCohort, CourseUserGroupPartitionGroup, CohortMembership
 from .. import cohorts
 from ..tests.helpers import (
     topic_name_to_id, config_course_cohorts, config_course_cohorts_legacy,
@@ -260,7 +260,7 @@ class TestCohorts(ModuleStoreTestCase):
 
     @ddt.data(
         (True, 3),
-        (False, 9),
+        (False, 5),
     )
     @ddt.unpack
     def test_get_cohort_sql_queries(self, use_cached, num_sql_queries):
@@ -276,6 +276,79 @@ class TestCohorts(ModuleStoreTestCase):
             for __ in range(3):
                 cohorts.get_cohort(user, course.id, use_cached=use_cached)
 
+    def test_get_cohorts_for_users(self):
+        """
+        Make sure cohorts.get_cohorts_for_users() returns the cohorts of the
+        users who have one, without assigning the others one.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        users = [UserFactory(username="test{}".format(index)) for index in range(4)]
+        cohort1 = CohortFactory(course_id=course.id, name="TestCohort1", users=users[:2])
+        cohort2 = CohortFactory(course_id=course.id, name="TestCohort2", users=users[2:3])
+        user_ids = [user.id for user in users]
+
+        self.assertEqual(cohorts.get_cohorts_for_users(course.id, user_ids), {}, "Course isn't cohorted")
+
+        config_course_cohorts(course, is_cohorted=True)
+        expected_cohort_ids = {users[0].id: cohort1.id, users[1].id: cohort1.id, users[2].id: cohort2.id}
+
+        # The memberships are looked up (and cached) in one query, and the cohorts in another
+        with self.assertNumQueries(3):
+            self.assertEqual(
+                {user_id: cohort.id for user_id, cohort in cohorts.get_cohorts_for_users(course.id, user_ids).items()},
+                expected_cohort_ids
+            )
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                {user_id: cohort.id for user_id, cohort in cohorts.get_cohorts_for_users(course.id, user_ids).items()},
+                expected_cohort_ids
+            )
+        self.assertFalse(CohortMembership.objects.filter(user=users[3]).exists())
+
+    def test_get_cohorts_for_users_after_membership_changes(self):
+        """
+        Make sure the cached cohorts of users are updated when users are added
+        to and removed from cohorts.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        config_course_cohorts(course, is_cohorted=True)
+        user = UserFactory(username="test", email="a@b.com")
+        cohort1 = CohortFactory(course_id=course.id, name="TestCohort1", users=[user])
+        cohort2 = CohortFactory(course_id=course.id, name="TestCohort2")
+
+        self.assertEqual(cohorts.get_cohort(user, course.id, assign=False), cohort1)
+
+        cohorts.add_user_to_cohort(cohort2, user.username)
+        self.assertEqual(cohorts.get_cohorts_for_users(course.id, [user.id]), {user.id: cohort2})
+        self.assertEqual(cohorts.get_cohort(user, course.id, assign=False), cohort2)
+
+        cohorts.remove_user_from_cohort(cohort2, user.username)
+        self.assertEqual(cohorts.get_cohorts_for_users(course.id, [user.id]), {})
+        self.assertIsNone(cohorts.get_cohort(user, course.id, assign=False))
+
+        cohort2.name = "RenamedCohort"
+        cohort2.save()
+        cohorts.add_user_to_cohort(cohort2, user.username)
+        self.assertEqual(cohorts.get_cohorts_for_users(course.id, [user.id])[user.id].name, "RenamedCohort")
+
+    def test_get_cohort_corrects_stale_membership(self):
+        """
+        Make sure that when cohorts.get_cohort() finds that a user has a cohort
+        which their cached membership is missing, the cached membership is
+        corrected.
+        """
+        course = modulestore().get_course(self.toy_course_key)
+        config_course_cohorts(course, is_cohorted=True)
+        user = UserFactory(username="test", email="a@b.com")
+        cohort = CohortFactory(course_id=course.id, name="TestCohort", users=[user])
+        # pylint: disable=protected-access
+        cohorts._cache_memberships(course.id, {user.id: cohorts._NO_COHORT})
+        self.assertIsNone(cohorts.get_cohort(user, course.id, assign=False))
+
+        self.assertEqual(cohorts.get_cohort(user, course.id), cohort)
+        self.assertEqual(cohorts.get_cohort(user, course.id, assign=False), cohort)
+        self.assertEqual(cohorts.get_cohorts_for_users(course.id, [user.id]), {user.id: cohort})
+
     def test_get_cohort_with_assign(self):
         """
         Make sure cohorts.get_cohort() returns None if no group is already
@@ -20,6 +20,9 @@ from openedx.core.djangoapps.credit.models import (
 
 log = logging.getLogger(__name__)
 
+# The number of users whose credit eligibility is evaluated at a time by update_credit_eligibility
+ELIGIBILITY_UPDATE_CHUNK_SIZE = 500
+
 
 def is_credit_course(course_key):
     """
@@ -284,6 +287,53 @@ def set_credit_requirement_status(username, course_key, req_namespace, req_name,
                 log.error("Error sending email")
 
 
+def update_credit_eligibility(course_key, usernames, chunk_size=ELIGIBILITY_UPDATE_CHUNK_SIZE):
+    """
+    Update the credit eligibility of many users in a course at once.
+
+    This is for evaluating every learner in a course (for instance, at the
+    end of the course); the eligibility of a single user is updated whenever
+    their requirement statuses are set.  The course's requirements are
+    loaded once, and the users are evaluated `chunk_size` at a time, with a
+    query for the statuses of each chunk.  Users who become eligible are sent
+    notifications, as they are when their requirement statuses are set.
+
+    Args:
+        course_key (CourseKey): Identifier for the course.
+        usernames (list): Usernames of the users to update.
+
+    Keyword Arguments:
+        chunk_size (int): The number of users evaluated at a time.
+
+    Raises:
+        InvalidCreditCourse: The course is not a credit course.
+
+    Returns:
+        list: The usernames of the users who have become eligible.
+
+    """
+    try:
+        credit_course = CreditCourse.get_credit_course(course_key=course_key)
+    except CreditCourse.DoesNotExist:
+        raise InvalidCreditCourse()
+
+    requirements = list(CreditRequirement.get_course_requirements(course_key))
+    usernames = list(usernames)
+    newly_eligible_usernames = []
+    for index in xrange(0, len(usernames), chunk_size):
+        eligible_usernames = CreditEligibility.bulk_update_eligibility(
+            requirements, usernames[index:index + chunk_size], credit_course
+        )
+        for username in sorted(eligible_usernames):
+            try:
+                send_credit_notifications(username, course_key)
+            except Exception:  # pylint: disable=broad-except
+                log.error("Error sending email")
+        newly_eligible_usernames.extend(sorted(eligible_usernames))
+
+    return newly_eligible_usernames
+
+
 # pylint: disable=invalid-name
 def remove_credit_requirement_status(username, course_key, req_namespace, req_name):
     """
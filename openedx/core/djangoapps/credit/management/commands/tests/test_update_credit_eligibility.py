@@ -0,0 +1,48 @@
+"""
+Tests for the update_credit_eligibility management command.
+"""
+import ddt
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from mock import call, patch
+
+COMMAND_MODULE = 'openedx.core.djangoapps.credit.management.commands.update_credit_eligibility'
+COURSE_ID = 'course-v1:edX+DemoX+Demo_Course'
+
+
+@ddt.ddt
+@patch(COMMAND_MODULE + '.update_credit_course_eligibility')
+class UpdateCreditEligibilityTest(TestCase):
+    """
+    Tests for the update_credit_eligibility management command.
+    """
+
+    def test_update(self, mock_task):
+        call_command('update_credit_eligibility', COURSE_ID)
+        mock_task.assert_called_once_with(COURSE_ID, 0, 1)
+        self.assertFalse(mock_task.delay.called)
+
+    @ddt.data(
+        ([], [call(COURSE_ID, 0, 3), call(COURSE_ID, 1, 3), call(COURSE_ID, 2, 3)]),
+        (['--shard-index', '1'], [call(COURSE_ID, 1, 3)]),
+    )
+    @ddt.unpack
+    def test_update_shards(self, extra_args, expected_calls, mock_task):
+        call_command('update_credit_eligibility', COURSE_ID, '--shard-count', '3', *extra_args)
+        self.assertEqual(mock_task.call_args_list, expected_calls)
+
+        mock_task.reset_mock()
+        call_command('update_credit_eligibility', COURSE_ID, '--shard-count', '3', '--async', *extra_args)
+        self.assertEqual(mock_task.delay.call_args_list, expected_calls)
+        self.assertFalse(mock_task.called)
+
+    @ddt.data(
+        ['not a course id'],
+        [COURSE_ID, '--shard-count', '0'],
+        [COURSE_ID, '--shard-count', '2', '--shard-index', '2'],
+    )
+    def test_invalid_arguments(self, args, mock_task):
+        with self.assertRaises(CommandError):
+            call_command('update_credit_eligibility', *args)
+        self.assertFalse(mock_task.called)
@@ -0,0 +1,67 @@
+"""
+Updates the credit eligibility of every learner enrolled in a credit course
+(for instance, once the course has ended).
+"""
+from django.core.management.base import BaseCommand, CommandError
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+from openedx.core.djangoapps.credit.tasks import update_credit_course_eligibility
+
+
+class Command(BaseCommand):
+    """
+    Update the credit eligibility of the learners enrolled in a course.
+    """
+    help = """
+    Updates the credit eligibility of the learners enrolled in a course.
+    The learners can be split into shards (by user id) with --shard-count,
+    to be updated by separate runs (with --shard-index) or by separate
+    celery tasks (with --async, which queues a task for each shard, or just
+    for the shard given by --shard-index).
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('course_id')
+        parser.add_argument(
+            '--shard-count',
+            type=int,
+            default=1,
+            help='The number of shards to split the learners into',
+        )
+        parser.add_argument(
+            '--shard-index',
+            type=int,
+            default=None,
+            help='The shard of learners to update (by default, all of them)',
+        )
+        parser.add_argument(
+            '--async',
+            action='store_true',
+            dest='async',
+            default=False,
+            help='Queue celery tasks to update the shards, rather than updating them in this process',
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command"""
+        try:
+            CourseKey.from_string(options['course_id'])
+        except InvalidKeyError:
+            raise CommandError(u"Invalid course id: {}".format(options['course_id']))
+
+        shard_count = options['shard_count']
+        if shard_count < 1:
+            raise CommandError("--shard-count must be at least 1")
+        if options['shard_index'] is None:
+            shard_indexes = range(shard_count)
+        elif 0 <= options['shard_index'] < shard_count:
+            shard_indexes = [options['shard_index']]
+        else:
+            raise CommandError("--shard-index must be at least 0, and less than --shard-count")
+
+        for shard_index in shard_indexes:
+            if options['async']:
+                update_credit_course_eligibility.delay(options['course_id'], shard_index, shard_count)
+            else:
+                update_credit_course_eligibility(options['course_id'], shard_index, shard_count)
@@ -555,6 +555,66 @@ class CreditEligibility(TimeStampedModel):
         else:
             return is_eligible, False
 
+    @classmethod
+    def bulk_update_eligibility(cls, requirements, usernames, credit_course):
+        """
+        Update the credit eligibility for a course of many users at once.
+
+        As in `update_eligibility`, a user is eligible for credit when the
+        user has satisfied all requirements for credit in the course.  The
+        users' statuses are fetched in a single query, and the users who
+        have become eligible are recorded with a single insert.
+
+        Arguments:
+            requirements (list): The course's `CreditRequirement`s.  If
+                the course has no requirements, no one becomes eligible.
+            usernames (list): Identifiers of the users being updated.
+            credit_course (CreditCourse): The course.
+
+        Returns:
+            set: The usernames of the users who have become eligible.
+        """
+        requirement_ids = set(requirement.id for requirement in requirements)
+        if not requirement_ids or not usernames:
+            return set()
+
+        satisfied_requirement_ids = defaultdict(set)
+        satisfied_statuses = CreditRequirementStatus.objects.filter(
+            requirement__in=requirement_ids,
+            username__in=usernames,
+            status="satisfied",
+        ).values_list('username', 'requirement_id')
+        for username, requirement_id in satisfied_statuses:
+            satisfied_requirement_ids[username].add(requirement_id)
+
+        eligible_usernames = set(
+            username
+            for username, user_requirement_ids in satisfied_requirement_ids.iteritems()
+            if user_requirement_ids >= requirement_ids
+        )
+        if not eligible_usernames:
+            return set()
+
+        eligible_usernames -= set(
+            cls.objects.filter(course=credit_course, username__in=eligible_usernames).values_list('username', flat=True)
+        )
+        try:
+            with transaction.atomic():
+                cls.objects.bulk_create([
+                    cls(username=username, course=credit_course) for username in sorted(eligible_usernames)
+                ])
+        except IntegrityError:
+            # Some of the users have become eligible in the meantime (as their
+            # statuses were updated), so record the others one by one.
+            for username in list(eligible_usernames):
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(username=username, course=credit_course)
+                except IntegrityError:
+                    eligible_usernames.discard(username)
+
+        return eligible_usernames
+
     @classmethod
     def get_user_eligibilities(cls, username):
         """
@@ -8,10 +8,11 @@ from django.conf import settings
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey, UsageKey
 
-from openedx.core.djangoapps.credit.api import set_credit_requirements
+from openedx.core.djangoapps.credit.api import set_credit_requirements, update_credit_eligibility
 from openedx.core.djangoapps.credit.exceptions import InvalidCreditRequirements
 from openedx.core.djangoapps.credit.models import CreditCourse
 from openedx.core.djangoapps.credit.utils import get_course_blocks
+from student.models import CourseEnrollment
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.exceptions import ItemNotFoundError
 
@@ -50,6 +51,44 @@ def update_credit_course_requirements(course_id):   # pylint: disable=invalid-na
         LOGGER.info('Requirements added for course %s', course_id)
 
 
+# pylint: disable=not-callable
+@task()
+def update_credit_course_eligibility(course_id, shard_index=0, shard_count=1):
+    """
+    Updates the credit eligibility of the learners enrolled in a course.
+
+    The learners can be split into `shard_count` shards (by user id), to be
+    updated by separate tasks, in which case only the learners in shard
+    `shard_index` are updated.
+
+    Args:
+        course_id(str): A string representation of course identifier
+        shard_index(int): The shard of learners to update
+        shard_count(int): The number of shards the learners are split into
+
+    Returns:
+        None
+
+    """
+    course_key = CourseKey.from_string(course_id)
+    if not CreditCourse.is_credit_course(course_key):
+        LOGGER.info('Not updating credit eligibility for course %s, as it is not a credit course', course_id)
+        return
+
+    usernames = [
+        username
+        for user_id, username in CourseEnrollment.objects.filter(
+            course_id=course_key, is_active=True
+        ).values_list('user_id', 'user__username')
+        if user_id % shard_count == shard_index
+    ]
+    eligible_usernames = update_credit_eligibility(course_key, usernames)
+    LOGGER.info(
+        'Credit eligibility updated for %d learners in course %s (shard %d of %d); %d became eligible',
+        len(usernames), course_id, shard_index, shard_count, len(eligible_usernames)
+    )
+
+
 def _get_course_credit_requirements(course_key):
     """
     Returns the list of credit requirements for the given course.
@@ -392,6 +392,57 @@ class CreditRequirementApiTests(CreditApiTestBase):
         req_status = api.get_credit_requirement_status(self.course_key, "bob", namespace="grade", name="grade")
         self.assertEqual(len(req_status), 0)
 
+    def test_update_credit_eligibility(self):
+        self.add_credit_course()
+        requirements = [
+            {
+                "namespace": "grade",
+                "name": "grade",
+                "display_name": "Grade",
+                "criteria": {
+                    "min_grade": 0.8
+                },
+            },
+            {
+                "namespace": "reverification",
+                "name": "i4x://edX/DemoX/edx-reverification-block/assessment_uuid",
+                "display_name": "Assessment 1",
+                "criteria": {},
+            }
+        ]
+        api.set_credit_requirements(self.course_key, requirements)
+        grade_req, reverification_req = CreditRequirement.get_course_requirements(self.course_key)
+
+        # Record the statuses directly, so that the users' eligibility isn't updated one by one
+        statuses = {
+            "alice": ("satisfied", "satisfied"),
+            "bob": ("satisfied", "satisfied"),
+            "carol": ("satisfied", "failed"),
+            "dave": ("satisfied", None),
+            "erin": ("satisfied", "satisfied"),
+        }
+        for username, (grade_status, reverification_status) in statuses.items():
+            for requirement, status in ((grade_req, grade_status), (reverification_req, reverification_status)):
+                if status is not None:
+                    CreditRequirementStatus.objects.create(username=username, requirement=requirement, status=status)
+        CreditEligibility.objects.create(username="erin", course=grade_req.course)
+
+        eligible_usernames = api.update_credit_eligibility(
+            self.course_key, ["alice", "bob", "carol", "dave", "erin", "frank"], chunk_size=2
+        )
+        self.assertEqual(eligible_usernames, ["alice", "bob"])
+        for username in ("alice", "bob", "erin"):
+            self.assertTrue(api.is_user_eligible_for_credit(username, self.course_key))
+        for username in ("carol", "dave", "frank"):
+            self.assertFalse(api.is_user_eligible_for_credit(username, self.course_key))
+
+        # Updating the eligibility again doesn't change anything
+        self.assertEqual(api.update_credit_eligibility(self.course_key, ["alice", "bob", "carol"]), [])
+
+    def test_update_credit_eligibility_not_credit_course(self):
+        with self.assertRaises(InvalidCreditCourse):
+            api.update_credit_eligibility(self.course_key, ["alice"])
+
     def test_satisfy_all_requirements(self):
         """ Test the credit requirements, eligibility notification, email
         content caching for a credit course.
@@ -397,6 +397,47 @@ class BlockStructureBlockData(BlockStructure):
         else:
             return block_data.transformer_data.get(transformer.name(), default)
 
+    def get_block_field_values(self, columns, usage_keys=None):
+        """
+        Returns the values of the given columns for each of the given
+        blocks, in a single pass over their collected data.
+
+        Arguments:
+            columns (list of (BlockStructureTransformer, string)) - The
+                values to return for each block.  A column whose
+                transformer is None is the block's xBlock field named by
+                the string.  Otherwise, it's the transformer's data for
+                the block under the string, or the transformer's entire
+                data dict for the block if the string is None.
+
+            usage_keys (iterable of UsageKey) - The blocks whose values
+                are requested.  Defaults to all of the blocks in the
+                block structure, in topological order.
+
+        Returns:
+            iterator((UsageKey, list)) - An iterator of the usage key of
+            each block along with the list of its columns' values (None
+            for the values not found).
+        """
+        getters = []
+        for transformer, key in columns:
+            if transformer is None:
+                getters.append(lambda block_data, key=key: block_data.xblock_fields.get(key))
+            elif key is None:
+                getters.append(
+                    lambda block_data, name=transformer.name(): block_data.transformer_data.get(name, {})
+                )
+            else:
+                getters.append(
+                    lambda block_data, name=transformer.name(), key=key:
+                    block_data.transformer_data.get(name, {}).get(key)
+                )
+
+        empty_block_data = _BlockData()
+        for usage_key in (self if usage_keys is None else usage_keys):
+            block_data = self._block_data_map.get(usage_key, empty_block_data)
+            yield usage_key, [getter(block_data) for getter in getters]
+
     def remove_transformer_block_field(self, usage_key, transformer, key):
         """
         Deletes the given transformer's entire data dict for the
@@ -114,6 +114,29 @@ class TestBlockStructureData(TestCase, ChildrenMapTestMixin):
                         val,
                     )
 
+    def test_get_block_field_values(self):
+        transformer = MockTransformer
+        block_structure = BlockStructureModulestoreData(root_block_usage_key=0)
+        block_structure._add_relation(0, 1)
+        block_structure._add_xblock(0, MockXBlock(0, {"field1": "0.val1"}))
+        block_structure._add_xblock(1, MockXBlock(1, {"field1": "1.val1", "field2": "1.val2"}))
+        block_structure.request_xblock_fields("field1", "field2")
+        block_structure._collect_requested_xblock_fields()
+        block_structure.set_transformer_block_field(1, transformer, "key", "1.key")
+
+        columns = [(None, "field1"), (None, "field2"), (transformer, "key"), (transformer, None)]
+        self.assertEquals(
+            list(block_structure.get_block_field_values(columns)),
+            [
+                (0, ["0.val1", None, None, {}]),
+                (1, ["1.val1", "1.val2", "1.key", {"key": "1.key"}]),
+            ]
+        )
+        self.assertEquals(
+            list(block_structure.get_block_field_values([(None, "field1")], usage_keys=[1, 2])),
+            [(1, ["1.val1"]), (2, [None])]
+        )
+
     def test_xblock_data(self):
         # block test cases
         blocks = [
@@ -184,6 +184,25 @@ def replace_static_urls(data_dir, block, view, frag, context, course_id=None, st
     ))
 
 
+def replace_urls(
+        course_id, block, view, frag, context,  # pylint: disable=unused-argument
+        data_dir=None, static_asset_path='', jump_to_id_base_url=None
+):
+    """
+    Does the work of replace_static_urls, replace_course_urls and
+    replace_jump_to_id_urls (if `jump_to_id_base_url` is given) in a single
+    pass over the fragment's content.
+    """
+    rewriter = static_replace.get_url_rewriter(
+        data_directory=data_dir,
+        course_id=course_id,
+        static_asset_path=static_asset_path,
+        course_urls=True,
+        jump_to_id_base_url=jump_to_id_base_url,
+    )
+    return wrap_fragment(frag, rewriter.rewrite(frag.content))
+
+
 def grade_histogram(module_id):
     '''
     Print out a histogram of grades on a given problem in staff member debug info.
@@ -56,6 +56,8 @@ setup(
             "visibility = lms.djangoapps.course_blocks.transformers.visibility:VisibilityTransformer",
             "course_blocks_api = lms.djangoapps.course_api.blocks.transformers.blocks_api:BlocksAPITransformer",
             "proctored_exam = lms.djangoapps.course_api.blocks.transformers.proctored_exam:ProctoredExamTransformer",
+            "mobile_video_summary = lms.djangoapps.mobile_api.video_outlines.transformers:VideoSummaryTransformer",
+            "class_dashboard_outline = lms.djangoapps.class_dashboard.transformers:ClassDashboardOutlineTransformer",
         ],
     }
 )